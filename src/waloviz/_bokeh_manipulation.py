@@ -8,16 +8,281 @@ Here there are all sorts of Bokeh related manipulations, but most dominantly cus
   learn :)
 """
 
-from typing import Any, Dict, List, Optional
+import struct
+import zlib
+from base64 import b64encode
+from importlib import resources
+from typing import Any, Dict, List, Optional, Tuple
 
 import bokeh
 import bokeh.model
+import numpy as np
+from bokeh.colors import named
+from bokeh.models import (
+    ColumnDataSource,
+    GlyphRenderer,
+    Image,
+    ImageURL,
+    LinearColorMapper,
+    LogColorMapper,
+)
 from bokeh.models.callbacks import CustomJS
 from bokeh.models.formatters import CustomJSTickFormatter
 from bokeh.themes import built_in_themes
 
 themes: Dict[str, Dict[str, Any]] = {k: v._json for k, v in built_in_themes.items()}
 
+# The ways the spectrogram image is sent to the browser, see ``rasterize_spectrogram`` ,
+# ``quantize_spectrogram`` and ``add_browser_spectrogram``
+RASTER_MODES = ["image", "png", "uint8", "uint16", "browser"]
+
+# The dtypes of the quantized spectrogram images, by their raster mode
+QUANTIZED_RASTER_DTYPES = {"uint8": np.uint8, "uint16": np.uint16}
+
+# The maximal amount of colors in the palette of an indexed color PNG
+PNG_PALETTE_SIZE = 256
+
+# The actions of the player callback, as ``(actions, events, on_spectrograms, on_pbar)`` ,
+# each event runs the actions of all the matching entries in order
+PLAYER_EVENT_ACTIONS = [
+    (["start_follow", "move_time"], ["doubletap"], True, True),
+    (["reset"], ["reset"], True, True),
+    (
+        ["set_y_range", "set_pbar_x_range"],
+        [
+            "panstart",
+            "panend",
+            "pinchstart",
+            "pinchend",
+            "wheel",
+            "press",
+            "pressup",
+            "tap",
+            "doubletap",
+        ],
+        True,
+        True,
+    ),
+    (
+        ["keep_y_range", "keep_dump_range", "keep_x_range"],
+        [
+            "panstart",
+            "pan",
+            "pinchstart",
+            "pinch",
+            "panend",
+            "wheel",
+            "press",
+            "pressup",
+            "rangesupdate",
+        ],
+        True,
+        True,
+    ),
+    (["stop_follow"], ["pan", "pinch", "rangesupdate", "wheel"], True, True),
+    (["play_pause"], ["tap", "pressup", "doubletap"], True, False),
+    (
+        ["move_pbar", "stop_follow"],
+        [
+            "pinch",
+            "pinchstart",
+            "pinchend",
+            "pan",
+            "panstart",
+            "panend",
+            "press",
+            "pressup",
+            "tap",
+        ],
+        False,
+        True,
+    ),
+    (
+        ["record_ranges"],
+        [
+            "pinch",
+            "pinchstart",
+            "pinchend",
+            "panstart",
+            "pan",
+            "panend",
+            "wheel",
+            "press",
+            "pressup",
+            "rangesupdate",
+        ],
+        True,
+        True,
+    ),
+]
+
+# The player callback, shared by all the plots, dispatches each event to its actions,
+# see ``get_player_callback``
+PLAYER_CALLBACK_JS = """
+const plot = cb_obj.origin;
+const plot_0 = plots[0];
+const pbar = plots[plots.length - 1];
+const vspan_0 = vspans[0];
+const pause_0 = glyphs[0];
+const has_dump = '_dump' in plot.extra_y_ranges;
+
+function fix_y_range() {
+    if (has_dump) {
+        plot.y_range.start = plot_0.hz_fixed_range.start;
+        plot.y_range.end = plot_0.hz_fixed_range.end;
+        if ('extra_fixed_ranges' in plot_0) {
+            for (const key in plot_0.extra_y_ranges) {
+                if ((key != '_dump') && (key in plot_0.extra_fixed_ranges) && ('start' in plot_0.extra_fixed_ranges[key])) {
+                    plot.extra_y_ranges[key].start = plot_0.extra_fixed_ranges[key].start;
+                    plot.extra_y_ranges[key].end = plot_0.extra_fixed_ranges[key].end;
+                }
+            }
+        }
+    }
+}
+
+// The handlers by name, the same handlers are shared by all plots and events
+const handlers = {
+    record_ranges() {
+        plot_0.prev_x_range = {start: plot_0.x_range.start, end: plot_0.x_range.end};
+        plot_0.prev_y_range = {start: plot_0.y_range.start, end: plot_0.y_range.end};
+        plot_0.prev_extra_y_ranges = {};
+        for (const key in plot_0.extra_y_ranges) {
+            if (key != '_dump') {
+                plot_0.prev_extra_y_ranges[key] = {start: plot_0.extra_y_ranges[key].start, end: plot_0.extra_y_ranges[key].end};
+            }
+        }
+    },
+    start_follow() {
+        vspan_0.is_following = true;
+        vspan_0.line_color = follow_color;
+        let x = Math.max(Math.min(cb_obj.x, plot_0.x_range.reset_end), plot_0.x_range.reset_start);
+        vspan_0.ratio = (x-plot_0.x_range.start)/(plot_0.x_range.end-plot_0.x_range.start);
+    },
+    stop_follow() {
+        vspan_0.is_following = false;
+        vspan_0.line_color = stay_color;
+    },
+    set_y_range() {
+        let mouse_in = ('x' in cb_obj) && (cb_obj.x > plot.x_range.start) && (cb_obj.x < plot.x_range.end);
+        if (('is_y_fixed' in plot_0) && (plot_0.is_y_fixed)) {
+            if (mouse_in) {
+                fix_y_range();
+            } else {
+                plot_0.is_y_fixed = false;
+            }
+        } else if (mouse_in) {
+            plot_0.is_y_fixed = true;
+            if ('prev_y_range' in plot_0) {
+                plot_0.hz_fixed_range = plot_0.prev_y_range;
+                plot_0.extra_fixed_ranges = plot_0.prev_extra_y_ranges;
+            } else {
+                plot_0.hz_fixed_range = {
+                    start: plot_0.y_range.reset_start,
+                    end: plot_0.y_range.reset_end
+                };
+                if (Object.keys(plot.extra_y_ranges).length > 0) {
+                    plot_0.extra_fixed_ranges = {};
+                    for (const key in plot_0.extra_y_ranges) {
+                        if ((key != '_dump') && (plot_0.extra_y_ranges[key].reset_start != null)) {
+                            plot_0.extra_fixed_ranges[key] = {
+                                start: plot_0.extra_y_ranges[key].reset_start,
+                                end: plot_0.extra_y_ranges[key].reset_end
+                            };
+                        }
+                    }
+                }
+            }
+        }
+    },
+    keep_y_range() {
+        if (('is_y_fixed' in plot_0) && (plot_0.is_y_fixed)) {
+            fix_y_range();
+        }
+    },
+    set_pbar_x_range() {
+        let mouse_in = ('y' in cb_obj) && (cb_obj.y > pbar.y_range.start) && (cb_obj.y < pbar.y_range.end);
+        if (('is_x_fixed' in plot_0) && (plot_0.is_x_fixed)) {
+            if (mouse_in) {
+                plot.x_range.start = plot_0.x_fixed_range.start;
+                plot.x_range.end = plot_0.x_fixed_range.end;
+            } else {
+                plot_0.is_x_fixed = false;
+            }
+        } else if (mouse_in) {
+            plot_0.is_x_fixed = true;
+            if ('prev_x_range' in plot_0) {
+                plot_0.x_fixed_range = plot_0.prev_x_range;
+            } else {
+                plot_0.x_fixed_range = {start: plot_0.x_range.reset_start, end: plot_0.x_range.reset_end};
+            }
+        }
+    },
+    keep_x_range() {
+        if (('is_x_fixed' in plot_0) && (plot_0.is_x_fixed)) {
+            plot.x_range.start = plot_0.x_fixed_range.start;
+            plot.x_range.end = plot_0.x_fixed_range.end;
+        }
+    },
+    keep_dump_range() {
+        if (has_dump) {
+            plot.extra_y_ranges['_dump'].start = 0;
+            plot.extra_y_ranges['_dump'].end = 1;
+        } else {
+            plot.y_range.start = 0;
+            plot.y_range.end = 1;
+        }
+    },
+    play_pause() {
+        if ((cb_obj.x > plot_0.x_range.start) && (cb_obj.x < plot_0.x_range.end)) {
+            pause_0.visible = !pause_0.visible;
+        }
+    },
+    reset() {
+        if (('is_y_fixed' in plot_0) && (plot_0.is_y_fixed)) {
+            plot_0.is_y_fixed = false;
+            plot.y_range.start = plot.y_range.reset_start;
+            plot.y_range.end = plot.y_range.reset_end;
+            for (const key in plot.extra_y_ranges) {
+                if ((key != '_dump') && (plot.extra_y_ranges[key].reset_start != null)) {
+                    plot.extra_y_ranges[key].start = plot.extra_y_ranges[key].reset_start;
+                    plot.extra_y_ranges[key].end = plot.extra_y_ranges[key].reset_end;
+                }
+            }
+        }
+        if (('is_x_fixed' in plot_0) && (plot_0.is_x_fixed)) {
+            plot_0.is_x_fixed = false;
+            plot.x_range.start = plot.x_range.reset_start;
+            plot.x_range.end = plot.x_range.reset_end;
+        }
+    },
+    move_time() {
+        vspan_0.right = Math.max(Math.min(cb_obj.x, plot_0.x_range.reset_end), plot_0.x_range.reset_start);
+    },
+    move_pbar() {
+        if (('is_x_fixed' in plot_0) && (plot_0.is_x_fixed)) {
+            vspan_0.right = Math.max(Math.min(cb_obj.x, plot_0.x_range.reset_end), plot_0.x_range.reset_start);
+        }
+    },
+};
+
+// Each event runs the handlers of its kind of plot, in order
+const actions = (plot === pbar) ? pbar_actions : spectrogram_actions;
+for (const action of actions[cb_obj.event_name] ?? []) {
+    handlers[action]();
+}
+"""
+
+
+# A Web Worker which computes the spectrogram of the decoded audio in the browser, the
+# same frames, frequency bins and scaling as ``compute_spectrogram`` and ``get_player_hv`` ,
+# packaged as ``spectrogram_worker.js``
+SPECTROGRAM_WORKER_JS = (
+    resources.files("waloviz")
+    .joinpath("spectrogram_worker.js")
+    .read_text(encoding="utf-8")
+)
+
 
 def apply_theme(
     plot: bokeh.model.Model,
@@ -53,6 +318,10 @@ def finalize_player_bokeh_gui(
     aspect_ratio: Optional[float],
     sizing_mode: Optional[str],
     single_min_height: int,
+    freq_scale: str = "linear",
+    time_offset: float = 0.0,
+    raster: str = "image",
+    spectrogram_tiles: Optional[List[List[List[Tuple[float, float, Any]]]]] = None,
 ) -> bokeh.model.Model:
     """
     | Modify bokeh settings and adds custom jslink interactivity.
@@ -73,6 +342,17 @@ def finalize_player_bokeh_gui(
 
     ``single_min_height`` : int
 
+    ``freq_scale`` : str
+        The scale of the frequency axis, one of "linear", "log" or "mel"
+    ``time_offset`` : float
+        The absolute time of the beginning of the audio, added to the time labels
+    ``raster`` : str
+        How the spectrogram images are sent to the browser, one of ``RASTER_MODES`` ,
+        see :ref:`rasterize_spectrogram <waloviz._bokeh_manipulation.rasterize_spectrogram>`
+        and :ref:`quantize_spectrogram <waloviz._bokeh_manipulation.quantize_spectrogram>`
+    ``spectrogram_tiles`` : List[List[List[Tuple[float, float, Any]]]]
+        The finer spectrogram tiles of each channel and level, displayed according
+        to the zoom, see :ref:`add_spectrogram_tiles <waloviz._bokeh_manipulation.add_spectrogram_tiles>`
 
     Returns
     -------
@@ -99,6 +379,10 @@ def finalize_player_bokeh_gui(
         vlines,
         vspans,
         glyphs,
+        freq_scale,
+        time_offset,
+        raster,
+        spectrogram_tiles,
     )
 
     player_bokeh = add_interactivity_with_jslinks(
@@ -120,6 +404,10 @@ def add_interactivity_with_jslinks(
     """
     | Adds custom jslink interactivity.
 
+    | A single player callback handles the events of all the plots, see
+      :ref:`get_player_callback <waloviz._bokeh_manipulation.get_player_callback>` ,
+      so the document holds the same few callbacks for any amount of channels.
+
     Parameters
     ----------
     ``player_bokeh`` : bokeh.model.Model
@@ -144,102 +432,27 @@ def add_interactivity_with_jslinks(
 
     |
     """
-    children = player_bokeh.children
-
-    for channel, (plot, vline, vspan, glyph) in enumerate(
-        zip(plots, vlines, vspans, glyphs)
-    ):
-        is_pbar = channel == len(children) - 1
-        is_spec = not is_pbar
-
-        if is_spec:
-            glyphs[0].js_link("visible", glyph, "visible")
-
-        vspans[0].js_link("right", glyph.glyph, "x")
-        vspans[0].js_link("right", vline, "location")
-        vspans[0].js_link("right", vspan, "right")
-        vspans[0].js_link("line_color", vline, "line_color")
-        vspans[0].js_on_change("right", get_follow_callback(plot, vspan))
-        vspans[0].js_on_change("line_color", get_follow_callback(plot, vspan))
-
-        plot.js_on_event(
-            "doubletap",
-            get_start_follow_callback(follow_color, vspans, plots),
-            get_move_time_callback(vspans, plots),
+    for attr in ["right", "line_color"]:
+        vspans[0].js_on_change(
+            attr, get_cursor_callback(attr, plots, vlines, vspans, glyphs)
         )
-        plot.js_on_event("reset", get_reset_callback(plot, plots))
-
-        for e in [
-            "panstart",
-            "panend",
-            "pinchstart",
-            "pinchend",
-            "wheel",
-            "press",
-            "pressup",
-            "tap",
-            "doubletap",
-        ]:
-            plot.js_on_event(
-                e,
-                get_set_y_range_callback(plot, plots),
-                get_set_pbar_x_range_callback(plot, plots),
-            )
-        for e in [
-            "panstart",
-            "pan",
-            "pinchstart",
-            "pinch",
-            "panend",
-            "wheel",
-            "press",
-            "pressup",
-            "rangesupdate",
-        ]:
-            plot.js_on_event(
-                e,
-                get_keep_y_range_callback(plot, plots),
-                get_keep_dump_range_callback(plot),
-                get_keep_x_range_callback(plot, plots),
-            )
-        for e in ["pan", "pinch", "rangesupdate", "wheel"]:
-            plot.js_on_event(e, get_stop_follow_callback(stay_color, vspans))
-
-        if is_spec:
-            for e in ["tap", "pressup", "doubletap"]:
-                plot.js_on_event(e, get_play_pause_callback(plots, glyphs))
-
-        if is_pbar:
-            for e in [
-                "pinch",
-                "pinchstart",
-                "pinchend",
-                "pan",
-                "panstart",
-                "panend",
-                "press",
-                "pressup",
-                "tap",
-            ]:
-                plot.js_on_event(
-                    e,
-                    get_move_pbar_callback(vspans, plots),
-                    get_stop_follow_callback(stay_color, vspans),
-                )
+    glyphs[0].js_on_change("visible", get_play_icons_callback(glyphs))
 
-        for e in [
-            "pinch",
-            "pinchstart",
-            "pinchend",
-            "panstart",
-            "pan",
-            "panend",
-            "wheel",
-            "press",
-            "pressup",
-            "rangesupdate",
-        ]:
-            plot.js_on_event(e, get_record_ranges_callback(plots))
+    spectrogram_actions = get_player_event_actions(is_pbar=False)
+    pbar_actions = get_player_event_actions(is_pbar=True)
+    player_callback = get_player_callback(
+        stay_color,
+        follow_color,
+        plots,
+        vspans,
+        glyphs,
+        spectrogram_actions,
+        pbar_actions,
+    )
+    for plot in plots:
+        actions = pbar_actions if plot is plots[-1] else spectrogram_actions
+        for e in actions:
+            plot.js_on_event(e, player_callback)
     return player_bokeh
 
 
@@ -254,6 +467,10 @@ def modify_bokeh_elements(
     vlines: List[bokeh.model.Model],
     vspans: List[bokeh.model.Model],
     glyphs: List[bokeh.model.Model],
+    freq_scale: str = "linear",
+    time_offset: float = 0.0,
+    raster: str = "image",
+    spectrogram_tiles: Optional[List[List[List[Tuple[float, float, Any]]]]] = None,
 ) -> bokeh.model.Model:
     """
     | Adds custom jslink interactivity.
@@ -280,6 +497,16 @@ def modify_bokeh_elements(
         Bokeh elements that brighten the section played so far
     ``glyphs`` : List[bokeh.model.Model]
         Bokeh elements for play icons and the progress bar circular handle
+    ``freq_scale`` : str
+        The scale of the frequency axis, one of "linear", "log" or "mel"
+    ``time_offset`` : float
+        The absolute time of the beginning of the audio, added to the time labels
+    ``raster`` : str
+        One of ``RASTER_MODES`` , see :ref:`rasterize_spectrogram <waloviz._bokeh_manipulation.rasterize_spectrogram>`
+        and :ref:`quantize_spectrogram <waloviz._bokeh_manipulation.quantize_spectrogram>`
+    ``spectrogram_tiles`` : List[List[List[Tuple[float, float, Any]]]]
+        The finer spectrogram tiles of each channel and level, see
+        :ref:`add_spectrogram_tiles <waloviz._bokeh_manipulation.add_spectrogram_tiles>`
 
     Returns
     -------
@@ -300,7 +527,7 @@ def modify_bokeh_elements(
         glyph = plot.renderers[-1]
 
         if is_pbar:
-            plot.xaxis.formatter = get_audio_xformatter(total_seconds)
+            plot.xaxis.formatter = get_audio_xformatter(total_seconds, time_offset)
 
             theme_elements_mapping = dict(Grid="xgrid")
         else:
@@ -316,6 +543,26 @@ def modify_bokeh_elements(
             glyph.glyph.angle = -90
             glyph.glyph.angle_units = "deg"
 
+            color_mapper = plot.renderers[0].glyph.color_mapper
+            if raster == "png":
+                rasterize_spectrogram(plot.renderers[0])
+            elif raster in QUANTIZED_RASTER_DTYPES:
+                quantize_spectrogram(plot.renderers[0], QUANTIZED_RASTER_DTYPES[raster])
+
+            if spectrogram_tiles and spectrogram_tiles[channel]:
+                add_spectrogram_tiles(
+                    plot,
+                    spectrogram_tiles[channel],
+                    color_mapper,
+                    raster,
+                    total_seconds,
+                )
+
+            if freq_scale != "linear":
+                for axis in plot.left:
+                    if axis.y_range_name == "default":
+                        axis.formatter = get_frequency_yformatter(freq_scale)
+
             plot.y_range = plots[0].y_range
             plot.extra_y_ranges = plots[0].extra_y_ranges
             if (sizing_mode != "fixed") and (aspect_ratio is not None):
@@ -334,7 +581,365 @@ def modify_bokeh_elements(
     return player_bokeh
 
 
-def get_audio_xformatter(total_seconds: float) -> CustomJSTickFormatter:
+def add_spectrogram_tiles(
+    plot: bokeh.model.Model,
+    channel_tiles: List[List[Tuple[float, float, Any]]],
+    color_mapper: bokeh.model.Model,
+    raster: str,
+    total_seconds: float,
+) -> None:
+    """
+    | Adds finer spectrogram tiles over the overview spectrogram of a plot, which are swapped in the browser according to the zoom.
+
+    | Each level is stored in its own ``ColumnDataSource`` , encoded like the overview
+      according to ``raster`` , and a detail renderer over the overview displays only
+      the tiles of the current level which overlap the visible x range,
+      see :ref:`get_swap_tiles_callback <waloviz._bokeh_manipulation.get_swap_tiles_callback>`.
+
+    Parameters
+    ----------
+    ``plot`` : bokeh.model.Model
+        A spectrogram plot, whose first renderer is the overview spectrogram, modified in place
+    ``channel_tiles`` : List[List[Tuple[float, float, Any]]]
+        The ``(x, dw, image)`` tiles of each level, with the lowest frequency as the first row
+    ``color_mapper`` : bokeh.model.Model
+        The color mapper of the float spectrogram, before ``raster`` was applied
+    ``raster`` : str
+        One of ``RASTER_MODES``
+    ``total_seconds`` : float
+        The total amount of seconds in the audio
+
+    |
+    """
+    overview = plot.renderers[0]
+    y = overview.data_source.data["y"][0]
+    dh = overview.data_source.data["dh"][0]
+
+    stores = []
+    for level_tiles in channel_tiles:
+        xs, dws, images = zip(*level_tiles)
+        stores.append(
+            ColumnDataSource(
+                data=dict(
+                    **encode_spectrogram_images(list(images), color_mapper, raster),
+                    x=list(xs),
+                    y=[y] * len(xs),
+                    dw=list(dws),
+                    dh=[dh] * len(xs),
+                )
+            )
+        )
+
+    detail = add_detail_renderer(plot, list(stores[0].data))
+
+    swap_tiles_callback = get_swap_tiles_callback(
+        plot.x_range, detail, stores, total_seconds
+    )
+    plot.x_range.js_on_change("start", swap_tiles_callback)
+    plot.x_range.js_on_change("end", swap_tiles_callback)
+
+
+def add_detail_renderer(plot: bokeh.model.Model, keys: List[str]) -> bokeh.model.Model:
+    """
+    | Adds an empty renderer right above the overview spectrogram of a plot, with a copy of its glyph, for finer parts of the spectrogram.
+
+    Parameters
+    ----------
+    ``plot`` : bokeh.model.Model
+        A spectrogram plot, whose first renderer is the overview spectrogram, modified in place
+    ``keys`` : List[str]
+        The columns of the empty ``ColumnDataSource`` of the renderer
+
+    Returns
+    -------
+    ``detail`` : bokeh.model.Model
+        The added renderer
+
+    |
+    """
+    overview = plot.renderers[0]
+    detail = GlyphRenderer(
+        data_source=ColumnDataSource(data={key: [] for key in keys}),
+        glyph=overview.glyph.clone(),
+    )
+    # Kept right above the overview, the last renderers are used by their position
+    plot.renderers = [overview, detail, *plot.renderers[1:]]
+    return detail
+
+
+def get_swap_tiles_callback(
+    x_range: bokeh.model.Model,
+    detail: bokeh.model.Model,
+    stores: List[bokeh.model.Model],
+    total_seconds: float,
+) -> CustomJS:
+    """
+    | Create a jslink callback which displays the spectrogram tiles of the level that matches the visible x range.
+
+    | Level ``i`` has ``2 ** i`` times the time resolution of the overview, so the
+      first level with at least the resolution of the overview over the visible x range
+      is selected. The selection is kept in ``waloviz_tiles`` of the ``detail``
+      renderer, so the data is only replaced when it changes.
+
+    Parameters
+    ----------
+    ``x_range`` : bokeh.model.Model
+        The x range of the spectrogram plot
+    ``detail`` : bokeh.model.Model
+        The renderer which displays the selected tiles
+    ``stores`` : List[bokeh.model.Model]
+        A ``ColumnDataSource`` with the tiles of each level
+    ``total_seconds`` : float
+        The total amount of seconds in the audio
+
+    Returns
+    -------
+    ``swap_tiles_callback`` : CustomJS
+        A jslink callback.
+
+    |
+    """
+    swap_tiles_callback = CustomJS(
+        args=dict(
+            x_range=x_range, detail=detail, stores=stores, total_seconds=total_seconds
+        ),
+        code="""
+const width = Math.max(x_range.end - x_range.start, 1e-9);
+const level = Math.min(Math.max(Math.ceil(Math.log2(total_seconds / width)), 0), stores.length);
+const indices = [];
+if (level > 0) {
+    const store = stores[level - 1].data;
+    for (let i = 0; i < store.x.length; i++) {
+        if ((store.x[i] < x_range.end) && (store.x[i] + store.dw[i] > x_range.start)) {
+            indices.push(i);
+        }
+    }
+}
+const selection = level + ':' + indices.join(',');
+if (detail.waloviz_tiles !== selection) {
+    detail.waloviz_tiles = selection;
+    const data = {};
+    for (const key of Object.keys(stores[0].data)) {
+        data[key] = indices.map((i) => stores[level - 1].data[key][i]);
+    }
+    detail.data_source.data = data;
+}
+                        """,
+    )
+    return swap_tiles_callback
+
+
+def add_browser_spectrogram(
+    player_bokeh: bokeh.model.Model, browser_spectrogram: Dict[str, Any]
+) -> Tuple[Dict[str, Any], str]:
+    """
+    | Prepares the spectrogram plots to be computed in the browser, from the embedded audio, instead of embedding the spectrogram.
+
+    | Once the document is ready, the returned callback decodes the audio with WebAudio
+      at the original sample rate, and a Web Worker computes the overview spectrogram,
+      and sets the bounds of the color mappers. Whenever the x range changes, the
+      worker computes the visible range with up to ``max_size`` frames into a detail
+      renderer over the overview, so zooming in reveals every frame.
+
+    Parameters
+    ----------
+    ``player_bokeh`` : bokeh.model.Model
+        The player as finalized by :ref:`finalize_player_bokeh_gui <waloviz._bokeh_manipulation.finalize_player_bokeh_gui>`,
+        with placeholder spectrogram images, modified in place
+    ``browser_spectrogram`` : Dict[str, Any]
+        The spectrogram parameters, as created by :ref:`create_browser_spectrogram_params <waloviz._holoviews_manipulations.create_browser_spectrogram_params>`
+
+    Returns
+    -------
+    ``browser_spectrogram_args`` : Dict[str, Any]
+        The arguments of a callback for the "document_ready" event, without the
+        ``audio`` argument
+    ``browser_spectrogram_code`` : str
+        The code of the callback, which expects the Bokeh model of the audio pane
+        as its ``audio`` argument
+
+    |
+    """
+    plots = [plot for plot, _, __ in player_bokeh.children[:-1]]
+    overviews = [plot.renderers[0] for plot in plots]
+    details = [
+        add_detail_renderer(plot, list(plot.renderers[0].data_source.data))
+        for plot in plots
+    ]
+
+    color_mappers = []
+    for overview in overviews:
+        if overview.glyph.color_mapper not in color_mappers:
+            color_mappers.append(overview.glyph.color_mapper)
+
+    x_range = plots[0].x_range
+    request_spectrogram_callback = get_request_spectrogram_callback(x_range)
+    x_range.js_on_change("start", request_spectrogram_callback)
+    x_range.js_on_change("end", request_spectrogram_callback)
+
+    return get_browser_spectrogram_callback(
+        x_range, overviews, details, color_mappers, browser_spectrogram
+    )
+
+
+def get_request_spectrogram_callback(x_range: bokeh.model.Model) -> CustomJS:
+    """
+    | Create a jslink callback which computes the spectrogram of the visible x range in the browser.
+
+    | Uses ``waloviz_spectrogram`` of the ``x_range`` , which is set once the overview
+      spectrogram was computed, see :ref:`get_browser_spectrogram_callback <waloviz._bokeh_manipulation.get_browser_spectrogram_callback>`.
+
+    Parameters
+    ----------
+    ``x_range`` : bokeh.model.Model
+        The shared x range of the plots
+
+    Returns
+    -------
+    ``request_spectrogram_callback`` : CustomJS
+        A jslink callback.
+
+    |
+    """
+    request_spectrogram_callback = CustomJS(
+        args=dict(x_range=x_range),
+        code="""
+const state = x_range.waloviz_spectrogram;
+if (state != null) {
+    state.request(x_range.start, x_range.end);
+}
+                        """,
+    )
+    return request_spectrogram_callback
+
+
+def get_browser_spectrogram_callback(
+    x_range: bokeh.model.Model,
+    overviews: List[bokeh.model.Model],
+    details: List[bokeh.model.Model],
+    color_mappers: List[bokeh.model.Model],
+    browser_spectrogram: Dict[str, Any],
+) -> Tuple[Dict[str, Any], str]:
+    """
+    | Create the arguments and code of a callback which decodes the audio and computes the overview spectrogram in the browser.
+
+    | The computation runs in a Web Worker of ``SPECTROGRAM_WORKER_JS`` , or in the
+      page itself when workers are not available. Only a single range is computed at a
+      time, and the x range changes made meanwhile are merged into the last of them.
+      Sets ``waloviz_spectrogram`` of the ``x_range`` .
+
+    Parameters
+    ----------
+    ``x_range`` : bokeh.model.Model
+        The shared x range of the plots
+    ``overviews`` : List[bokeh.model.Model]
+        The overview spectrogram renderer of each channel
+    ``details`` : List[bokeh.model.Model]
+        The renderer of the visible range of each channel
+    ``color_mappers`` : List[bokeh.model.Model]
+        The color mappers of the spectrograms, their bounds are set by the overview
+    ``browser_spectrogram`` : Dict[str, Any]
+        The spectrogram parameters
+
+    Returns
+    -------
+    ``browser_spectrogram_args`` : Dict[str, Any]
+        The arguments of the callback, without the ``audio`` argument
+    ``browser_spectrogram_code`` : str
+        The code of the callback, which expects an additional ``audio`` argument
+
+    |
+    """
+    browser_spectrogram_args: Dict[str, Any] = dict(
+        x_range=x_range,
+        overviews=overviews,
+        details=details,
+        color_mappers=color_mappers,
+        params=browser_spectrogram,
+        worker_source=SPECTROGRAM_WORKER_JS,
+    )
+    browser_spectrogram_code = """
+const state = {busy: false, pending: null, db_max: null, resolve: null};
+
+try {
+    const url = URL.createObjectURL(new Blob([worker_source], {type: "text/javascript"}));
+    state.worker = new Worker(url);
+    state.worker.onmessage = (event) => state.resolve(event.data);
+} catch (error) {
+    // Runs the same code in the page when workers are not available
+    const scope = {postMessage: (message) => state.resolve(message)};
+    new Function("self", worker_source)(scope);
+    state.worker = {postMessage: (message) => scope.onmessage({data: message})};
+}
+
+const compute = (start, end) => new Promise((resolve) => {
+    state.resolve = resolve;
+    state.worker.postMessage({type: "compute", start, end, db_max: state.db_max});
+});
+
+const create_image = (result, channel) => {
+    const template = overviews[0].data_source.data.image[0];
+    return new template.constructor(result.images[channel], [result.rows, result.columns]);
+};
+
+state.request = async (start, end) => {
+    if (state.busy) {
+        state.pending = [start, end];
+        return;
+    }
+    state.busy = true;
+    while (true) {
+        const start_sample = Math.max(Math.floor(start * params.sr), 0);
+        const end_sample = Math.min(Math.ceil(end * params.sr), params.samples);
+        if (end_sample - start_sample >= params.samples) {
+            for (const detail of details) {
+                detail.data_source.data = {image: [], x: [], y: [], dw: [], dh: []};
+            }
+        } else {
+            const result = await compute(start_sample, end_sample);
+            const {y, dh} = overviews[0].data_source.data;
+            const x = result.first * params.hop_length / params.sr;
+            const dw = result.columns * result.step * params.hop_length / params.sr;
+            details.forEach((detail, channel) => {
+                detail.data_source.data = {image: [create_image(result, channel)], x: [x], y, dw: [dw], dh};
+            });
+        }
+        if (state.pending == null) {
+            break;
+        }
+        [start, end] = state.pending;
+        state.pending = null;
+    }
+    state.busy = false;
+};
+
+(async () => {
+    const response = await fetch(audio.value);
+    const decoded = await new OfflineAudioContext(1, 1, params.sr).decodeAudioData(await response.arrayBuffer());
+    const channels = overviews.map((_, channel) => decoded.getChannelData(Math.min(channel, decoded.numberOfChannels - 1)).slice());
+    state.worker.postMessage({type: "init", channels, params}, channels.map((channel) => channel.buffer));
+
+    const result = await compute(0, params.samples);
+    for (const color_mapper of color_mappers) {
+        color_mapper.low = result.low;
+        color_mapper.high = result.high;
+    }
+    if (params.color_scale === "db") {
+        state.db_max = result.high;
+    }
+    overviews.forEach((overview, channel) => {
+        overview.data_source.data = {...overview.data_source.data, image: [create_image(result, channel)]};
+    });
+    x_range.waloviz_spectrogram = state;
+    state.request(x_range.start, x_range.end);
+})().catch((error) => console.error(error));
+"""
+    return browser_spectrogram_args, browser_spectrogram_code
+
+
+def get_audio_xformatter(
+    total_seconds: float, time_offset: float = 0.0
+) -> CustomJSTickFormatter:
     """
     | Create a relative time tick formatter, with dynamic resolution from days up to milliseconds.
 
@@ -342,6 +947,8 @@ def get_audio_xformatter(total_seconds: float) -> CustomJSTickFormatter:
     ----------
     ``total_seconds`` : float
 
+    ``time_offset`` : float
+        Added to the ticks, so that a segment is labeled in absolute time
 
     Returns
     -------
@@ -357,7 +964,7 @@ if ((tick < 0) || tick > {total_seconds}) {{
 }}
 
 var d = new Date(0);
-d.setMilliseconds(tick*1000);
+d.setMilliseconds(Math.round((tick + {time_offset})*1000));
 var days = Math.floor(d.getTime() / (1000*60*60*24));
 var hours = `${{d.getUTCHours()}}`.padStart(2, "0");
 var minutes = `${{d.getUTCMinutes()}}`.padStart(2, "0");
@@ -388,518 +995,495 @@ return result;
     return xformatter
 
 
-def get_record_ranges_callback(plots: List[bokeh.model.Model]) -> CustomJS:
+def get_frequency_yformatter(freq_scale: str) -> CustomJSTickFormatter:
     """
-    | Create a jslink callback which records the previous ranges, important for following and zooming on x axis only.
-
-    | Saves ``prev_x_range`` and ``prev_y_range`` in the zeroth plot (first spectrogram).
+    | Create a frequency tick formatter, which displays ticks of a "log" or "mel" frequency axis in Hz.
 
     Parameters
     ----------
-    ``plots`` : List[bokeh.model.Model]
-        Bokeh plots for the spectrograms and progress bar
+    ``freq_scale`` : str
+        Either "log" or "mel", see ``hz_to_frequency_scale``
 
     Returns
     -------
-    ``record_ranges_callback`` : CustomJS
-        A jslink callback.
+    ``yformatter`` : CustomJSTickFormatter
+        Frequency tick formatter.
 
     |
     """
-    record_ranges_callback = CustomJS(
-        args=dict(plot_0=plots[0]),
-        code="""
-plot_0.prev_x_range = {start: plot_0.x_range.start, end: plot_0.x_range.end};
-plot_0.prev_y_range = {start: plot_0.y_range.start, end: plot_0.y_range.end};
+    if freq_scale == "log":
+        to_hz = "Math.pow(2, tick)"
+    else:
+        to_hz = "700 * (Math.pow(10, tick / 2595) - 1)"
 
-plot_0.prev_extra_y_ranges = Object.keys(plot_0.extra_y_ranges).reduce(function(result, key) {
-    if (key != '_dump') {
-        result[key] = {start: plot_0.extra_y_ranges[key].start, end: plot_0.extra_y_ranges[key].end};
-    }
-    return result;
-}, {});
-                """,
+    yformatter = CustomJSTickFormatter(
+        code=f"""
+var hz = {to_hz};
+if (hz >= 1000) {{
+    return `${{parseFloat((hz / 1000).toPrecision(3))}}k`;
+}}
+return `${{parseFloat(hz.toPrecision(3))}}`;
+"""
     )
-    return record_ranges_callback
+    return yformatter
 
 
-def get_start_follow_callback(
-    follow_color: str, vspans: List[bokeh.model.Model], plots: List[bokeh.model.Model]
-) -> CustomJS:
+def get_player_event_actions(is_pbar: bool) -> Dict[str, List[str]]:
     """
-    | Create a jslink callback which activates "follow" mode.
+    | Lists the actions of the player callback for each event, in the order they run.
 
-    | Saves ``is_following`` to the zeroth vspan (first spectrogram bright section).
-    | Also used to synchronize the vline follow color with the vspan ``line_color`` .
+    | See ``PLAYER_EVENT_ACTIONS`` , and the handlers of
+      :ref:`get_player_callback <waloviz._bokeh_manipulation.get_player_callback>` .
 
     Parameters
     ----------
-    ``follow_color`` : List[bokeh.model.Model]
-        The color of the vlines when in "follow" mode
-    ``vspans`` : List[bokeh.model.Model]
-        Bokeh elements that brighten the section played so far
-    ``plots`` : List[bokeh.model.Model]
-        Bokeh plots for the spectrograms and progress bar
+    ``is_pbar`` : bool
+        Whether the actions are for the progress bar, otherwise for a spectrogram
 
     Returns
     -------
-    ``start_follow_callback`` : CustomJS
-        A jslink callback.
+    ``event_actions`` : Dict[str, List[str]]
+        The names of the actions, by the name of the event
 
     |
     """
-    start_follow_callback = CustomJS(
-        args=dict(vspan_0=vspans[0], plot_0=plots[0]),
-        code=f"""
-vspan_0.is_following = true;
-vspan_0.line_color = "{follow_color}";
-let x = Math.max(Math.min(cb_obj.x, plot_0.x_range.reset_end), plot_0.x_range.reset_start);
-vspan_0.ratio = (x-plot_0.x_range.start)/(plot_0.x_range.end-plot_0.x_range.start);
-                """,
-    )
-    return start_follow_callback
+    event_actions: Dict[str, List[str]] = {}
+    for actions, events, on_spectrograms, on_pbar in PLAYER_EVENT_ACTIONS:
+        if on_pbar if is_pbar else on_spectrograms:
+            for e in events:
+                event_actions.setdefault(e, []).extend(actions)
+    return event_actions
 
 
-def get_stop_follow_callback(
-    stay_color: str, vspans: List[bokeh.model.Model]
+def get_player_callback(
+    stay_color: str,
+    follow_color: str,
+    plots: List[bokeh.model.Model],
+    vspans: List[bokeh.model.Model],
+    glyphs: List[bokeh.model.Model],
+    spectrogram_actions: Dict[str, List[str]],
+    pbar_actions: Dict[str, List[str]],
 ) -> CustomJS:
-    """
-    | Create a jslink callback which activates "stay" mode, stops "follow" mode.
-
-    | Sets ``is_following`` of the zeroth vspan (first spectrogram bright section).
-    | Also used to synchronize the vline stay color with the vspan ``line_color`` .
+    r"""
+    | Create a jslink callback which handles all the events of the spectrograms and the progress bar.
+
+    | The callback finds its plot from the event, and runs the actions of the event in
+      order, see :ref:`get_player_event_actions <waloviz._bokeh_manipulation.get_player_event_actions>` .
+    | The actions:
+
+    - ``record_ranges`` records the previous ranges, important for following and
+      zooming on x axis only, in ``prev_x_range`` and ``prev_y_range`` of the zeroth
+      plot (first spectrogram)
+    - ``start_follow`` and ``stop_follow`` activate "follow" and "stay" modes, through
+      ``is_following`` and ``line_color`` of the zeroth vspan (first spectrogram bright section)
+    - ``set_y_range`` and ``keep_y_range`` stop the y zoom by keeping a constant y range
+      when the mouse is over the spectrograms, in ``is_y_fixed`` and ``hz_fixed_range`` of the zeroth plot
+    - ``set_pbar_x_range`` and ``keep_x_range`` stop the x zoom by keeping a constant x range
+      when the mouse is over the progress bar, in ``is_x_fixed`` and ``x_fixed_range`` of the zeroth plot
+    - ``keep_dump_range`` keeps the '_dump' y axis, of the play and stop icons as well
+      as the progress bar handle, between 0 and 1
+    - ``play_pause`` toggles play\\pause when the mouse is over the spectrograms,
+      through the visibility of the zeroth glyph (first spectrogram play icon)
+    - ``reset`` updates saved values to their presets
+    - ``move_time`` and ``move_pbar`` move the current time to the mouse position,
+      when double clicking and when the mouse is over the progress bar
 
     Parameters
     ----------
-    ``stay_color`` : List[bokeh.model.Model]
+    ``stay_color`` : str
         The color of the vlines when in "stay" mode
+    ``follow_color`` : str
+        The color of the vlines when in "follow" mode
+    ``plots`` : List[bokeh.model.Model]
+        Bokeh plots for the spectrograms and progress bar
     ``vspans`` : List[bokeh.model.Model]
         Bokeh elements that brighten the section played so far
+    ``glyphs`` : List[bokeh.model.Model]
+        Bokeh elements for play icons and the progress bar circular handle
+    ``spectrogram_actions`` : Dict[str, List[str]]
+        The actions of each event of the spectrograms
+    ``pbar_actions`` : Dict[str, List[str]]
+        The actions of each event of the progress bar
 
     Returns
     -------
-    ``stop_follow_callback`` : CustomJS
-        A jslink callback.
+    ``player_callback`` : CustomJS
+        A jslink callback, for the events of all the plots.
 
     |
     """
-    stop_follow_callback = CustomJS(
-        args=dict(vspan_0=vspans[0]),
-        code=f"""
-vspan_0.is_following = false;
-vspan_0.line_color = "{stay_color}";
-                """,
+    player_callback = CustomJS(
+        # Copies, a list shared by the arguments of two callbacks is a circular reference for Bokeh
+        args=dict(
+            plots=list(plots),
+            vspans=list(vspans),
+            glyphs=list(glyphs),
+            stay_color=stay_color,
+            follow_color=follow_color,
+            spectrogram_actions=spectrogram_actions,
+            pbar_actions=pbar_actions,
+        ),
+        code=PLAYER_CALLBACK_JS,
     )
-    return stop_follow_callback
+    return player_callback
 
 
-def get_set_y_range_callback(
-    plot: bokeh.model.Model, plots: List[bokeh.model.Model]
+def get_cursor_callback(
+    attr: str,
+    plots: List[bokeh.model.Model],
+    vlines: List[bokeh.model.Model],
+    vspans: List[bokeh.model.Model],
+    glyphs: List[bokeh.model.Model],
 ) -> CustomJS:
     """
-    | Create a jslink callback which stops the y zoom by setting a constant y range when the mouse is over the spectrograms.
+    | Create a jslink callback which synchronizes all the current time cursors with the zeroth vspan, and updates the x range when in "follow" mode.
 
-    | Sets ``is_y_fixed`` , ``hz_fixed_range.start`` and ``hz_fixed_range.end`` of the zeroth plot (first spectrogram).
+    | For ``attr="right"`` moves the vlines, vspans and glyphs of all plots to ``right``
+      of the zeroth vspan (first spectrogram bright section).
+    | For ``attr="line_color"`` colors the vlines of all plots with its ``line_color`` .
 
     Parameters
     ----------
-    ``plot`` : bokeh.model.Model
-        The current ``plot``
+    ``attr`` : str
+        The property of the zeroth vspan that changed, ``right`` or ``line_color``
     ``plots`` : List[bokeh.model.Model]
         Bokeh plots for the spectrograms and progress bar
+    ``vlines`` : List[bokeh.model.Model]
+        Bokeh elements for current time cursors
+    ``vspans`` : List[bokeh.model.Model]
+        Bokeh elements that brighten the section played so far
+    ``glyphs`` : List[bokeh.model.Model]
+        Bokeh elements for play icons and the progress bar circular handle
 
     Returns
     -------
-    ``set_y_range_callback`` : CustomJS
-        A jslink callback.
+    ``cursor_callback`` : CustomJS
+        A jslink callback, for changes of ``attr`` of the zeroth vspan.
 
     |
     """
-    set_y_range_callback = CustomJS(
-        args=dict(plot=plot, plot_0=plots[0]),
-        code="""
-let mouse_in = ('x' in cb_obj) && (cb_obj.x > plot.x_range.start) && (cb_obj.x < plot.x_range.end);
-if (('is_y_fixed' in plot_0) && (plot_0.is_y_fixed)) {
-    if (mouse_in) {
-        if ('_dump' in plot.extra_y_ranges) {
-            plot.y_range.start = plot_0.hz_fixed_range.start;
-            plot.y_range.end = plot_0.hz_fixed_range.end;
-            if ((Object.keys(plot.extra_y_ranges).length > 0) && ('extra_fixed_ranges' in plot_0)) {
-                for (const key in plot_0.extra_y_ranges) {
-                    if ((key != '_dump') && (key in plot_0.extra_fixed_ranges) && ('start' in plot_0.extra_fixed_ranges[key])) {
-                        plot.extra_y_ranges[key].start = plot_0.extra_fixed_ranges[key].start;
-                        plot.extra_y_ranges[key].end = plot_0.extra_fixed_ranges[key].end;
-                    }
-                }
-            }
-        }
-    } else {
-        plot_0.is_y_fixed = false;
-    }
-} else {
-    if (mouse_in) {
-        plot_0.is_y_fixed = true;
-        if ('prev_y_range' in plot_0) {
-            plot_0.hz_fixed_range = plot_0.prev_y_range;
-            plot_0.extra_fixed_ranges = plot_0.prev_extra_y_ranges;
-        } else {
-
-            plot_0.hz_fixed_range = {
-                start: plot_0.y_range.reset_start,
-                end: plot_0.y_range.reset_end
-            };
-            if (Object.keys(plot.extra_y_ranges).length > 0) {
-                plot_0.extra_fixed_ranges = {};
-                for (const key in plot_0.extra_y_ranges) {
-                    if ((key != '_dump') && (plot_0.extra_y_ranges[key].reset_start != null)) {
-                        plot_0.extra_fixed_ranges[key] = {
-                            start: plot_0.extra_y_ranges[key].reset_start,
-                            end: plot_0.extra_y_ranges[key].reset_end
-                        };
-                    }
-                }
-            }
-        }
-    }
-}
-                """,
+    synchronize = {
+        "right": """
+    glyphs[i].glyph.x = vspan_0.right;
+    vlines[i].location = vspan_0.right;
+    vspans[i].right = vspan_0.right;""",
+        "line_color": """
+    vlines[i].line_color = vspan_0.line_color;""",
+    }[attr]
+    cursor_callback = CustomJS(
+        args=dict(
+            plots=list(plots),
+            vlines=list(vlines),
+            vspans=list(vspans),
+            glyphs=list(glyphs),
+        ),
+        code=f"""
+const vspan_0 = vspans[0];
+for (let i = 0; i < plots.length; i++) {{{synchronize}
+}}
+if (('is_following' in vspan_0) && (vspan_0.is_following)) {{
+    for (const plot of plots) {{
+        let current_size = plot.x_range.end - plot.x_range.start;
+        plot.x_range.start = vspan_0.right - current_size * vspan_0.ratio;
+        plot.x_range.end = vspan_0.right + current_size * (1-vspan_0.ratio);
+    }}
+}}
+        """,
     )
-    return set_y_range_callback
+    return cursor_callback
 
 
-def get_keep_y_range_callback(
-    plot: bokeh.model.Model, plots: List[bokeh.model.Model]
-) -> CustomJS:
+def get_play_icons_callback(glyphs: List[bokeh.model.Model]) -> CustomJS:
     """
-    | Create a jslink callback which keeps the constant y range when the mouse is over the spectrograms.
-
-    | Uses ``is_y_fixed`` , ``hz_fixed_range.start`` and ``hz_fixed_range.end`` of the zeroth plot (first spectrogram).
+    | Create a jslink callback which shows the play icons of all spectrograms with the zeroth glyph (first spectrogram play icon).
 
     Parameters
     ----------
-    ``plot`` : bokeh.model.Model
-        The current ``plot``
-    ``plots`` : List[bokeh.model.Model]
-        Bokeh plots for the spectrograms and progress bar
+    ``glyphs`` : List[bokeh.model.Model]
+        Bokeh elements for play icons and the progress bar circular handle
 
     Returns
     -------
-    ``keep_y_range_callback`` : CustomJS
+    ``play_icons_callback`` : CustomJS
         A jslink callback.
 
     |
     """
-    keep_y_range_callback = CustomJS(
-        args=dict(plot=plot, plot_0=plots[0]),
+    play_icons_callback = CustomJS(
+        args=dict(glyphs=glyphs[:-1]),
         code="""
-if (('is_y_fixed' in plot_0) && (plot_0.is_y_fixed)) {
-    if ('_dump' in plot.extra_y_ranges) {
-        plot.y_range.start = plot_0.hz_fixed_range.start;
-        plot.y_range.end = plot_0.hz_fixed_range.end;
-        if ((Object.keys(plot.extra_y_ranges).length > 0) && ('extra_fixed_ranges' in plot_0)) {
-            for (const key in plot_0.extra_y_ranges) {
-                if ((key != '_dump') && (key in plot_0.extra_fixed_ranges) && ('start' in plot_0.extra_fixed_ranges[key])) {
-                    plot.extra_y_ranges[key].start = plot_0.extra_fixed_ranges[key].start;
-                    plot.extra_y_ranges[key].end = plot_0.extra_fixed_ranges[key].end;
-                }
-            }
-        }
-    }
+for (const glyph of glyphs) {
+    glyph.visible = cb_obj.visible;
 }
-                """,
+        """,
     )
-    return keep_y_range_callback
+    return play_icons_callback
 
 
-def get_set_pbar_x_range_callback(
-    plot: bokeh.model.Model, plots: List[bokeh.model.Model]
-) -> CustomJS:
+def rasterize_spectrogram(renderer: bokeh.model.Model) -> None:
     """
-    | Create a jslink callback which stops the x zoom by setting a constant x range when the mouse is over the progress bar.
+    | Replaces the spectrogram image of a renderer with a PNG of its colors, mapped in Python the same way its color mapper maps them in the browser.
 
-    | Sets ``is_x_fixed`` , ``x_fixed_range.start`` and ``x_fixed_range.end`` of the zeroth plot (first spectrogram).
+    | The PNG is an indexed color image of the palette, a single byte per pixel before
+      its compression, instead of the 4 bytes of a float32 value, and the browser only
+      decodes it, rather than color mapping every value. The color mapper is kept for
+      the colorbar. Unlike the image, the browser interpolates the PNG smoothly when
+      zoomed in.
 
     Parameters
     ----------
-    ``plot`` : bokeh.model.Model
-        The current ``plot``
-    ``plots`` : List[bokeh.model.Model]
-        Bokeh plots for the spectrograms and progress bar
-
-    Returns
-    -------
-    ``set_pbar_x_range_callback`` : CustomJS
-        A jslink callback.
+    ``renderer`` : bokeh.model.Model
+        A glyph renderer of an ``Image`` glyph with a linear or log color mapper, as
+        rendered by HoloViews, modified in place
 
     |
     """
-    set_pbar_x_range_callback = CustomJS(
-        args=dict(plot=plot, pbar=plots[-1], plot_0=plots[0]),
-        code="""
-let mouse_in = ('y' in cb_obj) && (cb_obj.y > pbar.y_range.start) && (cb_obj.y < pbar.y_range.end);
-if (('is_x_fixed' in plot_0) && (plot_0.is_x_fixed)) {
-    if (mouse_in) {
-        plot.x_range.start = plot_0.x_fixed_range.start;
-        plot.x_range.end = plot_0.x_fixed_range.end;
-    } else {
-        plot_0.is_x_fixed = false;
-    }
-} else {
-    if (mouse_in) {
-        plot_0.is_x_fixed = true;
-        if ('prev_x_range' in plot_0) {
-            plot_0.x_fixed_range = plot_0.prev_x_range;
-        } else {
-            plot_0.x_fixed_range = {};
-            plot_0.x_fixed_range.start = plot_0.x_range.reset_start;
-            plot_0.x_fixed_range.end = plot_0.x_range.reset_end;
-        }
-    }
-}
-                        """,
+    glyph = renderer.glyph
+    data = renderer.data_source.data
+
+    renderer.data_source.data = dict(
+        **encode_spectrogram_images(data["image"], glyph.color_mapper, "png"),
+        x=data["x"],
+        y=data["y"],
+        dw=data["dw"],
+        dh=data["dh"],
+    )
+    renderer.glyph = ImageURL(
+        url="url",
+        x="x",
+        y="y",
+        w="dw",
+        h="dh",
+        anchor="bottom_left",
+        global_alpha=glyph.global_alpha,
     )
-    return set_pbar_x_range_callback
+    renderer.selection_glyph = "auto"
+    renderer.nonselection_glyph = "auto"
+    renderer.muted_glyph = "auto"
+    renderer.hover_glyph = None
 
 
-def get_keep_x_range_callback(
-    plot: bokeh.model.Model, plots: List[bokeh.model.Model]
-) -> CustomJS:
+def quantize_spectrogram(renderer: bokeh.model.Model, dtype: type) -> None:
     """
-    | Create a jslink callback which keeps the constant x range when the mouse is over the progress bar.
+    | Replaces the float spectrogram image of a renderer with unsigned integer levels, which the browser still maps to colors.
 
-    | Uses ``is_x_fixed`` , ``x_fixed_range.start`` and ``x_fixed_range.end`` of the zeroth plot (first spectrogram).
+    | The levels divide the bounds of the color mapper evenly, in log space for a log
+      color mapper, so the image is mapped by a linear color mapper over the levels.
+      With "uint8" and a palette of 256 colors, every level is exactly a palette index,
+      and the colors equal those of the float image, "uint16" is finer for when the
+      palette is changed in the browser. The original color mapper is kept for the
+      colorbar, so it still displays the original values.
 
     Parameters
     ----------
-    ``plot`` : bokeh.model.Model
-        The current ``plot``
-    ``plots`` : List[bokeh.model.Model]
-        Bokeh plots for the spectrograms and progress bar
-
-    Returns
-    -------
-    ``keep_x_range_callback`` : CustomJS
-        A jslink callback.
+    ``renderer`` : bokeh.model.Model
+        A glyph renderer of an ``Image`` glyph with a linear or log color mapper, as
+        rendered by HoloViews, modified in place
+    ``dtype`` : type
+        ``np.uint8`` or ``np.uint16``
 
     |
     """
-    keep_x_range_callback = CustomJS(
-        args=dict(plot=plot, plot_0=plots[0]),
-        code="""
-if (('is_x_fixed' in plot_0) && (plot_0.is_x_fixed)) {
-    plot.x_range.start = plot_0.x_fixed_range.start;
-    plot.x_range.end = plot_0.x_fixed_range.end;
-}
-            """,
+    color_mapper = renderer.glyph.color_mapper
+    levels = np.iinfo(dtype).max + 1
+
+    data = dict(renderer.data_source.data)
+    data["image"] = [
+        map_colors(np.asarray(image), color_mapper, levels).astype(dtype)
+        for image in data["image"]
+    ]
+    renderer.data_source.data = data
+
+    levels_mapper = LinearColorMapper(
+        palette=color_mapper.palette,
+        low=0,
+        high=levels,
+        nan_color=color_mapper.nan_color,
     )
-    return keep_x_range_callback
-
-
-def get_keep_dump_range_callback(plot: bokeh.model.Model) -> CustomJS:
+    for glyph in [
+        renderer.glyph,
+        renderer.selection_glyph,
+        renderer.nonselection_glyph,
+        renderer.muted_glyph,
+        renderer.hover_glyph,
+    ]:
+        if isinstance(glyph, Image):
+            glyph.update(color_mapper=levels_mapper)
+
+
+def encode_spectrogram_images(
+    images: List[np.ndarray], color_mapper: bokeh.model.Model, raster: str
+) -> Dict[str, List[Any]]:
     """
-    | Create a jslink callback which keeps the '_dump' y axis between 0 and 1.
-
-    | The '_dump' axis is used for the play and stop icons as well as the progress bar handle.
+    | Encodes spectrogram images the way the ``raster`` mode sends them to the browser.
 
     Parameters
     ----------
-    ``plot`` : bokeh.model.Model
-        The current ``plot``
+    ``images`` : List[np.ndarray]
+        Spectrogram images, with the lowest frequency as the first row
+    ``color_mapper`` : bokeh.model.Model
+        The linear or log color mapper of the float images
+    ``raster`` : str
+        One of ``RASTER_MODES``
 
     Returns
     -------
-    ``keep_dump_range_callback`` : CustomJS
-        A jslink callback.
+    ``column`` : Dict[str, List[Any]]
+        ``{"url": [...]}`` with PNG data URIs for "png", otherwise ``{"image": [...]}``
+        with the float or quantized images
 
     |
     """
-    keep_dump_range_callback = CustomJS(
-        args=dict(plot=plot),
-        code="""
-if ('_dump' in plot.extra_y_ranges) {
-    plot.extra_y_ranges['_dump'].start = 0;
-    plot.extra_y_ranges['_dump'].end = 1;
-} else {
-    plot.y_range.start = 0;
-    plot.y_range.end = 1;
-}
-                """,
-    )
-    return keep_dump_range_callback
+    if raster == "png":
+        return dict(url=[create_png_data_uri(image, color_mapper) for image in images])
+    if raster in QUANTIZED_RASTER_DTYPES:
+        dtype = QUANTIZED_RASTER_DTYPES[raster]
+        levels = np.iinfo(dtype).max + 1
+        return dict(
+            image=[
+                map_colors(np.asarray(image), color_mapper, levels).astype(dtype)
+                for image in images
+            ]
+        )
+    return dict(image=list(images))
 
 
-def get_play_pause_callback(
-    plots: List[bokeh.model.Model], glyphs: List[bokeh.model.Model]
-) -> CustomJS:
-    r"""
-    | Create a jslink callback which toggles play\\pause when the mouse is over the spectrograms.
-
-    | Makes the zeroth glyph (first spectrogram play icon) visible.
+def create_png_data_uri(image: np.ndarray, color_mapper: bokeh.model.Model) -> str:
+    """
+    | Maps a spectrogram image to the colors of a color mapper, and encodes it as a PNG data URI.
 
     Parameters
     ----------
-    ``plots`` : List[bokeh.model.Model]
-        Bokeh plots for the spectrograms and progress bar
-    ``glyphs`` : List[bokeh.model.Model]
-        Bokeh elements for play icons and the progress bar circular handle
+    ``image`` : np.ndarray
+        A spectrogram image, with the lowest frequency as the first row
+    ``color_mapper`` : bokeh.model.Model
+        A linear or log color mapper, see :ref:`map_colors <waloviz._bokeh_manipulation.map_colors>`
 
     Returns
     -------
-    ``play_pause_callback`` : CustomJS
-        A jslink callback.
+    ``data_uri`` : str
+        A "data:image/png;base64," URI
 
     |
     """
-    play_pause_callback = CustomJS(
-        args=dict(plot_0=plots[0], pause_0=glyphs[0]),
-        code="""
-let x = cb_obj.x;
-let y = cb_obj.y;
-let sx = cb_obj.sx;
-let sy = cb_obj.sy;
-let mouse_on_xrange = (x > plot_0.x_range.start) && (x < plot_0.x_range.end);
-if (mouse_on_xrange) {
-    pause_0.visible = !pause_0.visible;
-}
-                """,
-    )
-    return play_pause_callback
-
-
-def get_reset_callback(
-    plot: bokeh.model.Model, plots: List[bokeh.model.Model]
-) -> CustomJS:
+    indices = map_colors(np.asarray(image), color_mapper)
+    palette = [color_to_rgba(color) for color in color_mapper.palette]
+    if len(palette) > PNG_PALETTE_SIZE:
+        indices = indices * PNG_PALETTE_SIZE // len(palette)
+        palette = [
+            palette[index * len(palette) // PNG_PALETTE_SIZE]
+            for index in range(PNG_PALETTE_SIZE)
+        ]
+    # The first row of the image is the lowest, while the first row of a PNG is the top
+    png = encode_indexed_png(indices[::-1], palette)
+    return f"data:image/png;base64,{b64encode(png).decode('ascii')}"
+
+
+def map_colors(
+    values: np.ndarray,
+    color_mapper: bokeh.model.Model,
+    levels: Optional[int] = None,
+) -> np.ndarray:
     """
-    | Create a jslink callback which updates saved values to their presets.
+    | Maps values into indices of the palette of a linear or log color mapper, the same way BokehJS does, values outside of its bounds are clamped.
 
     Parameters
     ----------
-    ``plot`` : bokeh.model.Model
-        The current ``plot``
-    ``plots`` : List[bokeh.model.Model]
-        Bokeh plots for the spectrograms and progress bar
+    ``values`` : np.ndarray
+        The values to map
+    ``color_mapper`` : bokeh.model.Model
+        A ``LinearColorMapper`` or a ``LogColorMapper`` , when its bounds are not
+        set, the bounds of the ``values`` are used
+    ``levels`` : int
+        The amount of evenly divided levels between the bounds, default is the
+        amount of colors in the palette
 
     Returns
     -------
-    ``reset_callback`` : CustomJS
-        A jslink callback.
+    ``indices`` : np.ndarray
+        The indices into the palette, or into the ``levels`` , in the shape of ``values``
 
     |
     """
-    reset_callback = CustomJS(
-        args=dict(plot=plot, plot_0=plots[0]),
-        code="""
-if (('is_y_fixed' in plot_0) && (plot_0.is_y_fixed)) {
-    plot_0.is_y_fixed = false;
-    plot.y_range.start = plot.y_range.reset_start;
-    plot.y_range.end = plot.y_range.reset_end;
-    if (Object.keys(plot.extra_y_ranges).length > 0) {
-        for (const key in plot.extra_y_ranges) {
-            if ((key != '_dump') && (plot.extra_y_ranges[key].reset_start != null)) {
-                plot.extra_y_ranges[key].start = plot.extra_y_ranges[key].reset_start;
-                plot.extra_y_ranges[key].end = plot.extra_y_ranges[key].reset_end;
-            }
-        }
-    }
-}
-if (('is_x_fixed' in plot_0) && (plot_0.is_x_fixed)) {
-    plot_0.is_x_fixed = false;
-    plot.x_range.start = plot.x_range.reset_start;
-    plot.x_range.end = plot.x_range.reset_end;
-}
-            """,
-    )
-    return reset_callback
-
+    palette_size = len(color_mapper.palette) if levels is None else levels
+    low = np.nanmin(values) if color_mapper.low is None else color_mapper.low
+    high = np.nanmax(values) if color_mapper.high is None else color_mapper.high
 
-def get_follow_callback(plot: bokeh.model.Model, vspan: bokeh.model.Model) -> CustomJS:
-    """
-    | Create a jslink callback which updates the x range when in "follow" mode.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if isinstance(color_mapper, LogColorMapper):
+            values, low, high = np.log(values), np.log(low), np.log(high)
+        scaled = (values - low) * (palette_size / (high - low))
 
-    Parameters
-    ----------
-    ``plot`` : bokeh.model.Model
-        The current ``plot``
-    ``vspans`` : List[bokeh.model.Model]
-        Bokeh elements that brighten the section played so far
-
-    Returns
-    -------
-    ``follow_callback`` : CustomJS
-        A jslink callback.
-
-    |
-    """
-    follow_callback = CustomJS(
-        args=dict(plot=plot, vspan=vspan),
-        code="""
-if (('is_following' in cb_obj) && (cb_obj.is_following)) {
-    let current_size = plot.x_range.end - plot.x_range.start;
-    plot.x_range.start = cb_obj.right - current_size * cb_obj.ratio;
-    plot.x_range.end = cb_obj.right + current_size * (1-cb_obj.ratio);
-}
-        """,
-    )
-    return follow_callback
+    scaled = np.nan_to_num(scaled, nan=0.0)
+    return np.clip(scaled, 0, palette_size - 1).astype(np.int64)
 
 
-def get_move_time_callback(
-    vspans: List[bokeh.model.Model], plots: List[bokeh.model.Model]
-) -> CustomJS:
+def color_to_rgba(color: str) -> Tuple[int, int, int, int]:
     """
-    | Create a jslink callback which moves the current time to the mouse position.
-
-    | Used when double clicking.
+    | Converts a hex or named color of a palette into RGBA bytes.
 
     Parameters
     ----------
-    ``vspans`` : List[bokeh.model.Model]
-        Bokeh elements that brighten the section played so far
-    ``plots`` : List[bokeh.model.Model]
-        Bokeh plots for the spectrograms and progress bar
+    ``color`` : str
+        "#rrggbb", "#rrggbbaa" or a named CSS color
 
     Returns
     -------
-    ``move_time_callback`` : CustomJS
-        A jslink callback.
+    ``rgba`` : Tuple[int, int, int, int]
+
+    Raises
+    ------
+    ``ValueError``
+        When the ``color`` is not supported
 
     |
     """
-    move_time_callback = CustomJS(
-        args=dict(vspan_0=vspans[0], plot_0=plots[0]),
-        code="""
-vspan_0.right = Math.max(Math.min(cb_obj.x, plot_0.x_range.reset_end), plot_0.x_range.reset_start);
-            """,
-    )
-    return move_time_callback
-
-
-def get_move_pbar_callback(
-    vspans: List[bokeh.model.Model], plots: List[bokeh.model.Model]
-) -> CustomJS:
+    if color.startswith("#") and len(color) in (7, 9):
+        rgba = bytes.fromhex(color[1:])
+        return (rgba[0], rgba[1], rgba[2], rgba[3] if len(rgba) == 4 else 255)
+    named_color = getattr(named, color.lower(), None)
+    if named_color is None:
+        raise ValueError(f"The palette color {color!r} is not supported")
+    return (named_color.r, named_color.g, named_color.b, round(named_color.a * 255))
+
+
+def encode_indexed_png(
+    indices: np.ndarray, palette: List[Tuple[int, int, int, int]]
+) -> bytes:
     """
-    | Create a jslink callback which moves the current time to the mouse position when the mouse is over the progress bar.
+    | Encodes an indexed color PNG, with a transparency chunk only when the palette has transparent colors.
 
     Parameters
     ----------
-    ``vspans`` : List[bokeh.model.Model]
-        Bokeh elements that brighten the section played so far
-    ``plots`` : List[bokeh.model.Model]
-        Bokeh plots for the spectrograms and progress bar
+    ``indices`` : np.ndarray
+        The palette indices of the pixels, with the top row first
+    ``palette`` : List[Tuple[int, int, int, int]]
+        Up to 256 RGBA colors
 
     Returns
     -------
-    ``move_pbar_callback`` : CustomJS
-        A jslink callback.
+    ``png`` : bytes
 
     |
     """
-    move_pbar_callback = CustomJS(
-        args=dict(vspan_0=vspans[0], plot_0=plots[0]),
-        code="""
-if (('is_x_fixed' in plot_0) && (plot_0.is_x_fixed)) {
-    vspan_0.right = Math.max(Math.min(cb_obj.x, plot_0.x_range.reset_end), plot_0.x_range.reset_start);
-}
-            """,
-    )
-    return move_pbar_callback
+
+    def chunk(chunk_type: bytes, content: bytes) -> bytes:
+        return (
+            struct.pack(">I", len(content))
+            + chunk_type
+            + content
+            + struct.pack(">I", zlib.crc32(chunk_type + content))
+        )
+
+    height, width = indices.shape
+    # Each row starts with its filter type, 0 is no filtering, as recommended for indexed color
+    rows = np.zeros((height, width + 1), dtype=np.uint8)
+    rows[:, 1:] = indices
+    png = b"\x89PNG\r\n\x1a\n"
+    png += chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 3, 0, 0, 0))
+    png += chunk(b"PLTE", bytes(value for color in palette for value in color[:3]))
+    if any(color[3] != 255 for color in palette):
+        png += chunk(b"tRNS", bytes(color[3] for color in palette))
+    png += chunk(b"IDAT", zlib.compress(rows.tobytes(), 9))
+    png += chunk(b"IEND", b"")
+    return png
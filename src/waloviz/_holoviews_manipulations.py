@@ -7,8 +7,18 @@ import bokeh.model
 import holoviews as hv
 import numpy as np
 import torch
-import torchaudio.transforms as T
 
+from ._spectrogram_utils import (
+    COLOR_SCALES,
+    calculate_frame_count,
+    calculate_frequency_bins,
+    compute_spectrogram,
+    compute_spectrogram_tiles,
+    create_frequency_warp,
+    hz_to_frequency_scale,
+    power_to_db,
+    resolve_warped_frequency_grid,
+)
 from ._tensor_utils import skip_to_size
 
 
@@ -79,7 +89,23 @@ def get_player_hv(
     axes_limits: Optional[
         Dict[str, Tuple[Optional[Union[float, int]], Optional[Union[float, int]]]]
     ],
-) -> hv.Layout:
+    stft_mode: str = "budget",
+    stft_workers: Optional[int] = None,
+    decimation: str = "skip",
+    fmin: Optional[float] = None,
+    fmax: Optional[float] = None,
+    max_freq_bins: Optional[int] = None,
+    freq_scale: str = "linear",
+    color_scale: str = "log",
+    db_range: float = 80.0,
+    dtype: Optional[torch.dtype] = None,
+    lod_levels: int = 0,
+    browser_spectrogram: bool = False,
+) -> Tuple[
+    hv.Layout,
+    List[List[List[Tuple[float, float, np.ndarray]]]],
+    Optional[Dict[str, Any]],
+]:
     """
     | Uses HoloViews to create the plots elements of the player, without any custom interactivity.
 
@@ -130,28 +156,137 @@ def get_player_hv(
         A list of axes names corresponding to the list given in ``over_curve``
     ``axes_limits`` : Dict[str, Tuple[float, float]]
         Default limits for any of the axes
+    ``stft_mode`` : str
+        How the spectrogram is computed, see :ref:`compute_spectrogram <waloviz._spectrogram_utils.compute_spectrogram>`.
+    ``stft_workers`` : int
+        The amount of threads computing the spectrogram concurrently
+    ``decimation`` : str
+        How the time axis is reduced to the ``max_size`` , see :ref:`skip_to_size <waloviz._tensor_utils.skip_to_size>`.
+    ``fmin`` : float
+        The minimum displayed frequency
+    ``fmax`` : float
+        The maximum displayed frequency
+    ``max_freq_bins`` : int
+        The maximum amount of values allowed in the frequency axis
+    ``freq_scale`` : str
+        The scale of the frequency axis, one of "linear", "log" or "mel"
+    ``color_scale`` : str
+        Either "log", which is applied by Bokeh in the browser, or "db" which is
+        applied here, see :ref:`power_to_db <waloviz._spectrogram_utils.power_to_db>`.
+    ``db_range`` : float
+        The dynamic range of the "db" ``color_scale``
+    ``dtype`` : torch.dtype
+        The floating point dtype of the spectrogram, when the ``wav`` has a different
+        dtype it is converted chunk by chunk, see :ref:`compute_spectrogram <waloviz._spectrogram_utils.compute_spectrogram>`.
+    ``lod_levels`` : int
+        The maximum amount of finer spectrogram levels below the overview, see
+        :ref:`compute_spectrogram_tiles <waloviz._spectrogram_utils.compute_spectrogram_tiles>`.
+    ``browser_spectrogram`` : bool
+        When ``True`` the spectrogram is not computed and the plots display an empty
+        placeholder, which is computed in the browser instead
 
     Returns
     -------
     ``player_hv`` : hv.Layout
         The basic player plot elements in HoloViews format, without any custom
         interactivity
+    ``spectrogram_tiles`` : List[List[List[Tuple[float, float, np.ndarray]]]]
+        The ``(x, dw, image)`` tiles of each channel and level, scaled like the
+        overview spectrogram, with the lowest frequency as the first row, empty
+        unless ``lod_levels`` is positive, see :ref:`create_spectrogram_tiles <waloviz._holoviews_manipulations.create_spectrogram_tiles>`
+    ``browser_spectrogram_params`` : Dict[str, Any]
+        The parameters for computing the spectrogram in the browser, with the same
+        frequency bins as the plots, None unless ``browser_spectrogram`` is ``True`` ,
+        see :ref:`create_browser_spectrogram_params <waloviz._holoviews_manipulations.create_browser_spectrogram_params>`
+
+    Raises
+    ------
+    ``ValueError``
+        | When ``color_scale`` is not one of the available options
+        | **OR**
+        | When ``lod_levels`` is negative
 
     |
 
     """
     responsive = True
 
-    spec = T.Spectrogram(n_fft=n_fft, hop_length=hop_length)(wav)
+    if color_scale not in COLOR_SCALES:
+        raise ValueError(
+            f"``color_scale`` must be one of the available options: {COLOR_SCALES}, but was {color_scale}"
+        )
+    if lod_levels < 0:
+        raise ValueError(f"``lod_levels`` must not be negative, but was {lod_levels}")
+
+    freq_bins, freq_warp, hz_min, hv_max = resolve_frequency_axis(
+        sr, n_fft, freq_scale, fmin, fmax, max_freq_bins
+    )
+
+    spectrogram_tiles = []
+    browser_spectrogram_params = None
+    if browser_spectrogram:
+        browser_spectrogram_params = create_browser_spectrogram_params(
+            wav.shape[-1],
+            sr,
+            n_fft,
+            hop_length,
+            max_size,
+            decimation,
+            freq_bins,
+            freq_warp,
+            color_scale,
+            db_range,
+        )
+        spec = torch.zeros((wav.shape[0], 1, 1))
+        clim = (-db_range, 0.0) if color_scale == "db" else None
+    else:
+        spec = compute_spectrogram(
+            wav,
+            n_fft,
+            hop_length,
+            max_size,
+            stft_mode=stft_mode,
+            stft_workers=stft_workers,
+            decimation=decimation,
+            freq_bins=freq_bins,
+            freq_warp=freq_warp,
+            dtype=dtype,
+        )
+
+        clim = None
+        if color_scale == "db":
+            spec, db_min, db_max = power_to_db(spec, db_range)
+            clim = (db_min, db_max)
+
+        if lod_levels > 0:
+            spectrogram_tiles = create_spectrogram_tiles(
+                wav,
+                sr,
+                n_fft,
+                hop_length,
+                max_size,
+                lod_levels,
+                clim,
+                db_range,
+                stft_workers=stft_workers,
+                decimation=decimation,
+                freq_bins=freq_bins,
+                freq_warp=freq_warp,
+                dtype=dtype,
+            )
 
-    # type not inferred to recursive function
-    spec: List[torch.Tensor] = [  # pyright: ignore[reportAssignmentType]
-        skip_to_size(sub_spec, max_size) for sub_spec in spec
-    ]
     if over_curve is not None:
-        over_curve = [skip_to_size(sub_curve, max_size) for sub_curve in over_curve]
+        over_curve = [
+            attach_time_axis(
+                skip_to_size(sub_curve, max_size, decimation), total_seconds
+            )
+            for sub_curve in over_curve
+        ]
 
-    hz_min, hv_max = calculate_frequency_range_of_torchaudio_spectrogram(sr, n_fft)
+    if freq_scale != "linear":
+        over_curve, axes_limits = scale_frequency_axis(
+            over_curve, over_curve_axes, axes_limits, freq_scale, hz_min
+        )
 
     plots = []
     for channel_index, spec_channel in enumerate(spec):
@@ -173,6 +308,7 @@ def get_player_hv(
             hv_max,
             over_curve_axes,
             axes_limits,
+            clim,
         )
         plots.append(plot)
 
@@ -182,21 +318,233 @@ def get_player_hv(
     player_hv = combine_player_plots(
         plots, sync_legends, theme_hook, stay_color, responsive
     )
-    return player_hv
+    return player_hv, spectrogram_tiles, browser_spectrogram_params
+
+
+def resolve_frequency_axis(
+    sr: int,
+    n_fft: int,
+    freq_scale: str,
+    fmin: Optional[float],
+    fmax: Optional[float],
+    max_freq_bins: Optional[int],
+) -> Tuple[Optional[Tuple[int, int, int]], Optional[torch.Tensor], float, float]:
+    """
+    | Resolves how the frequency bins of the spectrogram are displayed, either cropped and pooled linear bins or a warping matrix.
+
+    Parameters
+    ----------
+    ``sr`` : int
+        Resolved sample-rate
+    ``n_fft`` : int
+        Sets the ``n_fft`` of the torchaudio spectrogram
+    ``freq_scale`` : str
+        The scale of the frequency axis, one of "linear", "log" or "mel"
+    ``fmin`` : float
+        The minimum displayed frequency
+    ``fmax`` : float
+        The maximum displayed frequency
+    ``max_freq_bins`` : int
+        The maximum amount of values allowed in the frequency axis
+
+    Returns
+    -------
+    ``freq_bins`` : (int, int, int)
+        The linear frequency bins to keep, see :ref:`calculate_frequency_bins <waloviz._spectrogram_utils.calculate_frequency_bins>`,
+        None for a warped ``freq_scale``
+    ``freq_warp`` : torch.Tensor
+        The frequency warping matrix, see :ref:`create_frequency_warp <waloviz._spectrogram_utils.create_frequency_warp>`,
+        None for the "linear" ``freq_scale``
+    ``hz_min`` : float
+        The bottom of the frequency axis
+    ``hv_max`` : float
+        The top of the frequency axis
+
+    |
+    """
+    freq_bins = None
+    freq_warp = None
+    if freq_scale == "linear":
+        freq_bins = calculate_frequency_bins(sr, n_fft, fmin, fmax, max_freq_bins)
+        hz_min, hv_max = calculate_frequency_range_of_torchaudio_spectrogram(
+            sr, n_fft, freq_bins
+        )
+    else:
+        n_bins, fmin, fmax = resolve_warped_frequency_grid(
+            freq_scale, sr, n_fft, fmin, fmax, max_freq_bins
+        )
+        freq_warp = create_frequency_warp(freq_scale, sr, n_fft, n_bins, fmin, fmax)
+        hz_min, hv_max = calculate_frequency_range_of_warped_spectrogram(
+            freq_scale, n_bins, fmin, fmax
+        )
+    return freq_bins, freq_warp, hz_min, hv_max
+
+
+def create_browser_spectrogram_params(
+    samples: int,
+    sr: int,
+    n_fft: int,
+    hop_length: int,
+    max_size: int,
+    decimation: str,
+    freq_bins: Optional[Tuple[int, int, int]],
+    freq_warp: Optional[torch.Tensor],
+    color_scale: str,
+    db_range: float,
+) -> Dict[str, Any]:
+    """
+    | Collects the parameters of the spectrogram for computing it in the browser, with the frequency warp as a sparse matrix.
+
+    Parameters
+    ----------
+    ``samples`` : int
+        The amount of samples in the audio
+    ``sr`` : int
+        Resolved sample-rate, which the browser decodes the audio at
+    ``n_fft`` : int
+        Sets the ``n_fft`` of the spectrogram
+    ``hop_length`` : int
+        Sets the ``hop_length`` of the spectrogram
+    ``max_size`` : int
+        The maximum amount of values allowed in the time axis
+    ``decimation`` : str
+        How the time axis is reduced to the ``max_size`` , see :ref:`skip_to_size <waloviz._tensor_utils.skip_to_size>`.
+    ``freq_bins`` : (int, int, int)
+        The ``(start_bin, end_bin, freq_step)`` frequency bins, see :ref:`reduce_frequency_bins <waloviz._spectrogram_utils.reduce_frequency_bins>`
+    ``freq_warp`` : torch.Tensor
+        A frequency warping matrix, see :ref:`create_frequency_warp <waloviz._spectrogram_utils.create_frequency_warp>`
+    ``color_scale`` : str
+        Either "log" or "db"
+    ``db_range`` : float
+        The dynamic range of the "db" ``color_scale``
+
+    Returns
+    -------
+    ``params`` : Dict[str, Any]
+        JSON serializable parameters, the ``freq_warp`` is given by the ``indptr`` ,
+        ``indices`` and ``weights`` of its non-zero values in each row
+
+    |
+    """
+    warp = None
+    if freq_warp is not None:
+        rows, columns = torch.nonzero(freq_warp, as_tuple=True)
+        indptr = torch.zeros(freq_warp.shape[0] + 1, dtype=torch.int64)
+        indptr[1:] = torch.bincount(rows, minlength=freq_warp.shape[0]).cumsum(0)
+        warp = dict(
+            indptr=indptr.tolist(),
+            indices=columns.tolist(),
+            weights=freq_warp[rows, columns].tolist(),
+        )
+
+    return dict(
+        samples=samples,
+        sr=sr,
+        n_fft=n_fft,
+        hop_length=hop_length,
+        max_size=max_size,
+        decimation=decimation,
+        freq_bins=None if freq_bins is None else list(freq_bins),
+        freq_warp=warp,
+        color_scale=color_scale,
+        db_range=db_range,
+    )
+
+
+def create_spectrogram_tiles(
+    wav: torch.Tensor,
+    sr: int,
+    n_fft: int,
+    hop_length: int,
+    max_size: int,
+    lod_levels: int,
+    clim: Optional[Tuple[float, float]],
+    db_range: float,
+    **tile_kwargs: Any,
+) -> List[List[List[Tuple[float, float, np.ndarray]]]]:
+    """
+    | Computes the spectrogram tile pyramid, scaled like the overview spectrogram, and arranges it by channel.
+
+    Parameters
+    ----------
+    ``wav`` : torch.Tensor
+        Loaded audio tensor
+    ``sr`` : int
+        Resolved sample-rate
+    ``n_fft`` : int
+        Sets the ``n_fft`` of the torchaudio spectrogram
+    ``hop_length`` : int
+        Sets the ``hop_length`` of the torchaudio spectrogram
+    ``max_size`` : int
+        The maximum amount of values in the time axis of each tile
+    ``lod_levels`` : int
+        The maximum amount of levels below the overview
+    ``clim`` : Tuple[float, float]
+        The decibel color bounds of the overview spectrogram, the tiles share its
+        maximum. When None the tiles are kept as power, like the overview.
+    ``db_range`` : float
+        The dynamic range of the "db" ``color_scale``
+    ``tile_kwargs`` : Any
+        Passed to :ref:`compute_spectrogram_tiles <waloviz._spectrogram_utils.compute_spectrogram_tiles>`
+
+    Returns
+    -------
+    ``spectrogram_tiles`` : List[List[List[Tuple[float, float, np.ndarray]]]]
+        The ``(x, dw, image)`` tiles of each channel and level, in seconds, with the
+        lowest frequency as the first row of each image
+
+    |
+    """
+    levels = compute_spectrogram_tiles(
+        wav, n_fft, hop_length, max_size, lod_levels, **tile_kwargs
+    )
+    # The frames are spread evenly over the audio, like in the overview spectrogram
+    frame_seconds = (
+        wav.shape[-1] / sr / calculate_frame_count(wav.shape[-1], hop_length)
+    )
+
+    spectrogram_tiles = [[] for _ in range(wav.shape[0])]
+    for level in levels:
+        for channel_tiles in spectrogram_tiles:
+            channel_tiles.append([])
+        for start_frame, end_frame, power in level:
+            # Both scalings are applied in place, like for the overview
+            if clim is None:
+                spec = power.add_(1e-5)
+            else:
+                spec, _, _ = power_to_db(power, db_range, db_max=clim[1])
+            for channel_index, channel_tiles in enumerate(spectrogram_tiles):
+                channel_tiles[-1].append(
+                    (
+                        start_frame * frame_seconds,
+                        (end_frame - start_frame) * frame_seconds,
+                        spec[channel_index].numpy(),
+                    )
+                )
+    return spectrogram_tiles
 
 
 def calculate_frequency_range_of_torchaudio_spectrogram(
-    sr: int, n_fft: int
+    sr: int, n_fft: int, freq_bins: Optional[Tuple[int, int, int]] = None
 ) -> Tuple[float, float]:
     """
     | Calculates the maximum and minimum frequency as in the torchaudio spectrogram.
 
+    | Each displayed row is centered around its frequency bin and is
+      ``freq_step * sr / n_fft`` Hz tall, when the last row pools fewer than
+      ``freq_step`` bins it is still displayed at full height.
+    | When all the frequency bins are displayed the range is the same as without
+      ``freq_bins`` , including for an odd ``n_fft`` .
+
     Parameters
     ----------
     ``sr`` : int
         Resolved sample-rate
     ``n_fft`` : int
         Sets the ``n_fft`` of the torchaudio spectrogram
+    ``freq_bins`` : (int, int, int)
+        The ``(start_bin, end_bin, freq_step)`` displayed frequency bins, default
+        None is all of them
 
     Returns
     -------
@@ -207,11 +555,164 @@ def calculate_frequency_range_of_torchaudio_spectrogram(
 
     |
     """
-    hz_min = (-1 / n_fft) * sr / 2
-    hv_max = (1 + 1 / n_fft) * sr / 2
+    if (freq_bins is None) or (tuple(freq_bins) == (0, n_fft // 2 + 1, 1)):
+        hz_min = (-1 / n_fft) * sr / 2
+        hv_max = (1 + 1 / n_fft) * sr / 2
+        return hz_min, hv_max
+
+    start_bin, end_bin, freq_step = freq_bins
+    rows = -(-(end_bin - start_bin) // freq_step)
+    bin_hz = sr / n_fft
+    hz_min = (start_bin - 0.5) * bin_hz
+    hv_max = (start_bin + rows * freq_step - 0.5) * bin_hz
     return hz_min, hv_max
 
 
+def calculate_frequency_range_of_warped_spectrogram(
+    freq_scale: str, n_bins: int, fmin: float, fmax: float
+) -> Tuple[float, float]:
+    """
+    | Calculates the minimum and maximum of the frequency axis of a "log" or "mel" spectrogram, in the ``freq_scale`` units.
+
+    | The ``n_bins`` bins are centered on ``n_bins`` of the ``n_bins + 2`` equally spaced
+      edges between ``fmin`` and ``fmax`` , see ``create_frequency_warp`` .
+
+    Parameters
+    ----------
+    ``freq_scale`` : str
+        Either "log" or "mel"
+    ``n_bins`` : int
+        The amount of warped frequency bins
+    ``fmin`` : float
+        The frequency of the lower edge of the first warped bin
+    ``fmax`` : float
+        The frequency of the upper edge of the last warped bin
+
+    Returns
+    -------
+    ``scaled_min`` : float
+        Minimum of the frequency axis
+    ``scaled_max`` : float
+        Maximum of the frequency axis
+
+    |
+    """
+    scaled_fmin: float = hz_to_frequency_scale(fmin, freq_scale)  # pyright: ignore[reportAssignmentType]
+    scaled_fmax: float = hz_to_frequency_scale(fmax, freq_scale)  # pyright: ignore[reportAssignmentType]
+    bin_size = (scaled_fmax - scaled_fmin) / (n_bins + 1)
+    return scaled_fmin + bin_size / 2, scaled_fmax - bin_size / 2
+
+
+def attach_time_axis(
+    sub_curve: Union[torch.Tensor, Tuple[torch.Tensor, torch.Tensor]],
+    total_seconds: float,
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    | Pairs a curve given only by its values with evenly spaced time values, curves which already have time values are returned as is.
+
+    | The time values are created once and broadcast as a view to all channels. They
+      are float64, since float32 time values of hours long audio are milliseconds apart.
+
+    Parameters
+    ----------
+    ``sub_curve`` : torch.Tensor | (torch.Tensor, torch.Tensor)
+        A single standardized overlaid curve
+    ``total_seconds`` : float
+        The total duration of the audio in seconds
+
+    Returns
+    -------
+    ``sub_curve`` : (torch.Tensor, torch.Tensor)
+        The time values and the curve values
+
+    |
+    """
+    if isinstance(sub_curve, Tuple):
+        return sub_curve  # pyright: ignore[reportReturnType]
+
+    sub_x = torch.linspace(0, total_seconds, sub_curve.shape[-1], dtype=torch.float64)
+    return sub_x.expand(sub_curve.shape), sub_curve
+
+
+def scale_frequency_axis(
+    over_curve: Optional[List[Union[torch.Tensor, Tuple[torch.Tensor, torch.Tensor]]]],
+    over_curve_axes: Optional[List[str]],
+    axes_limits: Optional[
+        Dict[str, Tuple[Optional[Union[float, int]], Optional[Union[float, int]]]]
+    ],
+    freq_scale: str,
+    scaled_min: float,
+) -> Tuple[
+    Optional[List[Union[torch.Tensor, Tuple[torch.Tensor, torch.Tensor]]]],
+    Optional[
+        Dict[str, Tuple[Optional[Union[float, int]], Optional[Union[float, int]]]]
+    ],
+]:
+    """
+    | Converts the over curves and limits of the "Hz" axis to the ``freq_scale`` units, so they stay aligned with a "log" or "mel" spectrogram.
+
+    | A "log" scale has no place for frequencies which are not positive, like the 0 Hz
+      of unvoiced frames in a pitch curve, so such curve values become NaN, which
+      breaks the line there, and such limits become the bottom of the axis.
+
+    Parameters
+    ----------
+    ``over_curve`` : List[torch.Tensor]
+        A list of curves to be displayed over the spectrogram
+    ``over_curve_axes`` : List[str]
+        A list of axes names corresponding to the list given in ``over_curve``
+    ``axes_limits`` : Dict[str, Tuple[float, float]]
+        Default limits for any of the axes
+    ``freq_scale`` : str
+        Either "log" or "mel"
+    ``scaled_min`` : float
+        The bottom of the frequency axis, in the ``freq_scale`` units
+
+    Returns
+    -------
+    ``over_curve`` : List[torch.Tensor]
+        With the "Hz" curves converted
+    ``axes_limits`` : Dict[str, Tuple[float, float]]
+        With the "Hz" limits converted
+
+    |
+    """
+
+    def scale_curve(hz: torch.Tensor) -> torch.Tensor:
+        scaled: torch.Tensor = hz_to_frequency_scale(hz, freq_scale)  # pyright: ignore[reportAssignmentType]
+        if freq_scale == "log":
+            scaled = scaled.masked_fill(hz <= 0, float("nan"))
+        return scaled
+
+    def scale_limit(hz: Optional[Union[float, int]]) -> Optional[float]:
+        if hz is None:
+            return None
+        if (freq_scale == "log") and (hz <= 0):
+            return scaled_min
+        return hz_to_frequency_scale(hz, freq_scale)  # pyright: ignore[reportReturnType]
+
+    if (over_curve is not None) and (over_curve_axes is not None):
+        scaled_over_curve = []
+        for sub_curve, axis in zip(over_curve, over_curve_axes):
+            scaled_sub_curve = sub_curve
+            if axis == "Hz":
+                if isinstance(sub_curve, Tuple):
+                    sub_x, sub_y = sub_curve
+                    scaled_sub_curve = sub_x, scale_curve(sub_y)
+                else:
+                    scaled_sub_curve = scale_curve(sub_curve)
+            scaled_over_curve.append(scaled_sub_curve)
+        over_curve = scaled_over_curve  # pyright: ignore[reportAssignmentType]
+
+    if (axes_limits is not None) and ("Hz" in axes_limits):
+        axes_limits = dict(axes_limits)
+        axes_limits["Hz"] = tuple(  # pyright: ignore[reportArgumentType]
+            scale_limit(limit) for limit in axes_limits["Hz"]
+        )
+
+    return over_curve, axes_limits
+
+
 def combine_player_plots(
     plots: List[hv.Layout],
     sync_legends: bool,
@@ -331,6 +832,7 @@ def create_channel_spectrogram_plot(
     axes_limits: Optional[
         Dict[str, Tuple[Optional[Union[float, int]], Optional[Union[float, int]]]]
     ],
+    clim: Optional[Tuple[float, float]] = None,
 ) -> hv.Layout:
     """
     | Creates a HoloViews plot of the progress bar.
@@ -340,7 +842,7 @@ def create_channel_spectrogram_plot(
     ``channel_index`` : int
         The current channel to generate spectrogram for
     ``spec_channel`` : torch.Tensor
-        The spectrogram of the current channel
+        The spectrogram of the current channel, modified in place when ``clim`` is None
     ``total_seconds`` : float
         The total amount of seconds in the ``wav`` as calculated according to the ``sr``
     ``over_curve`` : List[torch.Tensor]
@@ -372,6 +874,10 @@ def create_channel_spectrogram_plot(
         A list of axes names corresponding to the list given in ``over_curve``
     ``axes_limits`` : Dict[str, Tuple[float, float]]
         Default limits for any of the axes
+    ``clim`` : Tuple[float, float]
+        Precomputed color bounds of an already scaled ``spec_channel`` , which is
+        then displayed with a linear color mapper. When None the ``spec_channel``
+        is displayed with a log color mapper.
 
     Returns
     -------
@@ -382,16 +888,25 @@ def create_channel_spectrogram_plot(
     """
     lim_kwargs = create_lim_kwargs(over_curve_axes, axes_limits)
 
+    if clim is None:
+        # The offset is added in place, the spectrogram is not used after plotting
+        spec_channel = spec_channel.add_(1e-5)
+        cnorm_kwargs = dict(cnorm="log")
+    else:
+        cnorm_kwargs = dict(cnorm="linear", clim=clim)
+    # A flipped view, HoloViews expects the first row to be the highest frequency
+    image_data = spec_channel.numpy()[::-1, :]
+
     spec_image = hv.Image(
-        spec_channel.numpy()[::-1, :] + 1e-5,
+        image_data,
         bounds=(0, hz_min, total_seconds, hv_max),
         kdims=["x", "Hz"],
     ).opts(
         xaxis=None,
         ylabel=freq_label,
         cmap=cmap,
-        cnorm="log",
         colorbar=colorbar,
+        **cnorm_kwargs,
         **lim_kwargs["x"],
         **lim_kwargs["Hz"],
     )
@@ -423,14 +938,8 @@ def create_channel_spectrogram_plot(
                 axis = "y"
                 axes_opts_kwargs = lim_kwargs[axis]
 
-            if isinstance(sub_curve, Tuple):
-                sub_x, sub_y = sub_curve
-                channel_sub_curve = sub_x[channel_index], sub_y[channel_index]
-            else:
-                channel_sub_curve = (
-                    np.linspace(0, total_seconds, sub_curve[channel_index].shape[-1]),
-                    sub_curve[channel_index],
-                )
+            sub_x, sub_y = sub_curve
+            channel_sub_curve = sub_x[channel_index], sub_y[channel_index]
 
             curve = hv.Curve(
                 channel_sub_curve,
@@ -1,22 +1,268 @@
+import hashlib
 import os
-from io import BytesIO
-from typing import IO, Any, Optional, Union
-from unittest.mock import patch
+import re
+import threading
+import zlib
+from base64 import b64decode, b64encode
+from html import escape
+from io import BufferedIOBase, BytesIO, RawIOBase
+from pathlib import Path
+from typing import (
+    IO,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from urllib.parse import quote
 
 import bokeh
 import bokeh.model
 import numpy as np
 import panel as pn
 import torch
+from bokeh.core.json_encoder import PayloadEncoder
+from bokeh.core.serialization import Buffer, Serialized
+from bokeh.document import Document
+from bokeh.embed.elements import html_page_for_render_items
+from bokeh.embed.util import OutputDocumentFor, standalone_docs_json_and_render_items
+from bokeh.models.callbacks import CustomJS
 from bokeh.resources import INLINE, Resources
+from panel.io.embed import embed_state
+from panel.io.model import add_to_doc
+from panel.io.resources import (
+    BASE_TEMPLATE,
+    CDN_DIST,
+    bundle_resources,
+    set_resource_mode,
+)
+from panel.io.resources import Resources as PanelResources
 from panel.pane.media import (
     _VALID_NUMPY_DTYPES_FOR_AUDIO,
     _VALID_TORCH_DTYPES_FOR_AUDIO,
     TensorLike,
 )
+from pyviz_comms import Comm
+from scipy.io import wavfile
+
+from ._resample_utils import resample
+from ._tensor_utils import quantize_audio
 
 IOLike = Union[str, os.PathLike, IO]
 
+# The audio dtypes which the Panel audio pane encodes without converting them first,
+# a subset of ``_VALID_TORCH_DTYPES_FOR_AUDIO``
+PLAYER_DTYPES = [torch.int16, torch.float32, torch.float64]
+
+# Marks where the document JSON is streamed into the page, see ``write_player_html``
+DOCS_JSON_PLACEHOLDER = "__waloviz_docs_json_"
+
+# The available quantizations of the audio embedded for playback, see ``encode_playback_audio``
+PLAYBACK_DTYPES = {"int16": torch.int16, "uint8": torch.uint8}
+
+# The MIME types of encoded audio which is embedded as is, by the leading bytes of the file
+AUDIO_SIGNATURES = {
+    b"RIFF": "audio/wav",
+    b"OggS": "audio/ogg",
+    b"fLaC": "audio/flac",
+    b"ID3": "audio/mpeg",
+    b"\xff\xfb": "audio/mpeg",
+    b"\xff\xf3": "audio/mpeg",
+    b"\xff\xf2": "audio/mpeg",
+}
+
+
+# The file extensions of the data files, by the MIME type of their content
+DATA_FILE_EXTENSIONS = {
+    "text/javascript": ".js",
+    "image/png": ".png",
+    "audio/wav": ".wav",
+    "audio/ogg": ".ogg",
+    "audio/flac": ".flac",
+    "audio/mpeg": ".mp3",
+}
+
+# The ways the data of the player can be saved, see ``write_player_html``
+DATA_MODES = ["inline", "external"]
+
+# Data buffers smaller than this amount of bytes stay inline in the "external" data mode,
+# and are not compressed, and smaller scripts are not moved into the ``resources_dir``
+STORED_DATA_MIN_SIZE = 2**12
+
+# The call which embeds the documents in the page rendered by Bokeh
+EMBED_ITEMS_CALL = "root.Bokeh.embed.embed_items(docs_json, render_items);"
+
+# Loads the external and compressed data into ``docs_json`` , and then embeds the documents,
+# see ``replace_data`` , a string ``docs_json`` is still HTML escaped and is unescaped
+# like in ``embed_items``
+LOAD_DATA_CALL = """
+  const entities = {amp: "&", lt: "<", gt: ">", quot: '"', "#x27": "'", "#x60": "`"};
+  const docs = (typeof docs_json === "string")
+    ? JSON.parse(docs_json.replace(/&(amp|lt|gt|quot|#x27|#x60);/g, (_, entity) => entities[entity]))
+    : docs_json;
+  const load = (data) => (typeof data.url === "string")
+    ? fetch(data.url).then((response) => response.arrayBuffer())
+    : fetch(`data:application/octet-stream;base64,${data.deflated}`).then((response) =>
+      new Response(response.body.pipeThrough(new DecompressionStream("deflate"))).arrayBuffer()
+    );
+  const is_stored = (data) => (data != null) && ((typeof data.url === "string") || (typeof data.deflated === "string"));
+  const pending = [];
+  const visit = (obj) => {
+    if ((obj == null) || (typeof obj !== "object")) {
+      return;
+    }
+    if ((obj.type === "bytes") && is_stored(obj.data)) {
+      pending.push(load(obj.data).then((buffer) => { obj.data = new Uint8Array(buffer); }));
+      return;
+    }
+    for (const [key, value] of Object.entries(obj)) {
+      if ((value != null) && (value.type === "waloviz_file")) {
+        pending.push(load(value.data).then((buffer) => {
+          obj[key] = URL.createObjectURL(new Blob([buffer], {type: value.mime_type}));
+        }));
+      } else {
+        visit(value);
+      }
+    }
+  };
+  visit(docs);
+  Promise.all(pending).then(() => root.Bokeh.embed.embed_items(docs, render_items));
+"""
+
+# The type of the inline scripts which are compressed by ``compress_page_scripts``
+COMPRESSED_SCRIPT_TYPE = "application/x-waloviz-deflate"
+
+# Decompresses the compressed inline scripts, and restores them in their original order,
+# so that the JavaScript runs after the document JSON it reads is restored
+DECOMPRESS_SCRIPTS_JS = f"""
+(async () => {{
+  const scripts = Array.from(document.querySelectorAll('script[type="{COMPRESSED_SCRIPT_TYPE}"]'));
+  const codes = await Promise.all(scripts.map(async (script) => {{
+    const response = await fetch(`data:application/octet-stream;base64,${{script.textContent}}`);
+    return new Response(response.body.pipeThrough(new DecompressionStream("deflate"))).text();
+  }}));
+  scripts.forEach((script, index) => {{
+    const decompressed = document.createElement("script");
+    decompressed.type = script.dataset.type;
+    decompressed.id = script.id;
+    decompressed.text = codes[index];
+    script.replaceWith(decompressed);
+  }});
+}})();
+"""
+
+
+class PlayerAudio(pn.pane.Audio):
+    """
+    | An audio pane which registers a callback for the "document_ready" event of every document it is rendered into, with its own Bokeh model as the ``audio`` argument.
+
+    | It accepts multichannel audio, which ``scipy`` encodes as a multichannel WAV,
+      and it is never chosen automatically by ``pn.panel`` .
+    """
+
+    priority: ClassVar[Union[float, bool, None]] = False
+
+    def __init__(
+        self,
+        object: Any = None,
+        ready_args: Optional[Dict[str, Any]] = None,
+        ready_code: Optional[str] = None,
+        **params: Any,
+    ) -> None:
+        super().__init__(object, **params)
+        self._ready_args: Dict[str, Any] = dict(ready_args or {})
+        self._ready_code = ready_code
+
+    @classmethod
+    def applies(cls: Any, obj: Any) -> Union[float, bool, None]:
+        """
+        | Applies to 2d audio arrays and tensors as well, without patching the 1d checks of ``panel`` , so players can be created concurrently.
+
+        |
+        """
+        return (
+            super().applies(obj)
+            or _is_2dim_int_or_float_ndarray(obj)
+            or _is_2dim_int_or_float_tensor(obj)
+        )
+
+    def _get_model(
+        self,
+        doc: Document,
+        root: Optional[bokeh.model.Model] = None,
+        parent: Optional[bokeh.model.Model] = None,
+        comm: Any = None,
+    ) -> bokeh.model.Model:
+        """
+        | Creates the Bokeh model, and registers the ``ready_code`` callback with it.
+
+        |
+        """
+        model = super()._get_model(doc, root, parent, comm)
+        if self._ready_code is not None:
+            doc.js_on_event(
+                "document_ready",
+                CustomJS(
+                    args=dict(self._ready_args, audio=model), code=self._ready_code
+                ),
+            )
+        return model
+
+
+class EncodedAudio(PlayerAudio):
+    """
+    | An audio pane which embeds an already encoded audio data URI as is, instead of decoding and re-encoding it as WAV.
+
+    | It is never chosen automatically by ``pn.panel`` .
+    """
+
+    priority: ClassVar[Union[float, bool, None]] = False
+
+    @classmethod
+    def applies(cls: Any, obj: Any) -> Union[float, bool, None]:
+        """
+        | Applies only to audio data URIs.
+
+        |
+        """
+        return isinstance(obj, str) and obj.startswith("data:audio/")
+
+    def _transform_object(self, obj: Any) -> Dict[str, Any]:
+        """
+        | Passes the data URI to the Bokeh model as is.
+
+        |
+        """
+        return dict(object=obj)
+
+
+def create_audio_data_uri(data: bytes) -> Optional[str]:
+    """
+    | Creates a base64 data URI of encoded audio, with the MIME type detected from its leading bytes.
+
+    Parameters
+    ----------
+    ``data`` : bytes
+        The content of an audio file
+
+    Returns
+    -------
+    ``data_uri`` : str | None
+        The data URI, None when the format is not supported by browsers
+
+    |
+    """
+    for signature, mime_type in AUDIO_SIGNATURES.items():
+        if data.startswith(signature):
+            return f"data:{mime_type};base64,{b64encode(data).decode('utf-8')}"
+    return None
+
 
 def _is_2dim_int_or_float_ndarray(obj: Any) -> bool:
     """
@@ -68,6 +314,60 @@ def _is_2dim_int_or_float_tensor(obj: Any) -> bool:
     )
 
 
+def encode_playback_audio(
+    wav: torch.Tensor,
+    sr: int,
+    playback_sr: Optional[int] = None,
+    playback_dtype: Optional[str] = None,
+) -> str:
+    """
+    | Encodes the audio embedded for playback as a WAV data URI, resampled to ``playback_sr`` and quantized to ``playback_dtype`` , independently of the analyzed ``wav`` .
+
+    Parameters
+    ----------
+    ``wav`` : torch.Tensor
+        The analyzed audio tensor, of shape ``(channels, samples)``
+    ``sr`` : int
+        The sample rate of ``wav``
+    ``playback_sr`` : int
+        The sample rate of the embedded audio, default None keeps ``sr``
+    ``playback_dtype`` : str
+        Either "int16" or "uint8", default None quantizes to "int16" when this
+        function is called
+
+    Returns
+    -------
+    ``data_uri`` : str
+        A WAV data URI
+
+    Raises
+    ------
+    ``ValueError``
+        | When ``playback_dtype`` is not one of the available options
+        | **OR**
+        | When ``playback_sr`` is smaller than 1
+
+    |
+    """
+    if playback_dtype is None:
+        playback_dtype = "int16"
+    if playback_dtype not in PLAYBACK_DTYPES:
+        raise ValueError(
+            f"``playback_dtype`` must be one of the available options: {list(PLAYBACK_DTYPES)}, but was {playback_dtype}"
+        )
+    if playback_sr is None:
+        playback_sr = sr
+    if playback_sr < 1:
+        raise ValueError(f"``playback_sr`` must be at least 1, but was {playback_sr}")
+
+    wav = resample(wav, sr, playback_sr)
+    wav = quantize_audio(wav, PLAYBACK_DTYPES[playback_dtype])
+
+    buffer = BytesIO()
+    wavfile.write(buffer, playback_sr, np.ascontiguousarray(wav.T.numpy()))
+    return create_audio_data_uri(buffer.getvalue())  # pyright: ignore[reportReturnType]
+
+
 def wrap_player_with_panel(
     player_bokeh: bokeh.model.Model,
     wav: torch.Tensor,
@@ -83,6 +383,9 @@ def wrap_player_with_panel(
     native_player: bool,
     aspect_ratio: Optional[float],
     sizing_mode: Optional[str],
+    encoded_audio: Optional[str] = None,
+    ready_args: Optional[Dict[str, Any]] = None,
+    ready_code: Optional[str] = None,
 ) -> pn.viewable.Viewable:
     """
     | Wraps the bokeh player with panel, adds the audio and optionally a download button.
@@ -116,6 +419,15 @@ def wrap_player_with_panel(
         The panel ``sizing_mode`` , can be one of seven values:
         "stretch_width", "stretch_height", "stretch_both",
         "scale_width", "scale_height", "scale_both", or "fixed".
+    ``encoded_audio`` : str
+        A data URI of the original encoded audio, embedded instead of the ``wav`` when given,
+        see :ref:`create_audio_data_uri <waloviz._panel_manipulation.create_audio_data_uri>`
+    ``ready_args`` : Dict[str, Any]
+        The arguments of the ``ready_code`` callback, besides the audio model
+    ``ready_code`` : str
+        The code of a callback which is run with the audio model as its ``audio``
+        argument once the document is ready,
+        see :ref:`add_browser_spectrogram <waloviz._bokeh_manipulation.add_browser_spectrogram>`
 
     Returns
     -------
@@ -136,15 +448,20 @@ def wrap_player_with_panel(
         plot_height = height - audio_height - button_height
         height_kwargs["height"] = plot_height
 
-    with patch(
-        "panel.pane.media._is_1dim_int_or_float_ndarray",
-        new=_is_2dim_int_or_float_ndarray,
-    ), patch(
-        "panel.pane.media._is_1dim_int_or_float_tensor",
-        new=_is_2dim_int_or_float_tensor,
-    ):
-        audio = pn.pane.Audio(
+    if encoded_audio is not None:
+        audio = EncodedAudio(
+            encoded_audio,
+            ready_args=ready_args,
+            ready_code=ready_code,
+            sizing_mode="stretch_width",
+            height=audio_height,
+            visible=native_player,
+        )
+    else:
+        audio = PlayerAudio(
             wav.T,
+            ready_args=ready_args,
+            ready_code=ready_code,
             sample_rate=sr,
             sizing_mode="stretch_width",
             height=audio_height,
@@ -162,22 +479,18 @@ def wrap_player_with_panel(
     rows = [player_panel_plot, audio]
 
     if download_button:
-        buffer = BytesIO()
-        buffer = save_player_panel(
-            pn.Column(
-                *rows,
-                **aspect_ratio_kwargs,
-                **width_kwargs,
-                **height_kwargs,
-            ),
-            buffer,
-            title,
-        )
-        if not isinstance(buffer, BytesIO):
-            raise NotImplementedError()
-        buffer.seek(0)
         file_download = pn.widgets.FileDownload(
-            buffer, filename=f"{title}.html", embed=True
+            callback=create_download_callback(
+                pn.Column(
+                    *rows,
+                    **aspect_ratio_kwargs,
+                    **width_kwargs,
+                    **height_kwargs,
+                ),
+                title,
+            ),
+            filename=f"{title}.html",
+            embed=False,
         )
         rows.append(file_download)
 
@@ -192,12 +505,45 @@ def wrap_player_with_panel(
     return player_panel
 
 
+def create_download_callback(
+    player_panel: pn.viewable.Viewable, title: Optional[str]
+) -> Callable[[], BytesIO]:
+    """
+    | Creates a callback which saves the player to an in-memory HTML file, called only when the download button is clicked.
+
+    Parameters
+    ----------
+    ``player_panel`` : pn.viewable.Viewable
+        The player without the download button
+    ``title`` : str
+        The title of the html
+
+    Returns
+    -------
+    ``download_callback`` : Callable[[], BytesIO]
+        A ``pn.widgets.FileDownload`` callback
+
+    |
+    """
+
+    def download_callback() -> BytesIO:
+        buffer = BytesIO()
+        save_player_panel(player_panel, buffer, title)
+        buffer.seek(0)
+        return buffer
+
+    return download_callback
+
+
 def save_player_panel(
     player_panel: pn.viewable.Viewable,
     out_file: Optional[IOLike] = None,
     title: Optional[str] = None,
     resources: Resources = INLINE,
     embed: bool = True,
+    data: str = "inline",
+    compress: bool = False,
+    resources_dir: Optional[Union[str, os.PathLike]] = None,
 ) -> IOLike:
     """
     | Saves a panel player to an HTML file.
@@ -218,14 +564,34 @@ def save_player_panel(
         The resources for the ``panel`` save method, default is INLINE
     ``embed`` : bool
         The embed value for the ``panel`` save method, default is True
+    ``data`` : str
+        "inline" or "external", see :ref:`write_player_html <waloviz._panel_manipulation.write_player_html>`
+    ``compress`` : bool
+        Whether to compress the page, see :ref:`write_player_html <waloviz._panel_manipulation.write_player_html>`
+    ``resources_dir`` : str | os.PathLike
+        A resource bundle directory shared by multiple pages, see :ref:`write_player_html <waloviz._panel_manipulation.write_player_html>`
 
     Returns
     -------
     ``out_file`` : str | os.PathLike | IO
         The file that the HTML player content was written into
 
+    Raises
+    ------
+    ``ValueError``
+        | When ``data`` is not one of ``DATA_MODES``
+        | **OR**
+        | When ``data`` is "external" and ``out_file`` is not a file path
+        | **OR**
+        | When ``resources_dir`` is given and ``out_file`` is not a file path
+
     |
     """
+    if data not in DATA_MODES:
+        raise ValueError(
+            f"``data`` must be one of the available options: {DATA_MODES}, but was {data}"
+        )
+
     if title is None:
         try:
             title = player_panel.title  # pyright: ignore[reportAttributeAccessIssue]
@@ -242,11 +608,576 @@ def save_player_panel(
     ):
         player_panel = pn.Column(player_panel[0], player_panel[1])  # pyright: ignore[reportIndexIssue]
 
-    pn.panel(player_panel).save(
+    write_player_html(
+        player_panel,
         out_file,
-        resources=resources,
-        embed=embed,
-        title=title,
+        title,
+        resources,
+        embed,
+        data,
+        compress,
+        resources_dir,
     )
 
     return out_file
+
+
+def write_player_html(
+    player_panel: pn.viewable.Viewable,
+    out_file: IOLike,
+    title: Optional[str],
+    resources: Resources = INLINE,
+    embed: bool = True,
+    data: str = "inline",
+    compress: bool = False,
+    resources_dir: Optional[Union[str, os.PathLike]] = None,
+) -> None:
+    """
+    | Writes the HTML of a panel player into the ``out_file`` incrementally, so the peak memory does not grow with the size of the output.
+
+    | The ``panel`` save method renders the whole document JSON into a single string
+      inside the page. Here the page is rendered with a placeholder instead, and then
+      written piece by piece, with the document JSON streamed in between, one
+      base64 data buffer at a time.
+    | The ``panel`` save method is bypassed, and the Bokeh document is rendered
+      directly, see :ref:`render_player_page <waloviz._panel_manipulation.render_player_page>` .
+      All of the player interactivity is client side ``CustomJS`` , so the ``panel``
+      state embedding only runs when the ``player_panel`` contains Python-side widgets.
+    | With ``data="external"`` , the spectrogram, curves and audio are written into
+      data files in a "{out_file stem}_files" directory next to the page, named by
+      their content hash, and the page fetches them before embedding the player.
+      Browsers cache them separately from the page, but they can only be fetched
+      when the page is served over HTTP, and not opened as a local file.
+    | With ``compress=True`` , the inline scripts, and the data which is not
+      external, are deflated, and the page decompresses them with the browser
+      native ``DecompressionStream`` before embedding the player, so it remains a
+      single self-contained file.
+    | With a ``resources_dir`` , the large inline scripts, which are the Bokeh and
+      ``panel`` resources, are written into it, named by their content hash, and the
+      page loads them from there by a relative path. Pages exported with the same
+      ``resources_dir`` share a single copy of the resources, and still work offline.
+
+    Parameters
+    ----------
+    ``player_panel`` : pn.viewable.Viewable
+        The player created by ``wv.Audio`` , without the download button
+    ``out_file`` : str | os.PathLike | IO
+        The output file path or file object, binary file objects are written in utf-8
+    ``title`` : str
+        The html title
+    ``resources`` : bokeh.resources.Resources
+        The resources for the ``panel`` save method
+    ``embed`` : bool
+        The embed value for the ``panel`` save method
+    ``data`` : str
+        "inline" to embed the data in the page, or "external" to write it into
+        separate data files, which requires ``out_file`` to be a file path
+    ``compress`` : bool
+        Whether to compress the inline scripts and data
+    ``resources_dir`` : str | os.PathLike
+        The directory which the inline resources are moved into, which requires
+        ``out_file`` to be a file path
+
+    Raises
+    ------
+    ``ValueError``
+        | When ``data`` is "external" and ``out_file`` is not a file path
+        | **OR**
+        | When ``resources_dir`` is given and ``out_file`` is not a file path
+        | **OR**
+        | When the rendered page does not contain ``EMBED_ITEMS_CALL`` , which is
+          replaced to load the external or compressed data
+
+    |
+    """
+    page, docs_json = render_player_page(
+        player_panel,
+        title,
+        resources,
+        embed_states=embed and has_python_widgets(player_panel),
+    )
+    docs_jsons = [docs_json]
+
+    store_data: Optional[Callable[[bytes, str], Optional[Dict[str, str]]]] = None
+    if data == "external":
+        if not isinstance(out_file, (str, os.PathLike)):
+            raise ValueError(
+                "``data='external'`` requires ``out_file`` to be a file path, the data files are written next to it"
+            )
+        out_path = os.fspath(out_file)
+        stem = os.path.splitext(os.path.basename(out_path))[0]
+        store_data = create_data_file_writer(
+            os.path.join(os.path.dirname(out_path), f"{stem}_files"),
+            f"{quote(stem)}_files/",
+        )
+    elif compress:
+        store_data = compress_data
+
+    if store_data is not None:
+        if EMBED_ITEMS_CALL not in page:
+            raise ValueError(
+                f"The rendered page does not contain ``{EMBED_ITEMS_CALL}`` , so it cannot load the stored data, which may be caused by an unsupported Bokeh version"
+            )
+        docs_jsons = [replace_data(docs_json, store_data) for docs_json in docs_jsons]
+        page = page.replace(EMBED_ITEMS_CALL, LOAD_DATA_CALL)
+
+    if resources_dir is not None:
+        page = bundle_page_scripts(
+            page, create_resources_writer(out_file, resources_dir)
+        )
+
+    if compress:
+        page = compress_page_scripts(page, docs_jsons)
+
+    if isinstance(out_file, (str, os.PathLike)):
+        with open(out_file, mode="w", encoding="utf-8") as file:
+            write_page_pieces(file.write, page, docs_jsons, compress)
+    elif isinstance(out_file, (BufferedIOBase, RawIOBase)):
+        write_page_pieces(
+            lambda text: out_file.write(text.encode("utf-8")),  # pyright: ignore[reportAttributeAccessIssue]
+            page,
+            docs_jsons,
+            compress,
+        )
+    else:
+        write_page_pieces(out_file.write, page, docs_jsons, compress)
+
+
+def replace_data(
+    docs_json: Any, store_data: Callable[[bytes, str], Optional[Dict[str, str]]]
+) -> Any:
+    """
+    | Replaces the large data buffers, and the audio and image data URIs, of a serialized document with references to where ``store_data`` stored them.
+
+    | A data buffer is replaced with ``{"type": "bytes", "data": stored}`` , and a data
+      URI with the URL of the stored file, or with
+      ``{"type": "waloviz_file", "mime_type": ..., "data": stored}`` .
+      The page loads them with ``LOAD_DATA_CALL`` before embedding the documents.
+
+    Parameters
+    ----------
+    ``docs_json`` : Any
+        The serialized documents, as passed to ``serialize_json``
+    ``store_data`` : Callable[[bytes, str], Optional[Dict[str, str]]]
+        Stores the content of a data buffer or a file, given its MIME type,
+        and returns ``{"url": ...}`` or ``{"deflated": ...}`` , or None to keep it as is
+
+    Returns
+    -------
+    ``docs_json`` : Any
+        The serialized documents, with the stored data replaced
+
+    |
+    """
+    buffers: Dict[str, Union[bytes, memoryview]] = {}
+    if isinstance(docs_json, Serialized):
+        buffers = {buffer.id: buffer.data for buffer in docs_json.buffers or []}
+        docs_json = docs_json.content
+
+    def replace_bytes(obj: Dict[str, Any]) -> Dict[str, Any]:
+        content = obj["data"]
+        if isinstance(content, str):
+            content = b64decode(content)
+        elif isinstance(content, Buffer):
+            content = bytes(content.data)
+        else:
+            content = bytes(buffers[content["id"]])
+        stored = None
+        if len(content) >= STORED_DATA_MIN_SIZE:
+            stored = store_data(content, "application/octet-stream")
+        if stored is None:
+            return dict(type="bytes", data=b64encode(content).decode("ascii"))
+        return dict(type="bytes", data=stored)
+
+    def replace_data_uri(data_uri: str) -> Any:
+        header, content = data_uri.split(",", 1)
+        mime_type = header[len("data:") :].split(";")[0]
+        stored = store_data(b64decode(content), mime_type)
+        if stored is None:
+            return data_uri
+        # Files are loaded by the browser from their URL, so they are not fetched up front
+        if "url" in stored:
+            return stored["url"]
+        return dict(type="waloviz_file", mime_type=mime_type, data=stored)
+
+    def replace(obj: Any) -> Any:
+        if isinstance(obj, dict):
+            if obj.get("type") == "bytes":
+                return replace_bytes(obj)
+            return {key: replace(value) for key, value in obj.items()}
+        if isinstance(obj, (list, tuple)):
+            return type(obj)(replace(value) for value in obj)
+        if (
+            isinstance(obj, str)
+            and obj.startswith(("data:audio/", "data:image/"))
+            and (len(obj) >= STORED_DATA_MIN_SIZE)
+        ):
+            return replace_data_uri(obj)
+        return obj
+
+    return replace(docs_json)
+
+
+def create_resources_writer(
+    out_file: IOLike, resources_dir: Union[str, os.PathLike]
+) -> Callable[[bytes, str], Dict[str, str]]:
+    """
+    | Creates a data file writer for :ref:`bundle_page_scripts <waloviz._panel_manipulation.bundle_page_scripts>` , which writes the resources into the ``resources_dir`` .
+
+    Parameters
+    ----------
+    ``out_file`` : str | os.PathLike | IO
+        The output file path of the page
+    ``resources_dir`` : str | os.PathLike
+        The directory which the resources are written into
+
+    Returns
+    -------
+    ``write_data_file`` : Callable[[bytes, str], Dict[str, str]]
+        Writes a resource file, and returns ``{"url": ...}`` relative to the page
+
+    Raises
+    ------
+    ``ValueError``
+        When ``out_file`` is not a file path
+
+    |
+    """
+    if not isinstance(out_file, (str, os.PathLike)):
+        raise ValueError(
+            "``resources_dir`` requires ``out_file`` to be a file path, the page refers to the resources relative to it"
+        )
+    resources_url = os.path.relpath(
+        resources_dir, os.path.dirname(os.path.abspath(out_file))
+    )
+    return create_data_file_writer(
+        os.fspath(resources_dir), f"{quote(Path(resources_url).as_posix())}/"
+    )
+
+
+def create_data_file_writer(
+    data_dir: str, url_prefix: str
+) -> Callable[[bytes, str], Dict[str, str]]:
+    """
+    | Creates a ``store_data`` function for :ref:`replace_data <waloviz._panel_manipulation.replace_data>` , which writes the data into files named by their content hash.
+
+    Parameters
+    ----------
+    ``data_dir`` : str
+        The directory which the data files are written into
+    ``url_prefix`` : str
+        The URL of ``data_dir`` , relative to the page
+
+    Returns
+    -------
+    ``write_data_file`` : Callable[[bytes, str], Dict[str, str]]
+        Writes a data file, and returns ``{"url": ...}``
+
+    |
+    """
+
+    def write_data_file(content: bytes, mime_type: str) -> Dict[str, str]:
+        extension = DATA_FILE_EXTENSIONS.get(mime_type, ".bin")
+        name = f"{hashlib.sha1(content).hexdigest()[:16]}{extension}"
+        path = os.path.join(data_dir, name)
+        if not os.path.exists(path):
+            os.makedirs(data_dir, exist_ok=True)
+            # Written into a temporary file of this process and thread, and renamed
+            # into place, so concurrent exports never write into, or read, a partial file
+            temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_path, mode="wb") as file:
+                file.write(content)
+            os.replace(temp_path, path)
+        return dict(url=f"{url_prefix}{name}")
+
+    return write_data_file
+
+
+def compress_data(content: bytes, mime_type: str) -> Optional[Dict[str, str]]:  # noqa: ARG001
+    """
+    | A ``store_data`` function for :ref:`replace_data <waloviz._panel_manipulation.replace_data>` , which deflates the data, unless it does not compress.
+
+    Parameters
+    ----------
+    ``content`` : bytes
+        The data buffer or audio file
+    ``mime_type`` : str
+        The MIME type of ``content``
+
+    Returns
+    -------
+    ``stored`` : Optional[Dict[str, str]]
+        ``{"deflated": ...}`` with the base64 zlib stream of ``content`` ,
+        or None when it is not smaller than ``content``
+
+    |
+    """
+    compressed = zlib.compress(content)
+    if len(compressed) >= len(content):
+        return None
+    return dict(deflated=b64encode(compressed).decode("ascii"))
+
+
+def bundle_page_scripts(
+    page: str, write_data_file: Callable[[bytes, str], Dict[str, str]]
+) -> str:
+    """
+    | Moves the large inline scripts of the page, which are the Bokeh and ``panel`` resources, into script files.
+
+    | The script which embeds the documents holds their placeholders, and stays inline.
+
+    Parameters
+    ----------
+    ``page`` : str
+        The rendered page, with document JSON placeholders
+    ``write_data_file`` : Callable[[bytes, str], Dict[str, str]]
+        Writes a script file, see :ref:`create_data_file_writer <waloviz._panel_manipulation.create_data_file_writer>`
+
+    Returns
+    -------
+    ``page`` : str
+        The page, which loads the moved scripts from their files
+
+    |
+    """
+
+    def bundle_script(match: re.Match) -> str:
+        code = match.group(1)
+        if (len(code) < STORED_DATA_MIN_SIZE) or (DOCS_JSON_PLACEHOLDER in code):
+            return match.group(0)
+        url = write_data_file(code.encode("utf-8"), "text/javascript")["url"]
+        return f'<script type="text/javascript" src="{escape(url)}"></script>'
+
+    return re.sub(
+        r'<script type="text/javascript">(.*?)</script>',
+        bundle_script,
+        page,
+        flags=re.DOTALL,
+    )
+
+
+def compress_page_scripts(page: str, docs_jsons: List[Any]) -> str:
+    """
+    | Deflates the inline scripts of the page, the Bokeh and ``panel`` resources included, which are decompressed and run in order by ``DECOMPRESS_SCRIPTS_JS`` .
+
+    | Placeholders inside of the compressed scripts are filled in before they are
+      compressed, while the document JSON scripts are only marked as compressed,
+      and their JSON is compressed as it is written, see
+      :ref:`write_page_pieces <waloviz._panel_manipulation.write_page_pieces>`
+
+    Parameters
+    ----------
+    ``page`` : str
+        The rendered page, with document JSON placeholders
+    ``docs_jsons`` : List[Any]
+        The serialized documents, in the order of their placeholders
+
+    Returns
+    -------
+    ``page`` : str
+        The page with compressed inline scripts
+
+    |
+    """
+
+    def fill_placeholder(match: re.Match) -> str:
+        return "".join(iterencode_docs_json(docs_jsons[int(match.group(1))]))
+
+    def compress_script(match: re.Match) -> str:
+        code = re.sub(
+            rf"{DOCS_JSON_PLACEHOLDER}(\d+)__", fill_placeholder, match.group(1)
+        )
+        code = b64encode(zlib.compress(code.encode("utf-8"))).decode("ascii")
+        return f'<script type="{COMPRESSED_SCRIPT_TYPE}" data-type="text/javascript">{code}</script>'
+
+    def mark_docs_json(match: re.Match) -> str:
+        return (
+            f'<script type="{COMPRESSED_SCRIPT_TYPE}" data-type="application/json" id="{match.group(1)}">'
+            f"{match.group(2)}</script>"
+        )
+
+    page = re.sub(
+        r'<script type="text/javascript">(.*?)</script>',
+        compress_script,
+        page,
+        flags=re.DOTALL,
+    )
+    page = re.sub(
+        rf'<script type="application/json" id="([^"]*)">\s*({DOCS_JSON_PLACEHOLDER}\d+__)\s*</script>',
+        mark_docs_json,
+        page,
+    )
+    body_end = page.rindex("</body>")
+    return (
+        f'{page[:body_end]}<script type="text/javascript">{DECOMPRESS_SCRIPTS_JS}</script>\n'
+        f"{page[body_end:]}"
+    )
+
+
+def has_python_widgets(player_panel: pn.viewable.Viewable) -> bool:
+    """
+    | Checks whether the player contains widgets whose state must be embedded by ``panel`` , the player itself has none.
+
+    Parameters
+    ----------
+    ``player_panel`` : pn.viewable.Viewable
+        The player created by ``wv.Audio`` , without the download button
+
+    Returns
+    -------
+    ``has_python_widgets`` : bool
+
+    |
+    """
+    return len(pn.panel(player_panel).select(pn.widgets.Widget)) > 0
+
+
+def render_player_page(
+    player_panel: pn.viewable.Viewable,
+    title: Optional[str],
+    resources: Resources = INLINE,
+    embed_states: bool = False,
+) -> Tuple[str, Any]:
+    """
+    | Renders the Bokeh document of the player into a standalone HTML page, with a placeholder instead of its document JSON, without the ``panel`` save method.
+
+    | The placeholder is passed to Bokeh as the document JSON, which renders it as a
+      JSON string, and it is then unquoted. Nothing global is patched, so pages can
+      be rendered concurrently.
+    | With ``embed_states`` the states of the Python widgets are embedded the same
+      way as the ``panel`` save method does it.
+
+    Parameters
+    ----------
+    ``player_panel`` : pn.viewable.Viewable
+        The player created by ``wv.Audio`` , without the download button
+    ``title`` : str
+        The html title
+    ``resources`` : bokeh.resources.Resources
+        The Bokeh resources, extended with the ``panel`` resources
+    ``embed_states`` : bool
+        Whether to embed the states of the Python widgets
+
+    Returns
+    -------
+    ``page`` : str
+        The HTML page, with ``DOCS_JSON_PLACEHOLDER`` in place of the document JSON
+    ``docs_json`` : Any
+        The serialized document, see :ref:`write_page_pieces <waloviz._panel_manipulation.write_page_pieces>`
+
+    |
+    """
+    doc = Document()
+    viewable = pn.panel(player_panel)
+    if embed_states:
+        with pn.config.set(embed=True):
+            root = viewable.get_root(doc, Comm())
+            embed_state(viewable, root, doc)
+    else:
+        root = viewable.get_root(doc)
+        # Marks the root the same way the ``panel`` state embedding does
+        root.tags.append("embedded")
+        add_to_doc(root, doc, True)
+
+    placeholder = f"{DOCS_JSON_PLACEHOLDER}0__"
+    panel_resources = PanelResources.from_bokeh(resources, absolute=True)
+    with set_resource_mode(panel_resources), OutputDocumentFor(doc.roots):
+        docs_json, render_items = standalone_docs_json_and_render_items(
+            doc.roots, suppress_callback_warning=True
+        )
+        page = html_page_for_render_items(
+            bundle_resources(doc.roots, panel_resources),
+            placeholder,  # pyright: ignore[reportArgumentType]
+            render_items,
+            title=title or "Panel",
+            template=BASE_TEMPLATE,
+            template_variables=dict(dist_url=CDN_DIST),
+        )
+    return page.replace(f'"{placeholder}"', placeholder), docs_json
+
+
+def write_page_pieces(
+    write: Callable[[str], Any],
+    page: str,
+    docs_jsons: List[Any],
+    compress: bool = False,
+) -> None:
+    """
+    | Writes a page rendered with document JSON placeholders, streaming the escaped JSON of each document in place of its placeholder.
+
+    Parameters
+    ----------
+    ``write`` : Callable[[str], Any]
+        Writes a piece of text to the output
+    ``page`` : str
+        The rendered page, with placeholders instead of the document JSONs
+    ``docs_jsons`` : List[Any]
+        The serialized documents, in the order of their placeholders
+    ``compress`` : bool
+        Whether to write the escaped JSON as a base64 zlib stream instead, see
+        :ref:`compress_page_scripts <waloviz._panel_manipulation.compress_page_scripts>`
+
+    |
+    """
+    pieces = page.split(DOCS_JSON_PLACEHOLDER)
+    write(pieces[0])
+    for piece in pieces[1:]:
+        index, rest = piece.split("__", 1)
+        chunks = iterencode_docs_json(docs_jsons[int(index)])
+        # Escaped either way, the page unescapes the JSON text of its script before parsing it
+        escaped_chunks = (escape(chunk, quote=False) for chunk in chunks)
+        if compress:
+            write_compressed(write, escaped_chunks)
+        else:
+            for chunk in escaped_chunks:
+                write(chunk)
+        write(rest)
+
+
+def iterencode_docs_json(docs_json: Any) -> Iterator[str]:
+    """
+    | Encodes a serialized document into JSON in pieces, the same way ``serialize_json`` does, one base64 data buffer at a time.
+
+    Parameters
+    ----------
+    ``docs_json`` : Any
+        The serialized documents, as passed to ``serialize_json``
+
+    Returns
+    -------
+    ``chunks`` : Iterator[str]
+        The pieces of the JSON
+
+    |
+    """
+    if isinstance(docs_json, Serialized):
+        content, buffers = docs_json.content, docs_json.buffers or []
+    else:
+        content, buffers = docs_json, []
+    encoder = PayloadEncoder(buffers=buffers, separators=(",", ":"))
+    return encoder.iterencode(content)
+
+
+def write_compressed(write: Callable[[str], Any], chunks: Iterable[str]) -> None:
+    """
+    | Writes the base64 of the zlib stream of ``chunks`` , compressing them one at a time.
+
+    Parameters
+    ----------
+    ``write`` : Callable[[str], Any]
+        Writes a piece of text to the output
+    ``chunks`` : Iterable[str]
+        The text to compress, in pieces
+
+    |
+    """
+    compressor = zlib.compressobj()
+    pending = b""
+    for chunk in chunks:
+        pending += compressor.compress(chunk.encode("utf-8"))
+        # Every 3 bytes are encoded separately in base64, so the pieces can be concatenated
+        size = len(pending) - len(pending) % 3
+        if size > 0:
+            write(b64encode(pending[:size]).decode("ascii"))
+            pending = pending[size:]
+    write(b64encode(pending + compressor.flush()).decode("ascii"))
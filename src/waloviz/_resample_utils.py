@@ -0,0 +1,155 @@
+import math
+from functools import lru_cache
+from typing import Optional
+
+import torch
+import torchaudio.transforms as T
+
+from ._tensor_utils import convert_audio_dtype
+
+# The amount of input samples resampled at once, longer signals are resampled in chunks,
+# the peak memory of a single chunk is roughly ``channels * RESAMPLE_CHUNK_SIZE`` values
+RESAMPLE_CHUNK_SIZE = 2**20
+
+
+@lru_cache(maxsize=16)
+def create_resampler(
+    source_sr: int, target_sr: int, dtype: Optional[torch.dtype] = None
+) -> T.Resample:
+    """
+    | Creates a ``torchaudio`` resampler, cached so that the windowed sinc kernel is computed only once per pair of sample rates.
+
+    | The kernel is a polyphase filterbank, the sample rates are reduced by their
+      greatest common divisor and each of the ``target_sr // gcd`` output phases has
+      its own filter, so integer ratios such as 48000 to 16000 use a single short filter.
+
+    Parameters
+    ----------
+    ``source_sr`` : int
+        The sample rate of the input audio
+    ``target_sr`` : int
+        The sample rate of the resampled audio
+    ``dtype`` : torch.dtype
+        The dtype of the kernel, should match the dtype of the resampled audio
+
+    Returns
+    -------
+    ``resampler`` : T.Resample
+        A resampler with a precomputed kernel, it must not be modified
+
+    |
+    """
+    return T.Resample(source_sr, target_sr, dtype=dtype)
+
+
+def resample(
+    wav: torch.Tensor,
+    source_sr: int,
+    target_sr: int,
+    chunk_size: int = RESAMPLE_CHUNK_SIZE,
+    dtype: Optional[torch.dtype] = None,
+) -> torch.Tensor:
+    """
+    | Resamples ``wav`` from ``source_sr`` to ``target_sr`` , with a cached kernel, in chunks when ``wav`` is longer than ``chunk_size`` .
+
+    | The result equals ``T.Resample(source_sr, target_sr)(wav)`` up to floating point rounding.
+
+    Parameters
+    ----------
+    ``wav`` : torch.Tensor
+        An audio tensor, with time as the last dimension
+    ``source_sr`` : int
+        The sample rate of ``wav``
+    ``target_sr`` : int
+        The sample rate of the result
+    ``chunk_size`` : int
+        The maximum amount of input samples resampled at once
+    ``dtype`` : torch.dtype
+        The floating point dtype of the result, ``wav`` is converted to it chunk
+        by chunk, see :ref:`convert_audio_dtype <waloviz._tensor_utils.convert_audio_dtype>`
+
+    Returns
+    -------
+    ``wav`` : torch.Tensor
+        The resampled audio tensor
+
+    |
+    """
+    if source_sr == target_sr:
+        return wav
+
+    if dtype is None:
+        dtype = wav.dtype if torch.is_floating_point(wav) else torch.get_default_dtype()
+
+    resampler = create_resampler(source_sr, target_sr, dtype)
+    if wav.shape[-1] <= chunk_size:
+        return resampler(convert_audio_dtype(wav, dtype))
+    return resample_chunked(wav, resampler, chunk_size)
+
+
+def resample_chunked(
+    wav: torch.Tensor,
+    resampler: T.Resample,
+    chunk_size: int = RESAMPLE_CHUNK_SIZE,
+) -> torch.Tensor:
+    """
+    | Applies the kernel of the ``resampler`` to ``wav`` chunk by chunk, writing each chunk straight into the output.
+
+    | Each chunk is a whole number of kernel strides, and it reads the neighbouring
+      samples it needs from ``wav`` , so the result equals resampling
+      the whole ``wav`` at once, while the peak memory does not depend on its length.
+
+    Parameters
+    ----------
+    ``wav`` : torch.Tensor
+        An audio tensor, with time as the last dimension, each chunk is converted
+        to the dtype of the ``resampler`` kernel
+    ``resampler`` : T.Resample
+        A resampler, see :ref:`create_resampler <waloviz._resample_utils.create_resampler>`
+    ``chunk_size`` : int
+        The approximate amount of input samples resampled at once
+
+    Returns
+    -------
+    ``wav`` : torch.Tensor
+        The resampled audio tensor
+
+    |
+    """
+    orig_freq = resampler.orig_freq // resampler.gcd
+    new_freq = resampler.new_freq // resampler.gcd
+    width = resampler.width
+    kernel: torch.Tensor = resampler.kernel  # pyright: ignore[reportAssignmentType]
+    kernel_size = kernel.shape[-1]
+
+    shape = wav.shape
+    wav = wav.reshape(-1, shape[-1])
+    length = shape[-1]
+    target_length = math.ceil(new_freq * length / orig_freq)
+
+    # The strides of the kernel over the padded ``wav`` , each produces ``new_freq`` samples
+    strides = length // orig_freq + 1
+    chunk_strides = max(chunk_size // orig_freq, 1)
+
+    resampled = kernel.new_empty((wav.shape[0], target_length))
+    for start_stride in range(0, strides, chunk_strides):
+        end_stride = min(start_stride + chunk_strides, strides)
+
+        # The range in ``wav`` , which is conceptually padded by ``width`` on the left
+        start = start_stride * orig_freq - width
+        end = (end_stride - 1) * orig_freq + kernel_size - width
+        segment = convert_audio_dtype(
+            wav[:, max(start, 0) : min(end, length)], kernel.dtype
+        )
+        segment = torch.nn.functional.pad(
+            segment, (max(-start, 0), max(end - length, 0))
+        )
+
+        chunk = torch.nn.functional.conv1d(segment[:, None], kernel, stride=orig_freq)
+        chunk = chunk.transpose(1, 2).reshape(wav.shape[0], -1)
+
+        start_sample = start_stride * new_freq
+        end_sample = min(end_stride * new_freq, target_length)
+        resampled[:, start_sample:end_sample] = chunk[:, : end_sample - start_sample]
+
+    return resampled.view(shape[:-1] + resampled.shape[-1:])
@@ -0,0 +1,854 @@
+import math
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple, Union
+
+import torch
+import torchaudio.transforms as T
+
+from ._tensor_utils import (
+    DECIMATIONS,
+    calculate_skip_step,
+    convert_audio_dtype,
+    decimate_by_step,
+    skip_to_size,
+    to_tensor,
+)
+
+# The available strategies for computing the spectrogram, see ``compute_spectrogram``
+STFT_MODES = ["budget", "full", "streaming"]
+
+# The amount of displayed frames computed at once in "streaming" mode, the peak memory
+# of a single chunk is roughly ``channels * STREAMING_CHUNK_FRAMES * n_fft`` values
+STREAMING_CHUNK_FRAMES = 256
+
+# The available frequency axis scales, see ``create_frequency_warp``
+FREQ_SCALES = ["linear", "log", "mel"]
+
+# The default amount of frequency bins of a "log" or "mel" spectrogram
+DEFAULT_WARPED_FREQ_BINS = 128
+
+# The available color scales of the spectrogram, see ``Audio``
+COLOR_SCALES = ["log", "db"]
+
+
+def compute_spectrogram(
+    wav: torch.Tensor,
+    n_fft: int,
+    hop_length: int,
+    max_size: int,
+    stft_mode: str = "budget",
+    chunk_frames: int = STREAMING_CHUNK_FRAMES,
+    stft_workers: Optional[int] = None,
+    decimation: str = "skip",
+    freq_bins: Optional[Tuple[int, int, int]] = None,
+    freq_warp: Optional[torch.Tensor] = None,
+    dtype: Optional[torch.dtype] = None,
+) -> torch.Tensor:
+    """
+    | Computes the power spectrogram of ``wav`` , reduced to at most ``max_size`` frames along the time dimension.
+
+    | With ``stft_mode="budget"`` only the frames which survive ``skip_to_size`` are
+      computed, by multiplying the ``hop_length`` by the skip step up front. The
+      result is identical to ``stft_mode="full"`` , which computes all of the frames
+      and only then skips most of them.
+    | With ``stft_mode="streaming"`` the displayed frames are computed in chunks of
+      ``chunk_frames`` frames, each chunk reads only the samples it needs and is
+      written straight into the output, so the peak memory does not depend on the
+      length of ``wav`` .
+    | With ``stft_workers`` larger than 1 the frames are split into chunks which are
+      computed concurrently in a thread pool, in "streaming" mode those are the
+      ``chunk_frames`` chunks, otherwise the frames are split evenly between the workers.
+    | When ``decimation`` pools the frames ("max" or "mean"), every frame contributes
+      to the result, so "budget" mode computes all of them in chunks and pools each
+      chunk straight into the displayed frames, just like "streaming" mode.
+    | The frequency bins are cropped and pooled according to ``freq_bins`` , or warped
+      with ``freq_warp`` , before the time dimension is reduced, see
+      ``reduce_frequency_bins`` and ``warp_frequency_bins`` .
+    | When ``wav`` still has to be converted to ``dtype`` , for example integer PCM
+      from a memory-mapped file, it is always computed in chunks, each chunk is
+      converted on its own so only the pages of a single chunk are read at a time.
+
+    Parameters
+    ----------
+    ``wav`` : torch.Tensor
+        Loaded audio tensor, of shape ``(channels, samples)``
+    ``n_fft`` : int
+        Sets the ``n_fft`` of the torchaudio spectrogram
+    ``hop_length`` : int
+        Sets the ``hop_length`` of the torchaudio spectrogram
+    ``max_size`` : int
+        The maximum amount of frames allowed in the time axis
+    ``stft_mode`` : str
+        Either "budget", "full" or "streaming"
+    ``chunk_frames`` : int
+        The amount of frames computed at once in "streaming" mode
+    ``stft_workers`` : int
+        The amount of threads computing the spectrogram concurrently, the
+        default None computes it in the calling thread
+    ``decimation`` : str
+        How frames are reduced to the ``max_size`` , see :ref:`skip_to_size <waloviz._tensor_utils.skip_to_size>`.
+    ``freq_bins`` : (int, int, int)
+        The ``(start_bin, end_bin, freq_step)`` frequency bins to keep, as calculated
+        by ``calculate_frequency_bins`` , default None keeps all of them
+    ``freq_warp`` : torch.Tensor
+        A frequency warping matrix as created by ``create_frequency_warp`` , default
+        None keeps the linear frequency bins
+    ``dtype`` : torch.dtype
+        The floating point dtype of the computation, see :ref:`convert_audio_dtype <waloviz._tensor_utils.convert_audio_dtype>`,
+        default None keeps the dtype of ``wav``
+
+    Returns
+    -------
+    ``spec`` : torch.Tensor
+        The power spectrogram, of shape ``(channels, freq_bins, frames)``
+
+    Raises
+    ------
+    ``ValueError``
+        | When ``stft_mode`` is not one of the available options
+        | **OR**
+        | When ``stft_workers`` is smaller than 1
+        | **OR**
+        | When ``decimation`` is not one of the available options
+
+    |
+    """
+    if stft_mode not in STFT_MODES:
+        raise ValueError(
+            f"``stft_mode`` must be one of the available options: {STFT_MODES}, but was {stft_mode}"
+        )
+
+    if (stft_workers is not None) and (stft_workers < 1):
+        raise ValueError(f"``stft_workers`` must be at least 1, but was {stft_workers}")
+
+    if decimation not in DECIMATIONS:
+        raise ValueError(
+            f"``decimation`` must be one of the available options: {DECIMATIONS}, but was {decimation}"
+        )
+
+    if (stft_mode != "full") and (decimation == "skip"):
+        hop_length = calculate_display_hop_length(wav.shape[-1], hop_length, max_size)
+
+    # Always 1 when the ``hop_length`` was already set to the displayed frames
+    frames = calculate_frame_count(wav.shape[-1], hop_length)
+    step = calculate_skip_step(frames, max_size)
+
+    is_parallel = (stft_workers is not None) and (stft_workers > 1)
+    is_converted = (not torch.is_floating_point(wav)) or (
+        (dtype is not None) and (wav.dtype != dtype)
+    )
+    if (
+        (stft_mode == "streaming")
+        or is_parallel
+        or is_converted
+        or (step > 1 and stft_mode == "budget")
+    ):
+        if (stft_mode != "streaming") and is_parallel and (stft_workers is not None):
+            chunk_frames = -(-frames // stft_workers)
+        spec = compute_chunked_spectrogram(
+            wav,
+            n_fft,
+            hop_length,
+            chunk_frames,
+            step,
+            decimation,
+            stft_workers,
+            freq_bins,
+            freq_warp,
+            dtype,
+        )
+    else:
+        spec = T.Spectrogram(n_fft=n_fft, hop_length=hop_length)(wav)
+        spec = reduce_frequency_bins(spec, freq_bins, decimation)
+        spec = warp_frequency_bins(spec, freq_warp)
+
+    # Does nothing when the frames were already reduced
+    spec: torch.Tensor = skip_to_size(spec, max_size, decimation)  # pyright: ignore[reportAssignmentType]
+    return spec
+
+
+def calculate_frame_count(samples: int, hop_length: int) -> int:
+    """
+    | Calculates the amount of frames in a centered torchaudio spectrogram.
+
+    Parameters
+    ----------
+    ``samples`` : int
+        The amount of samples in the audio
+    ``hop_length`` : int
+        The ``hop_length`` of the spectrogram
+
+    Returns
+    -------
+    ``frames`` : int
+        The amount of frames in the time dimension of the spectrogram
+
+    |
+    """
+    return 1 + samples // hop_length
+
+
+def calculate_display_hop_length(samples: int, hop_length: int, max_size: int) -> int:
+    """
+    | Calculates a ``hop_length`` which yields exactly the frames that ``skip_to_size`` would have kept.
+
+    | Frame ``i`` of a centered spectrogram is centered around sample ``i * hop_length`` ,
+      so keeping every ``step`` -th frame is the same as hopping ``step * hop_length``
+      samples, and ``1 + samples // (step * hop_length)`` is exactly the amount of
+      frames which were kept.
+
+    Parameters
+    ----------
+    ``samples`` : int
+        The amount of samples in the audio
+    ``hop_length`` : int
+        The requested ``hop_length`` of the spectrogram
+    ``max_size`` : int
+        The maximum amount of frames allowed in the time axis
+
+    Returns
+    -------
+    ``display_hop_length`` : int
+        The effective ``hop_length`` of the displayed frames
+
+    |
+    """
+    frames = calculate_frame_count(samples, hop_length)
+    return hop_length * calculate_skip_step(frames, max_size)
+
+
+def compute_chunked_spectrogram(
+    wav: Any,
+    n_fft: int,
+    hop_length: int,
+    chunk_frames: int,
+    step: int = 1,
+    decimation: str = "skip",
+    workers: Optional[int] = None,
+    freq_bins: Optional[Tuple[int, int, int]] = None,
+    freq_warp: Optional[torch.Tensor] = None,
+    dtype: Optional[torch.dtype] = None,
+    start_frame: int = 0,
+    end_frame: Optional[int] = None,
+) -> torch.Tensor:
+    """
+    | Computes a power spectrogram chunk by chunk, identical to the torchaudio spectrogram.
+
+    | The chunks overlap in samples but never in frames, so stitching them back is a
+      plain copy into the output, see ``compute_spectrogram_frames`` .
+    | When ``step`` is larger than 1, every chunk is aligned to whole groups of ``step``
+      frames and is decimated before it is stitched, see ``decimate_by_step`` , so only
+      the decimated frames are ever kept in memory.
+
+    Parameters
+    ----------
+    ``wav`` : torch.Tensor | np.ndarray
+        Audio of shape ``(channels, samples)`` , only the samples of a single chunk
+        are converted to a tensor at any given time
+    ``n_fft`` : int
+        Sets the ``n_fft`` of the spectrogram
+    ``hop_length`` : int
+        Sets the ``hop_length`` of the spectrogram
+    ``chunk_frames`` : int
+        The amount of frames computed at once
+    ``step`` : int
+        The amount of frames reduced into each output frame
+    ``decimation`` : str
+        One of "skip", "max" or "mean"
+    ``workers`` : int
+        When larger than 1, the amount of threads computing chunks concurrently
+    ``freq_bins`` : (int, int, int)
+        The frequency bins to keep, see ``reduce_frequency_bins``
+    ``freq_warp`` : torch.Tensor
+        A frequency warping matrix, see ``warp_frequency_bins``
+    ``dtype`` : torch.dtype
+        The floating point dtype each chunk is converted to
+    ``start_frame`` : int
+        The first frame of the spectrogram to compute
+    ``end_frame`` : int
+        The frame after the last frame to compute, default None computes up to the
+        last frame of the audio
+
+    Returns
+    -------
+    ``spec`` : torch.Tensor
+        The power spectrogram frames ``[start_frame, end_frame)`` , of shape
+        ``(channels, freq_bins, ceil((end_frame - start_frame) / step))``
+
+    |
+    """
+    if end_frame is None:
+        end_frame = calculate_frame_count(wav.shape[-1], hop_length)
+    out_frames = -(-(end_frame - start_frame) // step)
+    chunk_out_frames = max(chunk_frames // step, 1)
+    out_starts = list(range(0, out_frames, chunk_out_frames))
+    out_ends = [min(start + chunk_out_frames, out_frames) for start in out_starts]
+
+    # "skip" keeps the first frame of every step, so only those frames are computed
+    frame_step = step if decimation == "skip" else 1
+
+    def compute_chunk(out_start: int, out_end: int) -> torch.Tensor:
+        spec_chunk = compute_spectrogram_frames(
+            wav,
+            n_fft,
+            hop_length,
+            start_frame + out_start * step,
+            min(start_frame + out_end * step, end_frame),
+            dtype,
+            frame_step,
+        )
+        spec_chunk = reduce_frequency_bins(spec_chunk, freq_bins, decimation)
+        spec_chunk = warp_frequency_bins(spec_chunk, freq_warp)
+        return decimate_by_step(spec_chunk, step // frame_step, decimation)
+
+    is_parallel = (workers is not None) and (workers > 1)
+    spec: Optional[torch.Tensor] = None
+    # torch releases the GIL while computing the FFTs, so threads are enough here
+    with ThreadPoolExecutor(max_workers=workers if is_parallel else 1) as executor:
+        mapper = executor.map if is_parallel else map
+        spec_chunks = mapper(compute_chunk, out_starts, out_ends)
+        for out_start, out_end, spec_chunk in zip(out_starts, out_ends, spec_chunks):
+            if spec is None:
+                spec = spec_chunk.new_empty((*spec_chunk.shape[:-1], out_frames))
+            spec[..., out_start:out_end] = spec_chunk
+
+    # ``frames`` is always at least 1
+    return spec  # pyright: ignore[reportReturnType]
+
+
+def compute_spectrogram_frames(
+    wav: Any,
+    n_fft: int,
+    hop_length: int,
+    start_frame: int,
+    end_frame: int,
+    dtype: Optional[torch.dtype] = None,
+    step: int = 1,
+) -> torch.Tensor:
+    """
+    | Computes the frames ``[start_frame, end_frame)`` of a centered torchaudio power spectrogram, reading only the samples those frames need.
+
+    | With ``step`` larger than 1 only every ``step`` -th frame from ``start_frame``
+      is computed, the same frames that "skip" decimation would keep.
+
+    | The torchaudio spectrogram reflect-pads ``n_fft // 2`` samples on both ends of the
+      whole audio, so the padding is applied here only when the frames actually reach
+      beyond the edges of the audio, which keeps the frames exact at the boundaries.
+    | The reflected samples are always read from the whole audio, so even a single
+      frame at an edge gets the same padding as in the torchaudio spectrogram.
+
+    Parameters
+    ----------
+    ``wav`` : torch.Tensor | np.ndarray
+        Audio of shape ``(channels, samples)``
+    ``n_fft`` : int
+        Sets the ``n_fft`` of the spectrogram
+    ``hop_length`` : int
+        Sets the ``hop_length`` of the spectrogram
+    ``start_frame`` : int
+        The first frame to compute
+    ``end_frame`` : int
+        The frame after the last frame to compute
+    ``dtype`` : torch.dtype
+        The floating point dtype the samples are converted to, default None keeps
+        floating point samples as is
+    ``step`` : int
+        The amount of frames between the computed frames
+
+    Returns
+    -------
+    ``spec`` : torch.Tensor
+        The power spectrogram frames, of shape
+        ``(channels, n_fft // 2 + 1, ceil((end_frame - start_frame) / step))``
+
+    |
+    """
+    samples = wav.shape[-1]
+    last_frame = start_frame + (end_frame - 1 - start_frame) // step * step
+    start = start_frame * hop_length - n_fft // 2
+    end = last_frame * hop_length - n_fft // 2 + n_fft
+
+    left_pad = max(-start, 0)
+    right_pad = max(end - samples, 0)
+    # Widened to include the samples reflected into the padding
+    read_start = max(min(start, samples - 1 - right_pad), 0)
+    read_end = min(max(end, left_pad + 1), samples)
+
+    segment: torch.Tensor = to_tensor(wav[..., read_start:read_end])  # pyright: ignore[reportAssignmentType]
+    segment = convert_audio_dtype(segment, dtype)
+    if (left_pad > 0) or (right_pad > 0):
+        segment = torch.nn.functional.pad(
+            segment[None, ...], (left_pad, right_pad), mode="reflect"
+        )[0]
+    offset = start + left_pad - read_start
+    segment = segment[..., offset : offset + end - start]
+
+    window = torch.hann_window(n_fft, dtype=segment.dtype)
+    spec = torch.stft(
+        segment,
+        n_fft=n_fft,
+        hop_length=hop_length * step,
+        window=window,
+        center=False,
+        return_complex=True,
+    )
+    return spec.abs().pow(2.0)
+
+
+def calculate_frequency_bins(
+    sr: int,
+    n_fft: int,
+    fmin: Optional[float] = None,
+    fmax: Optional[float] = None,
+    max_freq_bins: Optional[int] = None,
+) -> Tuple[int, int, int]:
+    """
+    | Calculates which frequency bins of the spectrogram are kept for display, and how many of them are pooled together.
+
+    | Only the bins with a center frequency between ``fmin`` and ``fmax`` are kept,
+      then every ``freq_step`` consecutive bins are pooled into one, so that at most
+      ``max_freq_bins`` bins remain.
+
+    Parameters
+    ----------
+    ``sr`` : int
+        Resolved sample-rate
+    ``n_fft`` : int
+        Sets the ``n_fft`` of the torchaudio spectrogram
+    ``fmin`` : float
+        The minimum displayed frequency, default None is 0
+    ``fmax`` : float
+        The maximum displayed frequency, default None is ``sr / 2``
+    ``max_freq_bins`` : int
+        The maximum amount of displayed frequency bins, default None is unlimited
+
+    Returns
+    -------
+    ``start_bin`` : int
+        The first kept frequency bin
+    ``end_bin`` : int
+        The frequency bin after the last kept bin
+    ``freq_step`` : int
+        The amount of frequency bins pooled together
+
+    Raises
+    ------
+    ``ValueError``
+        | When no frequency bin is between ``fmin`` and ``fmax``
+        | **OR**
+        | When ``max_freq_bins`` is smaller than 1
+
+    |
+    """
+    bins = n_fft // 2 + 1
+    bin_hz = sr / n_fft
+
+    start_bin = 0 if fmin is None else max(math.ceil(fmin / bin_hz), 0)
+    end_bin = bins if fmax is None else min(math.floor(fmax / bin_hz) + 1, bins)
+    if end_bin <= start_bin:
+        raise ValueError(
+            f"No frequency bin was found between ``fmin`` and ``fmax`` , {fmin} and {fmax}, the bins are {bin_hz}Hz apart"
+        )
+
+    if max_freq_bins is None:
+        return start_bin, end_bin, 1
+    if max_freq_bins < 1:
+        raise ValueError(
+            f"``max_freq_bins`` must be at least 1, but was {max_freq_bins}"
+        )
+    return start_bin, end_bin, calculate_skip_step(end_bin - start_bin, max_freq_bins)
+
+
+def reduce_frequency_bins(
+    spec: torch.Tensor, freq_bins: Optional[Tuple[int, int, int]], decimation: str
+) -> torch.Tensor:
+    """
+    | Crops the frequency dimension ( ``dim=-2`` ) of a spectrogram and pools its bins.
+
+    | The bins are pooled with "max" when ``decimation="max"`` , otherwise with "mean" ,
+      skipping frequency bins would hide narrow-band content.
+
+    Parameters
+    ----------
+    ``spec`` : torch.Tensor
+        A spectrogram of shape ``(channels, n_fft // 2 + 1, frames)``
+    ``freq_bins`` : (int, int, int)
+        The ``(start_bin, end_bin, freq_step)`` as calculated by ``calculate_frequency_bins`` ,
+        None keeps the ``spec`` as is
+    ``decimation`` : str
+        The ``decimation`` of the time dimension
+
+    Returns
+    -------
+    ``spec`` : torch.Tensor
+        The spectrogram of shape ``(channels, ceil((end_bin - start_bin) / freq_step), frames)``
+
+    |
+    """
+    if freq_bins is None:
+        return spec
+
+    start_bin, end_bin, freq_step = freq_bins
+    spec = spec[..., start_bin:end_bin, :]
+    freq_decimation = "max" if decimation == "max" else "mean"
+    spec = decimate_by_step(spec.transpose(-1, -2), freq_step, freq_decimation)
+    return spec.transpose(-1, -2)
+
+
+def hz_to_frequency_scale(
+    hz: Union[float, torch.Tensor], freq_scale: str
+) -> Union[float, torch.Tensor]:
+    """
+    | Converts frequencies in Hz to the units of the frequency axis in the given ``freq_scale`` .
+
+    | "log" is in octaves ( ``log2(hz)`` ) and "mel" is in HTK mels.
+
+    Parameters
+    ----------
+    ``hz`` : float | torch.Tensor
+        Frequencies in Hz
+    ``freq_scale`` : str
+        One of "linear", "log" or "mel"
+
+    Returns
+    -------
+    ``scaled`` : float | torch.Tensor
+        The frequencies in the ``freq_scale`` units
+
+    |
+    """
+    if freq_scale == "log":
+        if isinstance(hz, torch.Tensor):
+            return torch.log2(hz)
+        return math.log2(hz)
+    if freq_scale == "mel":
+        if isinstance(hz, torch.Tensor):
+            return 2595.0 * torch.log10(1.0 + hz / 700.0)
+        return 2595.0 * math.log10(1.0 + hz / 700.0)
+    return hz
+
+
+def frequency_scale_to_hz(scaled: torch.Tensor, freq_scale: str) -> torch.Tensor:
+    """
+    | The inverse of ``hz_to_frequency_scale`` .
+
+    Parameters
+    ----------
+    ``scaled`` : torch.Tensor
+        Frequencies in the ``freq_scale`` units
+    ``freq_scale`` : str
+        One of "linear", "log" or "mel"
+
+    Returns
+    -------
+    ``hz`` : torch.Tensor
+        The frequencies in Hz
+
+    |
+    """
+    if freq_scale == "log":
+        return torch.pow(2.0, scaled)
+    if freq_scale == "mel":
+        return 700.0 * (torch.pow(10.0, scaled / 2595.0) - 1.0)
+    return scaled
+
+
+def resolve_warped_frequency_grid(
+    freq_scale: str,
+    sr: int,
+    n_fft: int,
+    fmin: Optional[float],
+    fmax: Optional[float],
+    max_freq_bins: Optional[int],
+) -> Tuple[int, float, float]:
+    """
+    | Resolves the amount of bins and the default ``fmin`` and ``fmax`` of a "log" or "mel" spectrogram.
+
+    Parameters
+    ----------
+    ``freq_scale`` : str
+        Either "log" or "mel"
+    ``sr`` : int
+        Resolved sample-rate
+    ``n_fft`` : int
+        Sets the ``n_fft`` of the torchaudio spectrogram
+    ``fmin`` : float
+        User provided, default None is 0 for "mel" and the first non-zero frequency
+        bin for "log"
+    ``fmax`` : float
+        User provided, default None is ``sr / 2``
+    ``max_freq_bins`` : int
+        User provided, default None is ``DEFAULT_WARPED_FREQ_BINS``
+
+    Returns
+    -------
+    ``n_bins`` : int
+        Resolved
+    ``fmin`` : float
+        Resolved
+    ``fmax`` : float
+        Resolved
+
+    Raises
+    ------
+    ``ValueError``
+        | When ``freq_scale`` is not one of the available options
+        | **OR**
+        | When ``freq_scale="log"`` and ``fmin`` is not positive
+        | **OR**
+        | When ``fmax`` is not larger than ``fmin``
+        | **OR**
+        | When ``max_freq_bins`` is smaller than 1
+
+    |
+    """
+    if freq_scale not in FREQ_SCALES:
+        raise ValueError(
+            f"``freq_scale`` must be one of the available options: {FREQ_SCALES}, but was {freq_scale}"
+        )
+
+    if fmin is None:
+        fmin = sr / n_fft if freq_scale == "log" else 0.0
+    if fmax is None:
+        fmax = sr / 2
+    n_bins = DEFAULT_WARPED_FREQ_BINS if max_freq_bins is None else max_freq_bins
+
+    if (freq_scale == "log") and (fmin <= 0):
+        raise ValueError(
+            f"``fmin`` must be positive when ``freq_scale='log'`` , but was {fmin}"
+        )
+    if fmax <= fmin:
+        raise ValueError(f"``fmax`` must be larger than ``fmin`` , {fmax} <= {fmin}")
+    if n_bins < 1:
+        raise ValueError(f"``max_freq_bins`` must be at least 1, but was {n_bins}")
+    return n_bins, float(fmin), float(fmax)
+
+
+@lru_cache(maxsize=32)
+def create_frequency_warp(
+    freq_scale: str,
+    sr: int,
+    n_fft: int,
+    n_bins: int,
+    fmin: float,
+    fmax: float,
+) -> torch.Tensor:
+    """
+    | Creates a matrix which warps the linear frequency bins of a spectrogram onto ``n_bins`` bins that are equally spaced in the ``freq_scale`` .
+
+    | Each warped bin is a triangular filter, like in a mel filterbank, normalized to
+      average the power within its band. Bands that are narrower than the linear bins
+      would not capture any bin, so they are linearly interpolated from the nearest
+      bins instead.
+    | The matrices are cached, so repeated calls with the same arguments do not
+      rebuild them, the returned tensor must not be modified.
+
+    Parameters
+    ----------
+    ``freq_scale`` : str
+        Either "log" or "mel"
+    ``sr`` : int
+        Resolved sample-rate
+    ``n_fft`` : int
+        Sets the ``n_fft`` of the torchaudio spectrogram
+    ``n_bins`` : int
+        The amount of warped frequency bins
+    ``fmin`` : float
+        The frequency of the lower edge of the first warped bin
+    ``fmax`` : float
+        The frequency of the upper edge of the last warped bin
+
+    Returns
+    -------
+    ``freq_warp`` : torch.Tensor
+        A matrix of shape ``(n_bins, n_fft // 2 + 1)``
+
+    |
+    """
+    bin_hz = sr / n_fft
+    all_freqs = torch.arange(n_fft // 2 + 1, dtype=torch.float64) * bin_hz
+
+    scaled_edges = torch.linspace(
+        hz_to_frequency_scale(fmin, freq_scale),  # pyright: ignore[reportArgumentType]
+        hz_to_frequency_scale(fmax, freq_scale),  # pyright: ignore[reportArgumentType]
+        n_bins + 2,
+        dtype=torch.float64,
+    )
+    edges = frequency_scale_to_hz(scaled_edges, freq_scale)
+    centers = edges[1:-1]
+
+    slopes = edges[None, :] - all_freqs[:, None]
+    down_slopes = -slopes[:, :-2] / (edges[1:-1] - edges[:-2])
+    up_slopes = slopes[:, 2:] / (edges[2:] - edges[1:-1])
+    triangles = torch.clamp(torch.minimum(down_slopes, up_slopes), min=0.0)
+
+    interpolation = torch.clamp(
+        1.0 - (all_freqs[:, None] - centers[None, :]).abs() / bin_hz, min=0.0
+    )
+
+    freq_warp = torch.maximum(triangles, interpolation)
+    freq_warp = freq_warp / freq_warp.sum(dim=0, keepdim=True).clamp(min=1e-12)
+    return freq_warp.T.contiguous()
+
+
+def warp_frequency_bins(
+    spec: torch.Tensor, freq_warp: Optional[torch.Tensor]
+) -> torch.Tensor:
+    """
+    | Warps the frequency dimension ( ``dim=-2`` ) of a spectrogram with a matrix created by ``create_frequency_warp`` .
+
+    Parameters
+    ----------
+    ``spec`` : torch.Tensor
+        A spectrogram of shape ``(channels, n_fft // 2 + 1, frames)``
+    ``freq_warp`` : torch.Tensor
+        A matrix of shape ``(n_bins, n_fft // 2 + 1)`` , None keeps the ``spec`` as is
+
+    Returns
+    -------
+    ``spec`` : torch.Tensor
+        The spectrogram of shape ``(channels, n_bins, frames)``
+
+    |
+    """
+    if freq_warp is None:
+        return spec
+    return torch.matmul(freq_warp.to(spec.dtype), spec)
+
+
+def power_to_db(
+    spec: torch.Tensor, db_range: float, db_max: Optional[float] = None
+) -> Tuple[torch.Tensor, float, float]:
+    """
+    | Converts a power spectrogram to decibels in place, and clips it to ``db_range`` decibels below its maximum.
+
+    | The returned color bounds allow the spectrogram to be displayed with a linear
+      color mapper, instead of a log color mapper that scans all of the values in
+      the browser.
+
+    Parameters
+    ----------
+    ``spec`` : torch.Tensor
+        A power spectrogram, it is modified in place
+    ``db_range`` : float
+        The dynamic range to keep, in decibels
+    ``db_max`` : float
+        The upper color bound, for parts of a spectrogram which share the bounds of
+        the whole, default None is the maximum of ``spec``
+
+    Returns
+    -------
+    ``spec`` : torch.Tensor
+        The spectrogram in decibels
+    ``db_min`` : float
+        The lower color bound
+    ``db_max`` : float
+        The upper color bound
+
+    Raises
+    ------
+    ``ValueError``
+        When ``db_range`` is not positive
+
+    |
+    """
+    if db_range <= 0:
+        raise ValueError(f"``db_range`` must be positive, but was {db_range}")
+
+    spec = spec.clamp_(min=1e-10).log10_().mul_(10.0)
+    if db_max is None:
+        db_max = spec.max().item()
+    db_min = db_max - db_range
+    spec = spec.clamp_(min=db_min)
+    return spec, db_min, db_max
+
+
+def compute_spectrogram_tiles(
+    wav: torch.Tensor,
+    n_fft: int,
+    hop_length: int,
+    max_size: int,
+    levels: int,
+    chunk_frames: int = STREAMING_CHUNK_FRAMES,
+    stft_workers: Optional[int] = None,
+    decimation: str = "skip",
+    freq_bins: Optional[Tuple[int, int, int]] = None,
+    freq_warp: Optional[torch.Tensor] = None,
+    dtype: Optional[torch.dtype] = None,
+) -> List[List[Tuple[int, int, torch.Tensor]]]:
+    """
+    | Computes a pyramid of spectrogram tiles, where each level splits the tiles of the level above it in half, and each tile has up to ``max_size`` frames.
+
+    | The overview spectrogram is the level above the first, so the time resolution
+      of level ``i`` is ``2 ** i`` times finer than the overview, until every frame
+      of ``hop_length`` is displayed, no more levels are computed after that.
+    | Each tile is a half-open range of frames of the spectrogram of the whole of
+      ``wav`` , computed chunk by chunk with ``compute_chunked_spectrogram`` , so the
+      frames at the edges of a tile are the same as in the full spectrogram and no
+      frame is displayed by two neighbouring tiles.
+
+    Parameters
+    ----------
+    ``wav`` : torch.Tensor
+        Loaded audio tensor, of shape ``(channels, samples)``
+    ``n_fft`` : int
+        Sets the ``n_fft`` of the torchaudio spectrogram
+    ``hop_length`` : int
+        Sets the ``hop_length`` of the torchaudio spectrogram
+    ``max_size`` : int
+        The maximum amount of frames in the time axis of each tile
+    ``levels`` : int
+        The maximum amount of levels below the overview
+    ``chunk_frames`` : int
+        The amount of frames computed at once
+    ``stft_workers`` : int
+        The amount of threads computing each tile concurrently, the default None
+        computes it in the calling thread
+    ``decimation`` : str
+        How frames are reduced to the ``max_size`` , see :ref:`skip_to_size <waloviz._tensor_utils.skip_to_size>`.
+    ``freq_bins`` : (int, int, int)
+        The frequency bins to keep, see ``reduce_frequency_bins``
+    ``freq_warp`` : torch.Tensor
+        A frequency warping matrix, see ``warp_frequency_bins``
+    ``dtype`` : torch.dtype
+        The floating point dtype of the computation, default None keeps the dtype of ``wav``
+
+    Returns
+    -------
+    ``tiles`` : List[List[Tuple[int, int, torch.Tensor]]]
+        The ``(start_frame, end_frame, spec)`` tiles of each level, where ``spec`` is
+        the power spectrogram of the frames ``[start_frame, end_frame)``
+
+    |
+    """
+    frames = calculate_frame_count(wav.shape[-1], hop_length)
+    tiles = []
+    for level in range(levels):
+        if -(-frames // 2**level) <= max_size:
+            break
+        count = 2 ** (level + 1)
+        bounds = [frames * index // count for index in range(count + 1)]
+        level_tiles = []
+        for start_frame, end_frame in zip(bounds[:-1], bounds[1:]):
+            tile_frames = end_frame - start_frame
+            tile_chunk_frames = chunk_frames
+            if (stft_workers is not None) and (stft_workers > 1):
+                tile_chunk_frames = -(-tile_frames // stft_workers)
+            spec = compute_chunked_spectrogram(
+                wav,
+                n_fft,
+                hop_length,
+                tile_chunk_frames,
+                calculate_skip_step(tile_frames, max_size),
+                decimation,
+                stft_workers,
+                freq_bins,
+                freq_warp,
+                dtype,
+                start_frame,
+                end_frame,
+            )
+            level_tiles.append((start_frame, end_frame, spec))
+        tiles.append(level_tiles)
+    return tiles
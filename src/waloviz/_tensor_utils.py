@@ -1,3 +1,4 @@
+import warnings
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
@@ -8,6 +9,9 @@ OverCurve = Union[
     List[Any], Dict[str, Any], np.ndarray, torch.Tensor, Tuple[Any, Any], Any
 ]
 
+# The available ways to reduce the time dimension to the ``max_size`` , see ``decimate_by_step``
+DECIMATIONS = ["skip", "max", "mean"]
+
 
 def to_tensor(
     obj: Any,
@@ -15,6 +19,9 @@ def to_tensor(
     """
     | Given a hierarchical object recursively converts all leaf nodes into PyTorch tensors.
 
+    | NumPy arrays share their memory with the resulting tensors whenever PyTorch supports
+      their dtype and strides, other objects are copied.
+
     Parameters
     ----------
     ``obj`` : Any
@@ -30,9 +37,172 @@ def to_tensor(
     if isinstance(obj, Tuple):
         return tuple([to_tensor(sub) for sub in obj])
 
-    if not torch.is_tensor(obj):
-        obj = torch.tensor(obj)
-    return obj
+    if torch.is_tensor(obj):
+        return obj
+    if isinstance(obj, np.ndarray):
+        return numpy_to_tensor(obj)
+    return torch.as_tensor(obj)
+
+
+def numpy_to_tensor(array: np.ndarray) -> torch.Tensor:
+    """
+    | Wraps a NumPy array as a PyTorch tensor without copying, falling back to a copy only when PyTorch cannot view the array.
+
+    | Read-only arrays (for example from ``np.memmap`` ) are wrapped as well, the
+      resulting tensor must not be modified in place.
+
+    Parameters
+    ----------
+    ``array`` : np.ndarray
+        Any NumPy array
+
+    Returns
+    -------
+    ``tensor`` : torch.Tensor
+        A tensor, sharing memory with the ``array`` when possible
+
+    |
+    """
+    if any(stride < 0 for stride in array.strides):
+        # PyTorch does not support negative strides, e.g. ``array[::-1]``
+        array = np.ascontiguousarray(array)
+    try:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", message=".*not writable.*")
+            return torch.from_numpy(array)
+    except TypeError:
+        # Unsupported dtypes such as object arrays are copied
+        return torch.as_tensor(array.tolist())
+
+
+def convert_audio_dtype(
+    wav: torch.Tensor, dtype: Optional[torch.dtype]
+) -> torch.Tensor:
+    """
+    | Converts an audio tensor to the floating point ``dtype`` , integer PCM audio is also normalized to the range ``[-1, 1)`` .
+
+    | Integer audio is converted with a single cast followed by an in-place scaling,
+      so only one new tensor is allocated.
+
+    Parameters
+    ----------
+    ``wav`` : torch.Tensor
+        An audio tensor, either floating point or integer PCM
+    ``dtype`` : torch.dtype
+        The target floating point dtype, when None floating point audio keeps
+        its dtype and integer audio is converted to the default torch dtype
+
+    Returns
+    -------
+    ``wav`` : torch.Tensor
+        A floating point audio tensor
+
+    Raises
+    ------
+    ``ValueError``
+        | When ``dtype`` was not a floating point dtype
+
+    |
+    """
+    if (dtype is not None) and (not dtype.is_floating_point):
+        raise ValueError(f"The given ``dtype`` is not a floating point dtype: {dtype}")
+
+    if torch.is_floating_point(wav):
+        return wav if dtype is None else wav.to(dtype)
+
+    if dtype is None:
+        dtype = torch.get_default_dtype()
+    if wav.dtype == torch.uint8:
+        # 8 bit PCM is unsigned, centered around 128
+        return wav.to(dtype).sub_(128).div_(128)
+    return wav.to(dtype).div_(torch.iinfo(wav.dtype).max + 1)
+
+
+def quantize_audio(wav: torch.Tensor, dtype: torch.dtype) -> torch.Tensor:
+    """
+    | Quantizes an audio tensor into PCM of the integer ``dtype`` , with rounding and clipping.
+
+    Parameters
+    ----------
+    ``wav`` : torch.Tensor
+        An audio tensor, either floating point or integer PCM
+    ``dtype`` : torch.dtype
+        Either ``torch.int16`` or ``torch.uint8`` , the latter is unsigned
+        and centered around 128 like 8 bit WAV files
+
+    Returns
+    -------
+    ``wav`` : torch.Tensor
+        The quantized audio tensor
+
+    |
+    """
+    if wav.dtype == dtype:
+        return wav
+
+    wav = convert_audio_dtype(wav, None)
+    scale = 128 if dtype == torch.uint8 else torch.iinfo(dtype).max + 1
+    wav = (wav * scale).round_().clamp_(-scale, scale - 1)
+    if dtype == torch.uint8:
+        wav = wav.add_(128)
+    return wav.to(dtype)
+
+
+def convert_dtype(
+    tensor: Union[torch.Tensor, Tuple], dtype: Optional[torch.dtype]
+) -> Union[torch.Tensor, Tuple]:
+    """
+    | Given a hierarchical tensor object recursively converts all numeric leaf tensors to the ``dtype`` .
+
+    Parameters
+    ----------
+    ``tensor`` : torch.Tensor | (torch.Tensor, torch.Tensor)
+        A hierarchical tensor object
+    ``dtype`` : torch.dtype
+        The target dtype, when None the tensors are kept as is
+
+    Returns
+    -------
+    ``obj`` : torch.Tensor
+        A hierarchical tensor object with the ``dtype``
+
+    |
+    """
+    if isinstance(tensor, Tuple):
+        return tuple([convert_dtype(sub, dtype) for sub in tensor])
+
+    if (dtype is None) or (tensor.dtype == torch.bool):
+        return tensor
+    return tensor.to(dtype)
+
+
+def convert_curve_dtype(
+    sub_curve: Union[torch.Tensor, Tuple], dtype: Optional[torch.dtype]
+) -> Union[torch.Tensor, Tuple]:
+    """
+    | Converts the values of an overlaid curve to the ``dtype`` , while the time values of an ``(X,Y)`` tuple are converted to float64.
+
+    | The time values of hours long audio are too far apart in float32, neighbouring
+      points would merge, and they are small compared to the audio.
+
+    Parameters
+    ----------
+    ``sub_curve`` : torch.Tensor | (torch.Tensor, torch.Tensor)
+        A single overlaid curve
+    ``dtype`` : torch.dtype
+        The dtype of the curve values, when None the curve is kept as is
+
+    Returns
+    -------
+    ``sub_curve`` : torch.Tensor | (torch.Tensor, torch.Tensor)
+        The converted curve
+
+    |
+    """
+    if (dtype is not None) and isinstance(sub_curve, Tuple) and (len(sub_curve) == 2):
+        sub_x, sub_y = sub_curve
+        return convert_dtype(sub_x, torch.float64), convert_dtype(sub_y, dtype)
+    return convert_dtype(sub_curve, dtype)
 
 
 def broadcast_to_channels(
@@ -71,16 +241,17 @@ def broadcast_to_channels(
     if tensor.shape[0] > channels:
         raise ValueError("tensor was larger than the amount of channels")
 
-    while tensor.shape[0] < channels:
-        tensor = torch.cat([tensor, tensor], dim=0)
-    if tensor.shape[0] > channels:
-        tensor = tensor[:channels, ...]
+    if tensor.shape[0] == 1:
+        # A view, the single channel is not copied
+        tensor = tensor.expand(channels, *tensor.shape[1:])
+    elif tensor.shape[0] < channels:
+        tensor = tensor[torch.arange(channels) % tensor.shape[0]]
 
     return tensor
 
 
 def skip_to_size(
-    tensor: Union[torch.Tensor, Tuple], max_size: int
+    tensor: Union[torch.Tensor, Tuple], max_size: int, decimation: str = "skip"
 ) -> Union[torch.Tensor, Tuple]:
     """
     | Given a hierarchical tensor object skip equally spaced tensor values along the time dimension ( ``dim=-1`` ) to become lower than the ``max_size`` value.
@@ -88,6 +259,8 @@ def skip_to_size(
     | This helps with the responsiveness of the player and avoids errors at the
     | cost of losing information.
     | This is used for both the overlaid curves and the spectrogram itself.
+    | When ``decimation`` is "max" or "mean" each group of skipped values is pooled
+      instead, so short events are not lost, see ``decimate_by_step`` .
 
     Parameters
     ----------
@@ -95,6 +268,8 @@ def skip_to_size(
         A hierarchical tensor object with an unknown time size
     ``max_size`` : int
         The maximum allowed time dimension size
+    ``decimation`` : str
+        One of "skip", "max" or "mean"
 
     Returns
     -------
@@ -104,11 +279,93 @@ def skip_to_size(
     |
     """
     if isinstance(tensor, Tuple):
-        return tuple([skip_to_size(sub, max_size) for sub in tensor])
+        if (decimation != "skip") and (len(tensor) == 2):
+            # An ``(X, Y)`` over curve, the X coordinates are averaged to stay centered
+            sub_x, sub_y = tensor
+            return (
+                skip_to_size(sub_x, max_size, "mean"),
+                skip_to_size(sub_y, max_size, decimation),
+            )
+        return tuple([skip_to_size(sub, max_size, decimation) for sub in tensor])
 
-    if tensor.shape[-1] > max_size:
-        tensor = tensor[..., :: (tensor.shape[-1] // max_size) + 1]
-    return tensor
+    step = calculate_skip_step(tensor.shape[-1], max_size)
+    return decimate_by_step(tensor, step, decimation)
+
+
+def decimate_by_step(tensor: torch.Tensor, step: int, decimation: str) -> torch.Tensor:
+    """
+    | Reduces every group of ``step`` consecutive values along the time dimension ( ``dim=-1`` ) into a single value.
+
+    | "skip" keeps the first value of every group, "max" and "mean" pool the whole
+      group in a single vectorized operation. The last group may be partial, it is
+      reduced on its own so the amount of groups is always ``ceil(size / step)`` .
+
+    Parameters
+    ----------
+    ``tensor`` : torch.Tensor
+        A tensor with an unknown time size
+    ``step`` : int
+        The size of each group
+    ``decimation`` : str
+        One of "skip", "max" or "mean"
+
+    Returns
+    -------
+    ``tensor`` : torch.Tensor
+        The reduced tensor
+
+    Raises
+    ------
+    ``ValueError``
+        | When ``decimation`` is not one of the available options
+
+    |
+    """
+    if decimation not in DECIMATIONS:
+        raise ValueError(
+            f"``decimation`` must be one of the available options: {DECIMATIONS}, but was {decimation}"
+        )
+    if step <= 1:
+        return tensor
+    if decimation == "skip":
+        return tensor[..., ::step]
+
+    if decimation == "mean" and not torch.is_floating_point(tensor):
+        tensor = tensor.to(torch.get_default_dtype())
+    reduce = torch.amax if decimation == "max" else torch.mean
+
+    size = tensor.shape[-1]
+    full_size = size - (size % step)
+    reduced = reduce(
+        tensor[..., :full_size].reshape(*tensor.shape[:-1], -1, step), dim=-1
+    )
+    if full_size < size:
+        tail = reduce(tensor[..., full_size:], dim=-1, keepdim=True)
+        reduced = torch.cat([reduced, tail], dim=-1)
+    return reduced
+
+
+def calculate_skip_step(size: int, max_size: int) -> int:
+    """
+    | Calculates the step used by ``skip_to_size`` to reduce a time dimension of ``size`` values to at most ``max_size`` values.
+
+    Parameters
+    ----------
+    ``size`` : int
+        The original time dimension size
+    ``max_size`` : int
+        The maximum allowed time dimension size
+
+    Returns
+    -------
+    ``step`` : int
+        Every ``step`` -th value is kept, 1 when no skipping is needed
+
+    |
+    """
+    if size > max_size:
+        return (size // max_size) + 1
+    return 1
 
 
 def preprocess_over_curve(
@@ -121,6 +378,7 @@ def preprocess_over_curve(
     over_curve_axes: Optional[
         Union[str, List[Optional[str]], List[str], Dict[str, str]]
     ] = None,
+    dtype: Optional[torch.dtype] = torch.float32,
 ) -> Tuple[
     Optional[List[torch.Tensor]],
     Optional[List[str]],
@@ -146,6 +404,9 @@ def preprocess_over_curve(
         User provided
     ``over_curve_axes`` : List[str]
         User provided
+    ``dtype`` : torch.dtype
+        The dtype of the curves values, when None the curves keep their dtype,
+        see :ref:`convert_curve_dtype <waloviz._tensor_utils.convert_curve_dtype>`
 
     Returns
     -------
@@ -211,12 +472,18 @@ def preprocess_over_curve(
         ]
 
     over_curve = [
-        (sub_curve(wav, sr) if callable(sub_curve) else sub_curve)
+        (
+            sub_curve(convert_audio_dtype(wav, dtype), sr)
+            if callable(sub_curve)
+            else sub_curve
+        )
         for sub_curve in over_curve
     ]
 
     over_curve = [
-        broadcast_to_channels(to_tensor(sub_curve), channels)
+        broadcast_to_channels(
+            convert_curve_dtype(to_tensor(sub_curve), dtype), channels
+        )
         for sub_curve in over_curve
     ]
 
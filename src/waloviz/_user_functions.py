@@ -1,19 +1,38 @@
 import os
-from io import IOBase
-from typing import IO, Any, BinaryIO, Dict, List, Optional, Tuple, Union
+from io import BytesIO, IOBase
+from typing import IO, Any, BinaryIO, Dict, List, Optional, Tuple, Union, cast
 
 import holoviews as hv
 import numpy as np
 import panel as pn
+import soundfile
 import torch
 import torchaudio
-import torchaudio.transforms as T
 from bokeh.resources import INLINE, Resources
-
-from ._bokeh_manipulation import finalize_player_bokeh_gui, themes
+from scipy.io import wavfile
+
+from ._bokeh_manipulation import (
+    RASTER_MODES,
+    add_browser_spectrogram,
+    finalize_player_bokeh_gui,
+    themes,
+)
 from ._holoviews_manipulations import ThemeHook, get_player_hv
-from ._panel_manipulation import IOLike, save_player_panel, wrap_player_with_panel
-from ._tensor_utils import OverCurve, preprocess_over_curve, to_tensor
+from ._panel_manipulation import (
+    PLAYER_DTYPES,
+    IOLike,
+    create_audio_data_uri,
+    encode_playback_audio,
+    save_player_panel,
+    wrap_player_with_panel,
+)
+from ._resample_utils import resample
+from ._tensor_utils import (
+    OverCurve,
+    convert_audio_dtype,
+    preprocess_over_curve,
+    to_tensor,
+)
 
 FileLike = Union[str, os.PathLike, BinaryIO]
 AudioSource = Union[
@@ -74,6 +93,8 @@ def Audio(
     *args: Any,
     over_curve_names: Optional[Union[str, List[str]]] = None,
     sr: Optional[int] = None,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
     frame_ms: Optional[int] = None,
     n_fft: Optional[int] = None,
     hop_ms: Optional[int] = None,
@@ -90,6 +111,21 @@ def Audio(
     over_curve_colors: Optional[Union[str, List[Optional[str]], Dict[str, str]]] = None,
     theme: Union[str, Dict[str, Any]] = "dark_minimal",
     max_size: int = 10000,
+    stft_mode: str = "budget",
+    stft_workers: Optional[int] = None,
+    decimation: str = "skip",
+    fmin: Optional[float] = None,
+    fmax: Optional[float] = None,
+    max_freq_bins: Optional[int] = None,
+    freq_scale: str = "linear",
+    color_scale: str = "log",
+    db_range: float = 80.0,
+    raster: str = "image",
+    lod_levels: int = 0,
+    dtype: Optional[torch.dtype] = torch.float32,
+    mmap: bool = False,
+    playback_sr: Optional[int] = None,
+    playback_dtype: Optional[str] = None,
     download_button: bool = True,
     freq_label: Optional[str] = "Hz",
     over_curve_axes: Optional[
@@ -129,7 +165,10 @@ def Audio(
     Parameters
     ----------
     ``source`` : str | os.PathLike | IO | (tensorlike, int) | tensorlike
-        Either an audio file, or an audio tensor\\ndarray with a sample rate
+        Either an audio file, or an audio tensor\\ndarray with a sample rate.
+        Local WAV, MP3, OGG and FLAC files are embedded in the player as is,
+        unless ``sr`` , ``start`` , ``end`` , ``playback_sr`` or ``playback_dtype``
+        are given, and are decoded only for the spectrogram.
     ``over_curve`` : tensorlike | List[tensorlike] | Dict[str, tensorlike] | callable
         A single or multiple curves to be displayed over the spectrogram
     ``over_curve_names`` : str | List[str]
@@ -139,6 +178,14 @@ def Audio(
         the given ``sr`` value is assumed to be the source sample rate, when
         this value is different than the source sample rate, the source
         audio is resampled to the specified ``sr`` value.
+    ``start`` : float
+        The start of the displayed segment in seconds, the time axis is labeled
+        in absolute time, starting from it. File sources decode only the frames
+        of the segment. The ``over_curve`` should cover only the segment, and
+        callables are called with it. Default is None, the beginning of the source.
+    ``end`` : float
+        The end of the displayed segment in seconds, default is None, the end
+        of the source.
     ``frame_ms`` : float
         Sets the spectrogram frame length to the given amount of milliseconds,
         default is 100.0.
@@ -187,11 +234,104 @@ def Audio(
         When the spectrogram or one of the over curves contain many values,
         the plot's performance suffers. For that reason ``max_size`` limits the
         amount of displayed values, when the spectrogram or an over curve has
-        more values than the ``max_size`` , it is reduced in size by skipping
-        intermediate values, until the size is less than the ``max_size`` .
+        more values than the ``max_size`` , it is reduced in size according to
+        the ``decimation`` , until the size is less than the ``max_size`` .
         Default is 10000.
+    ``stft_mode`` : str
+        How the spectrogram is computed, can be one of "budget", "full" or
+        "streaming". "budget" computes only the frames that are displayed
+        according to the ``max_size`` , while "full" computes all of the frames
+        and then skips most of them. "streaming" computes the displayed frames
+        in small chunks, which keeps the memory usage bounded for very long
+        audio. All of them result in the same spectrogram. Default is "budget".
+    ``stft_workers`` : int
+        The amount of threads used to compute the spectrogram of long audio
+        concurrently, the audio is split into segments that are computed in
+        parallel and stitched back together into the same spectrogram.
+        Default is None, which computes the spectrogram in a single thread.
+    ``decimation`` : str
+        How values are reduced to fit the ``max_size`` , can be one of "skip",
+        "max" or "mean". "skip" keeps equally spaced values and skips the
+        intermediate values, "max" and "mean" pool each group of intermediate
+        values instead, so short events such as clicks and transients remain
+        visible. Default is "skip".
+    ``fmin`` : float
+        The minimum frequency of the spectrogram, lower frequencies are cropped
+        before the spectrogram is displayed. Default is None, which is 0.
+    ``fmax`` : float
+        The maximum frequency of the spectrogram, higher frequencies are cropped
+        before the spectrogram is displayed. Default is None, which is ``sr/2``.
+    ``max_freq_bins`` : int
+        Limits the amount of displayed frequency values, like ``max_size`` does
+        for the time dimension. Neighbouring frequency bins are pooled together,
+        with "max" when ``decimation="max"`` and with "mean" otherwise. Default
+        is None, which displays all of the frequency bins.
+    ``freq_scale`` : str
+        The scale of the frequency axis, can be one of "linear", "log" or "mel".
+        With "log" or "mel" the spectrogram is warped in Python onto
+        ``max_freq_bins`` bins (128 by default) that are equally spaced in
+        octaves or mels, between ``fmin`` and ``fmax`` , and the frequency axis
+        ticks are displayed in Hz. Over curves on the "Hz" axis are converted
+        to match. Default is "linear".
+    ``color_scale`` : str
+        How the spectrogram values are mapped to colors, can be either "log"
+        or "db". "log" sends the power spectrogram to the browser and maps it
+        with a log color mapper, "db" converts it to decibels in Python and
+        sends precomputed color bounds with a linear color mapper, which is
+        lighter for the browser. Default is "log".
+    ``db_range`` : float
+        The dynamic range in decibels displayed when ``color_scale="db"`` ,
+        values lower than the maximum minus ``db_range`` are clipped. Default
+        is 80.0.
+    ``raster`` : str
+        How the spectrogram is sent to the browser, can be one of "image", "png",
+        "uint8" or "uint16". "image" sends its floating point values, which the
+        browser maps to colors, "png" maps them to the colors of ``cmap`` in Python,
+        and sends a compressed PNG, which makes the saved html several times smaller
+        and displays faster. The PNG is interpolated smoothly when zoomed in.
+        "uint8" and "uint16" send the values quantized into levels between the
+        color bounds, 4 or 2 times smaller than float32, which the browser still
+        maps to colors, with "uint8" the colors are the same as with "image".
+        "browser" sends no spectrogram at all, the browser decodes the embedded audio
+        and computes the spectrogram in a Web Worker, with the same ``n_fft`` ,
+        ``hop_length`` , frequency bins and colors, and computes the visible range
+        again whenever it is zoomed, so the saved html is about the size of the audio.
+        It requires a browser with WebAudio, and ``stft_mode`` and ``dtype`` do not
+        apply to it. Default is "image".
+    ``lod_levels`` : int
+        The maximum amount of finer spectrogram levels, each with twice the time
+        resolution of the one above it, which are precomputed and embedded in tiles of
+        up to ``max_size`` frames. When zoomed in, the browser displays the tiles of
+        the matching level over the visible range, instead of the ``max_size``
+        overview. Levels which are finer than ``hop_length`` are not computed.
+        Default is 0, which embeds only the overview.
+    ``dtype`` : torch.dtype
+        The floating point dtype of the audio, spectrogram and over curves.
+        float64 values are downcast to it, and integer PCM audio is normalized
+        into it. When None, floating point values keep their original dtype.
+        Default is ``torch.float32`` which is the cheapest in time, memory
+        and size of the saved html.
+    ``mmap`` : bool
+        Memory-maps a WAV file ``source`` instead of reading it. Memory-mapped
+        sources, including ``np.memmap`` arrays, are never read as a whole when
+        their dtype is supported by the player (int16 or floating point), the
+        spectrogram then converts and reads them chunk by chunk. The original file
+        is then not embedded for playback, the decoded audio is. A callable
+        ``over_curve`` is still called with the whole audio converted to the
+        ``dtype`` , which reads the whole file into memory. Default is False.
+    ``playback_sr`` : int
+        The sample rate of the audio embedded for playback, independent of the
+        ``sr`` of the spectrogram, lower values make the saved html smaller.
+        Default is None, the ``sr`` .
+    ``playback_dtype`` : str
+        The quantization of the audio embedded for playback, either "int16" or
+        "uint8", the latter halves the size of the embedded audio. Default is
+        None, which keeps the original playback audio, the encoded file of a file
+        source or Panel's own encoding of a tensor, unless ``playback_sr`` is
+        given, in which case the resampled audio is quantized to "int16".
     ``download_button`` : bool
-        Whether to show the html download button. Defaults to True.
+        Whether to show the html download button, the html is generated only when
+        the button is clicked. Defaults to True.
     ``freq_label`` : str
         The label of the frequency axis (vertical), hides the label when set
         to None which saves space.
@@ -233,6 +373,44 @@ def Audio(
         | When there are more than 2 positional ``args``
         | **OR**
         | When the provided ``over_curve`` was an integer
+        | **OR**
+        | When ``stft_mode`` was not one of the available options
+        | **OR**
+        | When ``stft_workers`` was smaller than 1
+        | **OR**
+        | When ``decimation`` was not one of the available options
+        | **OR**
+        | When there were no frequency bins between ``fmin`` and ``fmax``
+        | **OR**
+        | When ``max_freq_bins`` was smaller than 1
+        | **OR**
+        | When ``freq_scale`` was not one of the available options
+        | **OR**
+        | When ``freq_scale="log"`` and ``fmin`` was not positive
+        | **OR**
+        | When ``color_scale`` was not one of the available options
+        | **OR**
+        | When ``db_range`` was not positive
+        | **OR**
+        | When ``raster`` was not one of the available options
+        | **OR**
+        | When ``lod_levels`` was negative
+        | **OR**
+        | When ``lod_levels`` was positive with ``raster="browser"``
+        | **OR**
+        | When ``dtype`` was not a floating point dtype
+        | **OR**
+        | When ``start`` was negative
+        | **OR**
+        | When ``end`` was not after ``start``
+        | **OR**
+        | When the segment between ``start`` and ``end`` was empty
+        | **OR**
+        | When ``mmap=True`` and the ``source`` was not a WAV file path
+        | **OR**
+        | When ``playback_dtype`` was not one of the available options
+        | **OR**
+        | When ``playback_sr`` was smaller than 1
 
     |
     """
@@ -265,10 +443,17 @@ def Audio(
 
     _validate_over_curve(over_curve)
     _validate_max_args(args)
+    _validate_raster(raster, lod_levels)
 
     theme, theme_hook = _create_theme_hook(theme)
 
-    wav, sr = _load_audio(source, sr)
+    is_playback_encoded = (playback_sr is not None) or (playback_dtype is not None)
+    encoded_audio = None
+    if not is_playback_encoded:
+        source, encoded_audio = _read_encoded_audio(source, sr, start, end, mmap)
+    wav, sr = _load_audio(source, sr, dtype, start, end, mmap)
+    if is_playback_encoded:
+        encoded_audio = encode_playback_audio(wav, sr, playback_sr, playback_dtype)
     channels = len(wav)
     total_seconds = wav.shape[-1] / sr
 
@@ -292,10 +477,11 @@ def Audio(
             over_curve_names,
             over_curve_colors,
             over_curve_axes,
+            dtype,
         )
     )
 
-    player_hv = get_player_hv(
+    player_hv, spectrogram_tiles, browser_spectrogram_params = get_player_hv(
         wav=wav,
         sr=sr,
         total_seconds=total_seconds,
@@ -316,6 +502,18 @@ def Audio(
         freq_label=freq_label,
         over_curve_axes=over_curve_axes,
         axes_limits=axes_limits,
+        stft_mode=stft_mode,
+        stft_workers=stft_workers,
+        decimation=decimation,
+        fmin=fmin,
+        fmax=fmax,
+        max_freq_bins=max_freq_bins,
+        freq_scale=freq_scale,
+        color_scale=color_scale,
+        db_range=db_range,
+        dtype=dtype,
+        lod_levels=lod_levels,
+        browser_spectrogram=raster == "browser",
     )
     player_bokeh = hv.render(player_hv)
 
@@ -328,7 +526,17 @@ def Audio(
         aspect_ratio=aspect_ratio,
         sizing_mode=sizing_mode,
         single_min_height=single_min_height,
+        freq_scale=freq_scale,
+        time_offset=start or 0.0,
+        raster=raster,
+        spectrogram_tiles=spectrogram_tiles,
     )
+    ready_args, ready_code = None, None
+    if browser_spectrogram_params is not None:
+        ready_args, ready_code = add_browser_spectrogram(
+            player_bokeh, browser_spectrogram_params
+        )
+
     player_panel = wrap_player_with_panel(
         player_bokeh,
         wav=wav,
@@ -344,6 +552,9 @@ def Audio(
         native_player=native_player,
         aspect_ratio=aspect_ratio,
         sizing_mode=sizing_mode,
+        encoded_audio=encoded_audio,
+        ready_args=ready_args,
+        ready_code=ready_code,
     )
 
     return player_panel
@@ -506,19 +717,91 @@ def _resolve_spectrogram_resolution(
     return n_fft, hop_length
 
 
+def _read_encoded_audio(
+    source: AudioSource,
+    sr: Optional[int],
+    start: Optional[float],
+    end: Optional[float],
+    mmap: bool = False,
+) -> Tuple[AudioSource, Optional[str]]:
+    """
+    | Reads the original encoded bytes of a local file source, so they are embedded in the player as is instead of the decoded audio.
+
+    | File-like objects are read once, and replaced by an in-memory copy of their
+      bytes which is then decoded for the spectrogram.
+    | Memory-mapped sources are never read as a whole, so nothing is read when
+      ``mmap=True`` .
+
+    Parameters
+    ----------
+    ``source`` : str | os.PathLike | IO | (tensorlike, int) | tensorlike
+        User provided
+    ``sr`` : int
+        User provided, the decoded audio is embedded when resampling is requested
+    ``start`` : float
+        User provided, the decoded audio is embedded when a segment is requested
+    ``end`` : float
+        User provided, the decoded audio is embedded when a segment is requested
+    ``mmap`` : bool
+        User provided, the decoded audio is embedded when the source is memory-mapped
+
+    Returns
+    -------
+    ``source`` : str | os.PathLike | IO | (tensorlike, int) | tensorlike
+        The source to decode
+    ``encoded_audio`` : str | None
+        A data URI of the encoded audio, None when the decoded audio should be embedded
+
+    |
+    """
+    if (sr is not None) or (start is not None) or (end is not None) or mmap:
+        return source, None
+
+    if isinstance(source, (str, os.PathLike)):
+        # Remote sources are not downloaded twice, they are decoded and embedded as before
+        if not os.path.isfile(source):
+            return source, None
+        with open(source, "rb") as file:
+            data = file.read()
+    elif isinstance(source, IOBase) or hasattr(source, "read"):
+        data = source.read()  # pyright: ignore[reportAttributeAccessIssue]
+        source = BytesIO(data)
+    else:
+        return source, None
+
+    return source, create_audio_data_uri(data)
+
+
 def _load_audio(
     source: AudioSource,
     sr: Optional[int],
+    dtype: Optional[torch.dtype] = torch.float32,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    mmap: bool = False,
 ) -> Tuple[torch.Tensor, int]:
     """
     | Resolves the ``source`` into a ``wav`` tensor and ``sr`` , loads and resamples using ``torchaudio`` if needed.
 
+    | When ``start`` or ``end`` are given only that segment is used, file sources
+      decode only the frames of the segment.
+    | Memory-mapped sources which the player supports as is are returned as views,
+      without converting them to the ``dtype`` , so their pages are read on demand.
+
     Parameters
     ----------
     ``source`` : str | os.PathLike | IO | (tensorlike, int) | tensorlike
         User provided
     ``sr`` : int
         User provided
+    ``dtype`` : torch.dtype
+        User provided, see :ref:`convert_audio_dtype <waloviz._tensor_utils.convert_audio_dtype>`
+    ``start`` : float
+        User provided
+    ``end`` : float
+        User provided
+    ``mmap`` : bool
+        User provided
 
     Returns
     -------
@@ -533,19 +816,25 @@ def _load_audio(
         | When no sample-rate was provided
         | **OR**
         | When the ``wav`` tensor had more than 2 non squeezable dimensions
+        | **OR**
+        | When ``dtype`` was not a floating point dtype
+        | **OR**
+        | When the segment between ``start`` and ``end`` was empty
+        | **OR**
+        | When ``mmap=True`` and the ``source`` was not a WAV file path
 
     |
     """
-    if torch.is_tensor(source) or isinstance(source, np.ndarray):
-        source = source, sr
-    if isinstance(source, IOLike):
-        source = torchaudio.load(source)
+    _validate_segment(start, end)
+
+    source, is_segment_loaded = _read_audio_source(source, sr, start, end, mmap)
 
     if not isinstance(source, tuple):
         raise ValueError("The given ``source`` type is not supported")
 
     source_sr: int
     wav, source_sr = source
+    is_memory_mapped = isinstance(wav, np.memmap)
     if sr is None:
         target_sr = source_sr
     else:
@@ -567,12 +856,267 @@ Specify the sample rate in one of the following ways:
             f"The given ``wav`` value has more than 2 dimensions: {len(wav.shape)}!=2"
         )
 
+    if not is_segment_loaded:
+        start_frame, end_frame = _calculate_segment_frames(source_sr, start, end)
+        wav = wav[:, start_frame:end_frame]
+    if wav.shape[-1] == 0:
+        raise ValueError(
+            f"The segment between ``start={start}`` and ``end={end}`` is empty"
+        )
+
     if source_sr != target_sr:
-        wav = T.Resample(source_sr, target_sr)(wav.to(torch.float32))
+        wav = resample(wav, source_sr, target_sr, dtype=dtype)
+    elif not (is_memory_mapped and wav.dtype in PLAYER_DTYPES):
+        wav = convert_audio_dtype(wav, dtype)
     sr = target_sr
     return wav, sr
 
 
+def _read_audio_source(
+    source: AudioSource,
+    sr: Optional[int],
+    start: Optional[float],
+    end: Optional[float],
+    mmap: bool,
+) -> Tuple[Any, bool]:
+    """
+    | Reads file sources, either by decoding only the segment or by memory-mapping them, and pairs tensors with the ``sr`` .
+
+    Parameters
+    ----------
+    ``source`` : str | os.PathLike | IO | (tensorlike, int) | tensorlike
+        User provided
+    ``sr`` : int
+        User provided
+    ``start`` : float
+        User provided
+    ``end`` : float
+        User provided
+    ``mmap`` : bool
+        User provided
+
+    Returns
+    -------
+    ``source`` : (tensorlike, int) | Any
+        The source paired with its sample rate when it is supported
+    ``is_segment_loaded`` : bool
+        Whether only the segment between ``start`` and ``end`` was decoded
+
+    Raises
+    ------
+    ``ValueError``
+        When ``mmap=True`` and the ``source`` was not a WAV file path
+
+    |
+    """
+    if mmap:
+        return _map_wav_file(source), False
+    if torch.is_tensor(source) or isinstance(source, np.ndarray):
+        return (source, sr), False
+    if isinstance(source, IOLike):
+        return _load_audio_file(source, start, end), True
+    return source, False
+
+
+def _validate_raster(raster: str, lod_levels: int) -> None:
+    """
+    | Validates the ``raster`` mode of the spectrogram.
+
+    Parameters
+    ----------
+    ``raster`` : str
+        User provided
+    ``lod_levels`` : int
+        User provided
+
+    Raises
+    ------
+    ``ValueError``
+        | When ``raster`` was not one of ``RASTER_MODES``
+        | **OR**
+        | When ``lod_levels`` was positive with ``raster="browser"`` , which already
+          computes the visible range in full detail
+
+    |
+    """
+    if raster not in RASTER_MODES:
+        raise ValueError(
+            f"``raster`` must be one of the available options: {RASTER_MODES}, but was {raster}"
+        )
+    if (raster == "browser") and (lod_levels > 0):
+        raise ValueError(
+            f"``lod_levels`` must be 0 with ``raster='browser'`` , but was {lod_levels}"
+        )
+
+
+def _validate_segment(start: Optional[float], end: Optional[float]) -> None:
+    """
+    | Validates the ``start`` and ``end`` of the loaded segment.
+
+    Parameters
+    ----------
+    ``start`` : float
+        User provided
+    ``end`` : float
+        User provided
+
+    Raises
+    ------
+    ``ValueError``
+        | When ``start`` was negative
+        | **OR**
+        | When ``end`` was not after ``start``
+
+    |
+    """
+    if (start is not None) and (start < 0):
+        raise ValueError(f"``start`` must not be negative, but was {start}")
+    if (end is not None) and (end <= (start or 0)):
+        raise ValueError(
+            f"``end`` must be after ``start``, but was {end} <= {start or 0}"
+        )
+
+
+def _calculate_segment_frames(
+    sr: int, start: Optional[float], end: Optional[float]
+) -> Tuple[int, Optional[int]]:
+    """
+    | Converts the ``start`` and ``end`` of a segment from seconds to frames.
+
+    Parameters
+    ----------
+    ``sr`` : int
+        The sample rate of the source
+    ``start`` : float
+        The start of the segment in seconds, None for the beginning
+    ``end`` : float
+        The end of the segment in seconds, None for the end of the source
+
+    Returns
+    -------
+    ``start_frame`` : int
+        The first frame of the segment
+    ``end_frame`` : int | None
+        The frame after the last frame of the segment, None for the end of the source
+
+    |
+    """
+    start_frame = 0 if start is None else round(start * sr)
+    end_frame = None if end is None else round(end * sr)
+    return start_frame, end_frame
+
+
+def _map_wav_file(source: AudioSource) -> Tuple[np.ndarray, int]:
+    """
+    | Memory-maps a WAV file with ``scipy`` , its samples are read from the disk only when they are accessed.
+
+    Parameters
+    ----------
+    ``source`` : str | os.PathLike
+        User provided
+
+    Returns
+    -------
+    ``wav`` : np.ndarray
+        A view of the samples, of shape ``(channels, samples)`` , backed by a ``np.memmap``
+    ``sr`` : int
+        The sample rate of the file
+
+    Raises
+    ------
+    ``ValueError``
+        When the ``source`` was not a file path
+
+    |
+    """
+    if not isinstance(source, (str, os.PathLike)):
+        raise ValueError("``mmap=True`` requires the ``source`` to be a WAV file path")
+
+    source_sr, wav = wavfile.read(source, mmap=True)
+    return wav.T, source_sr
+
+
+def _load_audio_file(
+    source: IOLike, start: Optional[float], end: Optional[float]
+) -> Tuple[torch.Tensor, int]:
+    """
+    | Decodes only the frames between ``start`` and ``end`` of an audio file.
+
+    | The segment is read with ``soundfile`` , which seeks to its first frame, and
+      formats which ``libsndfile`` cannot decode are read with ``torchaudio`` .
+
+    Parameters
+    ----------
+    ``source`` : str | os.PathLike | IO
+        User provided
+    ``start`` : float
+        User provided
+    ``end`` : float
+        User provided
+
+    Returns
+    -------
+    ``wav`` : torch.Tensor
+        The decoded segment
+    ``sr`` : int
+        The sample rate of the file
+
+    |
+    """
+    # A path or a binary file object, both are read by ``torchaudio``
+    file = cast(FileLike, source)
+    if (start is None) and (end is None):
+        return torchaudio.load(file)
+
+    position = 0
+    if not isinstance(file, (str, os.PathLike)):
+        position = file.tell()
+    try:
+        with soundfile.SoundFile(file) as sound_file:
+            source_sr = sound_file.samplerate
+            start_frame, end_frame = _calculate_segment_frames(source_sr, start, end)
+            start_frame = min(start_frame, sound_file.frames)
+            num_frames = -1 if end_frame is None else max(end_frame - start_frame, 0)
+            sound_file.seek(start_frame)
+            wav = sound_file.read(num_frames, dtype="float32", always_2d=True)
+        return torch.from_numpy(np.ascontiguousarray(wav.T)), source_sr
+    except soundfile.LibsndfileError:
+        if not isinstance(file, (str, os.PathLike)):
+            file.seek(position)
+
+    source_sr = _get_audio_file_sample_rate(file)
+    start_frame, end_frame = _calculate_segment_frames(source_sr, start, end)
+    num_frames = -1 if end_frame is None else end_frame - start_frame
+    return torchaudio.load(file, frame_offset=start_frame, num_frames=num_frames)
+
+
+def _get_audio_file_sample_rate(source: FileLike) -> int:
+    """
+    | Reads the sample rate of an audio file with ``torchaudio`` , decoding at most a single frame.
+
+    | File-like objects are rewound to their previous position afterwards.
+
+    Parameters
+    ----------
+    ``source`` : str | os.PathLike | BinaryIO
+        User provided
+
+    Returns
+    -------
+    ``sr`` : int
+        The sample rate of the file
+
+    |
+    """
+    if isinstance(source, (str, os.PathLike)):
+        return torchaudio.load(source, num_frames=1)[1]
+
+    position = source.tell()
+    source_sr = torchaudio.load(source, num_frames=1)[1]
+    source.seek(position)
+    return source_sr
+
+
 def _create_theme_hook(
     theme: Union[str, Dict[str, Any]],
 ) -> Tuple[Dict[str, Any], ThemeHook]:
@@ -752,6 +1296,11 @@ def save(
     title: Optional[str] = None,
     resources: Resources = INLINE,
     embed: bool = True,
+    data: str = "inline",
+    compress: bool = False,
+    resources_dir: Optional[Union[str, os.PathLike]] = None,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
     **kwargs: Any,
 ) -> IOLike:
     """
@@ -780,6 +1329,28 @@ def save(
         The resources for the ``panel`` save method, default is INLINE
     ``embed`` : bool
         The embed value for the ``panel`` save method, default is True
+    ``data`` : str
+        | "inline" embeds the spectrogram, curves and audio in the html file, default
+        | "external" writes them into data files in a "{out_file stem}_files" directory
+          next to the html file, which is fetched after the page loads, and can be
+          cached by the browser. The page must then be served over HTTP, since
+          browsers do not fetch local files
+    ``compress`` : bool
+        | Whether to compress the html file, which the browser decompresses when it
+          opens it, the html file remains self-contained, default is False
+        | The inline resources become roughly 3 times smaller, the spectrogram and
+          audio as much as they compress, and the page takes a little longer to open.
+          Requires a browser which supports ``DecompressionStream``
+    ``resources_dir`` : str | os.PathLike
+        | A directory for the Bokeh and ``panel`` resources, for exporting many players.
+        | Instead of carrying its own copy of the inline resources, the html file
+          loads them from this directory by a relative path, and all the html files
+          saved with the same ``resources_dir`` share them. They still work offline,
+          as long as the directory is kept in the same place relative to them
+    ``start`` : float
+        The start of the saved segment in seconds, see ``wv.Audio``
+    ``end`` : float
+        The end of the saved segment in seconds, see ``wv.Audio``
 
     Returns
     -------
@@ -789,7 +1360,15 @@ def save(
     Raises
     ------
     ``ValueError``
-        When called with more than 2 positional ``args``
+        | When called with more than 2 positional ``args``
+        | **OR**
+        | When ``start`` or ``end`` were given with an already created player
+        | **OR**
+        | When ``data`` is not "inline" or "external"
+        | **OR**
+        | When ``data`` is "external" and ``out_file`` is not a file path
+        | **OR**
+        | When ``resources_dir`` is given and ``out_file`` is not a file path
 
     |
     """
@@ -801,9 +1380,22 @@ def save(
         ):
             raise ValueError("The provided ``source`` type is not supported")
 
-        source = Audio(source, *args, **kwargs)
+        source = Audio(source, *args, start=start, end=end, **kwargs)
+    elif (start is not None) or (end is not None):
+        raise ValueError(
+            "``start`` and ``end`` can not be applied to an already created player, pass them to ``wv.Audio`` instead"
+        )
 
-    return save_player_panel(source, out_file, title, resources, embed)  # pyright: ignore[reportArgumentType]
+    return save_player_panel(
+        source,  # pyright: ignore[reportArgumentType]
+        out_file,
+        title,
+        resources,
+        embed,
+        data,
+        compress,
+        resources_dir,
+    )
 
 
 def _resolve_out_file(
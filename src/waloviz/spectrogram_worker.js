@@ -0,0 +1,241 @@
+let channels = [];
+let params = null;
+let frame_power = null;
+
+function create_radix2_fft(size) {
+    const levels = Math.round(Math.log2(size));
+    const reverse = new Uint32Array(size);
+    for (let i = 0; i < size; i++) {
+        let reversed = 0;
+        for (let bit = 0; bit < levels; bit++) {
+            reversed |= ((i >> bit) & 1) << (levels - 1 - bit);
+        }
+        reverse[i] = reversed;
+    }
+    const cos = new Float64Array(size / 2);
+    const sin = new Float64Array(size / 2);
+    for (let i = 0; i < size / 2; i++) {
+        cos[i] = Math.cos(2 * Math.PI * i / size);
+        sin[i] = -Math.sin(2 * Math.PI * i / size);
+    }
+    return (re, im) => {
+        for (let i = 0; i < size; i++) {
+            const j = reverse[i];
+            if (j > i) {
+                [re[i], re[j]] = [re[j], re[i]];
+                [im[i], im[j]] = [im[j], im[i]];
+            }
+        }
+        for (let half = 1; half < size; half *= 2) {
+            const stride = size / (2 * half);
+            for (let start = 0; start < size; start += 2 * half) {
+                for (let k = 0; k < half; k++) {
+                    const c = cos[k * stride];
+                    const s = sin[k * stride];
+                    const a = start + k;
+                    const b = a + half;
+                    const b_re = re[b] * c - im[b] * s;
+                    const b_im = re[b] * s + im[b] * c;
+                    re[b] = re[a] - b_re;
+                    im[b] = im[a] - b_im;
+                    re[a] += b_re;
+                    im[a] += b_im;
+                }
+            }
+        }
+    };
+}
+
+function create_fft(size) {
+    if ((size & (size - 1)) === 0) {
+        return create_radix2_fft(size);
+    }
+    // Bluestein's algorithm, a convolution with a chirp through a larger power of 2 FFT
+    let padded = 1;
+    while (padded < 2 * size - 1) {
+        padded *= 2;
+    }
+    const fft = create_radix2_fft(padded);
+    const chirp_re = new Float64Array(size);
+    const chirp_im = new Float64Array(size);
+    for (let k = 0; k < size; k++) {
+        const angle = Math.PI * ((k * k) % (2 * size)) / size;
+        chirp_re[k] = Math.cos(angle);
+        chirp_im[k] = -Math.sin(angle);
+    }
+    const kernel_re = new Float64Array(padded);
+    const kernel_im = new Float64Array(padded);
+    for (let k = 0; k < size; k++) {
+        kernel_re[k] = chirp_re[k];
+        kernel_im[k] = -chirp_im[k];
+        if (k > 0) {
+            kernel_re[padded - k] = chirp_re[k];
+            kernel_im[padded - k] = -chirp_im[k];
+        }
+    }
+    fft(kernel_re, kernel_im);
+    const work_re = new Float64Array(padded);
+    const work_im = new Float64Array(padded);
+    return (re, im) => {
+        work_re.fill(0);
+        work_im.fill(0);
+        for (let k = 0; k < size; k++) {
+            work_re[k] = re[k] * chirp_re[k] - im[k] * chirp_im[k];
+            work_im[k] = re[k] * chirp_im[k] + im[k] * chirp_re[k];
+        }
+        fft(work_re, work_im);
+        // The inverse FFT is the conjugate of the FFT of the conjugate
+        for (let k = 0; k < padded; k++) {
+            const product_re = work_re[k] * kernel_re[k] - work_im[k] * kernel_im[k];
+            const product_im = work_re[k] * kernel_im[k] + work_im[k] * kernel_re[k];
+            work_re[k] = product_re;
+            work_im[k] = -product_im;
+        }
+        fft(work_re, work_im);
+        for (let k = 0; k < size; k++) {
+            const conv_re = work_re[k] / padded;
+            const conv_im = -work_im[k] / padded;
+            re[k] = conv_re * chirp_re[k] - conv_im * chirp_im[k];
+            im[k] = conv_re * chirp_im[k] + conv_im * chirp_re[k];
+        }
+    };
+}
+
+function create_frame_power(n_fft) {
+    const fft = create_fft(n_fft);
+    // A periodic Hann window, as in torch.hann_window
+    const window = new Float64Array(n_fft);
+    for (let i = 0; i < n_fft; i++) {
+        window[i] = 0.5 - 0.5 * Math.cos(2 * Math.PI * i / n_fft);
+    }
+    const re = new Float64Array(n_fft);
+    const im = new Float64Array(n_fft);
+    const half = Math.floor(n_fft / 2);
+    return (channel, center, power) => {
+        const length = channel.length;
+        for (let i = 0; i < n_fft; i++) {
+            // A centered frame, reflected at the edges like the torchaudio spectrogram
+            let index = center - half + i;
+            if (index < 0) {
+                index = -index;
+            }
+            if (index >= length) {
+                index = 2 * (length - 1) - index;
+            }
+            re[i] = ((index >= 0) && (index < length)) ? channel[index] * window[i] : 0;
+            im[i] = 0;
+        }
+        fft(re, im);
+        for (let k = 0; k < power.length; k++) {
+            power[k] = re[k] * re[k] + im[k] * im[k];
+        }
+    };
+}
+
+function create_frequency_rows() {
+    const bins = Math.floor(params.n_fft / 2) + 1;
+    const is_max = params.decimation === "max";
+    if (params.freq_warp != null) {
+        const {indptr, indices, weights} = params.freq_warp;
+        return [indptr.length - 1, (power, row) => {
+            let value = 0;
+            for (let i = indptr[row]; i < indptr[row + 1]; i++) {
+                value += weights[i] * power[indices[i]];
+            }
+            return value;
+        }];
+    }
+    const [start_bin, end_bin, freq_step] = params.freq_bins ?? [0, bins, 1];
+    return [Math.ceil((end_bin - start_bin) / freq_step), (power, row) => {
+        const first = start_bin + row * freq_step;
+        const last = Math.min(first + freq_step, end_bin);
+        let value = is_max ? -Infinity : 0;
+        for (let i = first; i < last; i++) {
+            value = is_max ? Math.max(value, power[i]) : value + power[i];
+        }
+        return is_max ? value : value / (last - first);
+    }];
+}
+
+function compute(start, end, db_max) {
+    const {hop_length, max_size, decimation, samples} = params;
+    const frames = 1 + Math.floor(samples / hop_length);
+    let first = Math.max(Math.floor(start / hop_length), 0);
+    const last = Math.min(Math.ceil(end / hop_length), frames - 1);
+    const count = last - first + 1;
+    const step = (count > max_size) ? Math.floor(count / max_size) + 1 : 1;
+    // Aligned to the step, so that panning keeps the same frames
+    first -= first % step;
+    const columns = Math.ceil((last - first + 1) / step);
+
+    const [rows, frequency_row] = create_frequency_rows();
+    const power = new Float64Array(Math.floor(params.n_fft / 2) + 1);
+    const images = [];
+    for (const channel of channels) {
+        const image = new Float32Array(rows * columns);
+        for (let column = 0; column < columns; column++) {
+            const frame_start = first + column * step;
+            const frame_end = (decimation === "skip") ? frame_start + 1 : Math.min(frame_start + step, frames);
+            for (let frame = frame_start; frame < frame_end; frame++) {
+                frame_power(channel, frame * hop_length, power);
+                for (let row = 0; row < rows; row++) {
+                    const value = frequency_row(power, row);
+                    const index = row * columns + column;
+                    if (frame === frame_start) {
+                        image[index] = value;
+                    } else if (decimation === "max") {
+                        image[index] = Math.max(image[index], value);
+                    } else {
+                        image[index] += value;
+                    }
+                }
+            }
+            if (decimation === "mean") {
+                for (let row = 0; row < rows; row++) {
+                    image[row * columns + column] /= frame_end - frame_start;
+                }
+            }
+        }
+        images.push(image);
+    }
+
+    // Scaled like ``get_player_hv`` , with the decibel maximum of the overview when given
+    let low = Infinity;
+    let high = -Infinity;
+    if (params.color_scale === "db") {
+        for (const image of images) {
+            for (let i = 0; i < image.length; i++) {
+                image[i] = 10 * Math.log10(Math.max(image[i], 1e-10));
+                high = Math.max(high, image[i]);
+            }
+        }
+        high = db_max ?? high;
+        low = high - params.db_range;
+        for (const image of images) {
+            for (let i = 0; i < image.length; i++) {
+                image[i] = Math.max(image[i], low);
+            }
+        }
+    } else {
+        for (const image of images) {
+            for (let i = 0; i < image.length; i++) {
+                image[i] += 1e-5;
+                low = Math.min(low, image[i]);
+                high = Math.max(high, image[i]);
+            }
+        }
+    }
+    return {first, step, rows, columns, images, low, high};
+}
+
+self.onmessage = (event) => {
+    const message = event.data;
+    if (message.type === "init") {
+        channels = message.channels;
+        params = message.params;
+        frame_power = create_frame_power(params.n_fft);
+    } else {
+        const result = compute(message.start, message.end, message.db_max);
+        self.postMessage({id: message.id, ...result}, result.images.map((image) => image.buffer));
+    }
+};
@@ -0,0 +1,335 @@
+"""Tests for the Bokeh utilities."""
+
+from typing import Any, Dict, List
+
+import pytest
+
+
+def test_png_raster_matches_color_mapper(waloviz: Any) -> None:
+    """The PNG spectrogram should have the colors which the color mapper maps its values to."""
+    import zlib
+
+    import numpy as np
+    from bokeh.models import LinearColorMapper
+
+    bokeh_manipulation = waloviz._bokeh_manipulation
+    palette = ["#000000", "#ff0000", "#00ff00", "#0000ff80"]
+    color_mapper = LinearColorMapper(palette=palette, low=0.0, high=4.0)
+    values = np.array([[-1.0, 0.5, 1.5], [2.5, 3.9, 9.0]], dtype=np.float32)
+
+    indices = bokeh_manipulation.map_colors(values, color_mapper)
+    assert indices.tolist() == [[0, 0, 1], [2, 3, 3]]
+
+    rgba = [bokeh_manipulation.color_to_rgba(color) for color in palette]
+    png = bokeh_manipulation.encode_indexed_png(indices, rgba)
+    assert png.startswith(b"\x89PNG\r\n\x1a\n")
+    assert b"tRNS" in png
+    idat = png.index(b"IDAT")
+    size = int.from_bytes(png[idat - 4 : idat], "big")
+    rows = zlib.decompress(png[idat + 4 : idat + 4 + size])
+    assert rows == bytes([0, 0, 0, 1, 0, 2, 3, 3])
+
+
+def test_uint8_quantization_keeps_colors(waloviz: Any) -> None:
+    """The uint8 levels should be mapped into the same colors as the float image, while the colorbar keeps the original mapper."""
+    import numpy as np
+    from bokeh.models import ColumnDataSource, GlyphRenderer, Image, LogColorMapper
+
+    bokeh_manipulation = waloviz._bokeh_manipulation
+    color_mapper = LogColorMapper(palette=[f"#0000{i:02x}" for i in range(256)])
+    color_mapper.update(low=1e-3, high=1e3)
+    values = np.exp(np.random.uniform(-8, 8, size=(64, 32))).astype(np.float32)
+    renderer = GlyphRenderer(
+        data_source=ColumnDataSource(
+            data=dict(image=[values], x=[0], y=[0], dw=[1], dh=[1])
+        ),
+        glyph=Image(color_mapper=color_mapper),
+    )
+
+    bokeh_manipulation.quantize_spectrogram(renderer, np.uint8)
+
+    data_source, glyph = renderer.data_source, renderer.glyph
+    assert isinstance(data_source, ColumnDataSource)
+    assert isinstance(glyph, Image)
+    levels = data_source.data["image"][0]
+    assert levels.dtype == np.uint8
+    assert glyph.color_mapper is not color_mapper
+    np.testing.assert_array_equal(
+        bokeh_manipulation.map_colors(levels, glyph.color_mapper),
+        bokeh_manipulation.map_colors(values, color_mapper),
+    )
+
+
+def test_db_color_scale_uses_linear_clim(waloviz: Any) -> None:
+    """With ``color_scale="db"`` the image should be in decibels, within the bounds of a linear color mapper."""
+    import numpy as np
+    import torch
+    from bokeh.document import Document
+    from bokeh.models import GlyphRenderer, Image, LinearColorMapper
+
+    waloviz.extension()
+    player = waloviz.Audio(
+        (torch.randn(1, 16000), 16000),
+        color_scale="db",
+        db_range=60.0,
+        download_button=False,
+    )
+    doc = Document()
+    root = player.get_root(doc)
+    # The overview spectrogram, the other images are small placeholders
+    renderer = max(
+        (
+            renderer
+            for renderer in root.select({"type": GlyphRenderer})
+            if isinstance(renderer.glyph, Image)
+        ),
+        key=lambda renderer: np.size(renderer.data_source.data["image"][0]),
+    )
+    color_mapper = renderer.glyph.color_mapper
+    image = np.asarray(renderer.data_source.data["image"][0])
+    assert isinstance(color_mapper, LinearColorMapper)
+    low, high = color_mapper.low, color_mapper.high
+    assert isinstance(low, float) and isinstance(high, float)
+    assert high - low == 60.0
+    assert np.isclose(image.max(), high)
+    assert image.min() >= low
+
+
+def test_browser_raster_embeds_no_spectrogram(waloviz: Any) -> None:
+    """With ``raster="browser"`` only a placeholder is embedded, and the sparse frequency warp should equal the dense one."""
+    import torch
+    from bokeh.document import Document
+
+    waloviz.extension()
+    spectrogram_utils = waloviz._spectrogram_utils
+    wav = torch.randn(2, 16000)
+    player = waloviz.Audio(
+        (wav, 16000), raster="browser", freq_scale="mel", download_button=False
+    )
+
+    audio = player[1]
+    doc = Document()
+    audio._get_model(doc)
+    (callback,) = doc.callbacks._js_event_callbacks["document_ready"]
+    assert all(
+        overview.data_source.data["image"][0].shape == (1, 1)
+        for overview in callback.args["overviews"]
+    )
+
+    params = callback.args["params"]
+    n_bins, fmin, fmax = spectrogram_utils.resolve_warped_frequency_grid(
+        "mel", 16000, params["n_fft"], None, None, None
+    )
+    freq_warp = spectrogram_utils.create_frequency_warp(
+        "mel", 16000, params["n_fft"], n_bins, fmin, fmax
+    )
+    warp = params["freq_warp"]
+    dense = torch.zeros_like(freq_warp)
+    for row, (start, end) in enumerate(zip(warp["indptr"][:-1], warp["indptr"][1:])):
+        dense[row, warp["indices"][start:end]] = torch.tensor(
+            warp["weights"][start:end], dtype=dense.dtype
+        )
+    assert torch.equal(dense, freq_warp)
+
+
+def test_player_callbacks_do_not_grow_with_channels(waloviz: Any) -> None:
+    """All the plots should share the same few callbacks, for any amount of channels."""
+    import torch
+    from bokeh.document import Document
+    from bokeh.models import CustomJS
+
+    waloviz.extension()
+
+    def count_callbacks(channels: int) -> int:
+        player = waloviz.Audio(
+            (torch.randn(channels, 16000), 16000), download_button=False
+        )
+        doc = Document()
+        doc.add_root(player.get_root(doc))
+        return len([model for model in doc.models if isinstance(model, CustomJS)])
+
+    assert count_callbacks(1) == count_callbacks(4)
+
+
+@pytest.mark.parametrize("n_fft", [256, 200])
+def test_spectrogram_worker_matches_compute_spectrogram(
+    waloviz: Any, n_fft: int
+) -> None:
+    """The spectrogram of the browser worker should match ``compute_spectrogram`` , with a power of two ``n_fft`` and without."""
+    import json
+    import shutil
+    import subprocess
+
+    import torch
+
+    node = shutil.which("node")
+    if node is None:
+        pytest.skip("node is not installed")
+
+    wav = torch.randn(2, 3001, generator=torch.Generator().manual_seed(0))
+    params = waloviz._holoviews_manipulations.create_browser_spectrogram_params(
+        samples=wav.shape[-1],
+        sr=8000,
+        n_fft=n_fft,
+        hop_length=64,
+        max_size=1000,
+        decimation="skip",
+        freq_bins=None,
+        freq_warp=None,
+        color_scale="log",
+        db_range=80.0,
+    )
+    script = """
+    const {worker_source, channels, params} = JSON.parse(require("fs").readFileSync(0, "utf-8"));
+    const scope = {postMessage: (message) => {
+        message.images = message.images.map((image) => Array.from(image));
+        process.stdout.write(JSON.stringify(message));
+    }};
+    new Function("self", worker_source)(scope);
+    scope.onmessage({data: {type: "init", channels: channels.map((channel) => Float32Array.from(channel)), params}});
+    scope.onmessage({data: {type: "compute", id: 0, start: 0, end: params.samples}});
+    """
+    result = json.loads(
+        subprocess.run(
+            [node, "-e", script],
+            input=json.dumps(
+                dict(
+                    worker_source=waloviz._bokeh_manipulation.SPECTROGRAM_WORKER_JS,
+                    channels=wav.tolist(),
+                    params=params,
+                )
+            ),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+    )
+
+    spec = waloviz._spectrogram_utils.compute_spectrogram(
+        wav, n_fft=n_fft, hop_length=64, max_size=1000
+    )
+    assert (result["first"], result["step"]) == (0, 1)
+    assert (result["rows"], result["columns"]) == tuple(spec.shape[1:])
+    images = torch.tensor(result["images"]).reshape(spec.shape)
+    torch.testing.assert_close(images, spec + 1e-5, rtol=1e-4, atol=1e-4)
+
+
+def old_player_event_actions(is_pbar: bool) -> Dict[str, List[str]]:
+    """List the actions which the per-plot callbacks used to run for each event, in the order they were registered."""
+    event_actions: Dict[str, List[str]] = {}
+
+    def on(events: List[str], *actions: str) -> None:
+        for e in events:
+            event_actions.setdefault(e, []).extend(actions)
+
+    on(["doubletap"], "start_follow", "move_time")
+    on(["reset"], "reset")
+    on(
+        ["panstart", "panend", "pinchstart", "pinchend", "wheel"]
+        + ["press", "pressup", "tap", "doubletap"],
+        "set_y_range",
+        "set_pbar_x_range",
+    )
+    on(
+        ["panstart", "pan", "pinchstart", "pinch", "panend", "wheel"]
+        + ["press", "pressup", "rangesupdate"],
+        "keep_y_range",
+        "keep_dump_range",
+        "keep_x_range",
+    )
+    on(["pan", "pinch", "rangesupdate", "wheel"], "stop_follow")
+    if not is_pbar:
+        on(["tap", "pressup", "doubletap"], "play_pause")
+    if is_pbar:
+        on(
+            ["pinch", "pinchstart", "pinchend", "pan", "panstart", "panend"]
+            + ["press", "pressup", "tap"],
+            "move_pbar",
+            "stop_follow",
+        )
+    on(
+        ["pinch", "pinchstart", "pinchend", "panstart", "pan", "panend", "wheel"]
+        + ["press", "pressup", "rangesupdate"],
+        "record_ranges",
+    )
+    return event_actions
+
+
+@pytest.mark.parametrize("is_pbar", [False, True])
+def test_player_event_actions_match_per_plot_callbacks(
+    waloviz: Any, is_pbar: bool
+) -> None:
+    """Each event should run the same actions, in the same order, as the per-plot callbacks did."""
+    event_actions = waloviz._bokeh_manipulation.get_player_event_actions(is_pbar)
+
+    assert event_actions == old_player_event_actions(is_pbar)
+    assert ("play_pause" in event_actions["tap"]) != is_pbar
+    assert ("move_pbar" in event_actions["pan"]) == is_pbar
+
+
+def test_player_callbacks_are_attached(waloviz: Any) -> None:
+    """The player callback, cursor, play icons and tile swap callbacks should be attached to the models the per-plot callbacks were."""
+    import torch
+    from bokeh.document import Document
+    from bokeh.models import CustomJS
+
+    bokeh_manipulation = waloviz._bokeh_manipulation
+    waloviz.extension()
+    player = waloviz.Audio(
+        (torch.randn(2, 16000 * 20), 16000),
+        max_size=200,
+        lod_levels=1,
+        download_button=False,
+    )
+    doc = Document()
+    doc.add_root(player.get_root(doc))
+    callbacks: List[Any] = [
+        model for model in doc.models if isinstance(model, CustomJS)
+    ]
+
+    (player_callback,) = [
+        callback
+        for callback in callbacks
+        if callback.code == bokeh_manipulation.PLAYER_CALLBACK_JS
+    ]
+    plots = player_callback.args["plots"]
+    vspans = player_callback.args["vspans"]
+    glyphs = player_callback.args["glyphs"]
+    assert len(plots) == len(vspans) == len(glyphs) == 3
+    for plot in plots:
+        events = {
+            e
+            for e, event_callbacks in plot.js_event_callbacks.items()
+            if player_callback in event_callbacks
+        }
+        assert events == set(old_player_event_actions(is_pbar=plot is plots[-1]))
+
+    # The cursors of all the channels follow the zeroth vspan
+    for attr in ["right", "line_color"]:
+        (cursor_callback,) = [
+            callback
+            for callback in vspans[0].js_property_callbacks[f"change:{attr}"]
+            if "vlines" in callback.args
+        ]
+        assert cursor_callback.args["vspans"] == vspans
+        assert len(cursor_callback.args["vlines"]) == len(plots)
+
+    # The play icons of all the spectrograms follow the zeroth glyph
+    (play_icons_callback,) = [
+        callback
+        for callback in glyphs[0].js_property_callbacks["change:visible"]
+        if "glyphs" in callback.args
+    ]
+    assert play_icons_callback.args["glyphs"] == glyphs[:-1]
+
+    # Each spectrogram swaps its own tiles when its x range changes
+    for plot in plots[:-1]:
+        for attr in ["start", "end"]:
+            swap_callbacks = [
+                callback
+                for callback in plot.x_range.js_property_callbacks[f"change:{attr}"]
+                if "stores" in callback.args
+            ]
+            assert any(
+                callback.args["detail"] in plot.renderers for callback in swap_callbacks
+            )
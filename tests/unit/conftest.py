@@ -0,0 +1,17 @@
+"""Pytest conftest for the unit tests."""
+
+from typing import Any
+
+import pytest
+
+
+@pytest.fixture
+def waloviz() -> Any:
+    """Import waloviz by injecting the ``src`` folder into the sys path."""
+    import sys
+
+    sys.path.append("/workspaces/waloviz/src")
+    sys.path.append("/home/runner/work/waloviz/waloviz/src")
+    import waloviz as wv
+
+    return wv
@@ -0,0 +1,93 @@
+"""Tests for loading the audio source."""
+
+from typing import Any, Optional
+
+import pytest
+import torch
+
+
+@pytest.mark.parametrize(
+    "start, end, expected_slice",
+    [
+        (None, None, slice(None)),
+        (1.0, None, slice(16000, None)),
+        (0.5, 2.0, slice(8000, 32000)),
+    ],
+)
+def test_load_audio_segment(
+    waloviz: Any, start: Optional[float], end: Optional[float], expected_slice: slice
+) -> None:
+    """Only the segment between ``start`` and ``end`` should be loaded."""
+    wav = torch.randn(2, 16000 * 3)
+    loaded, sr = waloviz._user_functions._load_audio(
+        (wav, 16000), None, None, start, end
+    )
+    assert sr == 16000
+    assert torch.equal(loaded, wav[:, expected_slice])
+
+
+@pytest.mark.parametrize("start, end", [(-1.0, None), (2.0, 1.0), (5.0, None)])
+def test_invalid_segment(waloviz: Any, start: float, end: Optional[float]) -> None:
+    """Negative, reversed or empty segments should raise."""
+    with pytest.raises(ValueError):
+        waloviz._user_functions._load_audio(
+            (torch.randn(2, 16000 * 3), 16000), None, None, start, end
+        )
+
+
+def test_memory_mapped_file_is_not_read(waloviz: Any, tmp_path: Any) -> None:
+    """With ``mmap=True`` the encoded file should not be read into memory, only a local file without it."""
+    import numpy as np
+    from scipy.io import wavfile
+
+    path = str(tmp_path / "audio.wav")
+    wavfile.write(path, 16000, np.zeros((16000, 2), dtype=np.int16))
+    read_encoded_audio = waloviz._user_functions._read_encoded_audio
+    assert read_encoded_audio(path, None, None, None, mmap=True) == (path, None)
+    source, encoded_audio = read_encoded_audio(path, None, None, None)
+    assert source == path
+    assert encoded_audio is not None
+
+
+def test_load_audio_file_segment(waloviz: Any, tmp_path: Any) -> None:
+    """Only the frames of the segment should be decoded from a file, and the time axis should be labeled from ``start`` ."""
+    import numpy as np
+    from bokeh.document import Document
+    from bokeh.models import CustomJSTickFormatter
+    from scipy.io import wavfile
+
+    path = str(tmp_path / "audio.wav")
+    samples = np.random.uniform(-0.5, 0.5, size=(16000 * 3, 2)).astype(np.float32)
+    wavfile.write(path, 16000, samples)
+    loaded, sr = waloviz._user_functions._load_audio(path, None, None, 0.5, 2.0)
+    assert sr == 16000
+    assert torch.equal(loaded, torch.from_numpy(samples[8000:32000].T))
+
+    waloviz.extension()
+    player = waloviz.Audio(path, start=0.5, end=2.0, download_button=False)
+    formatters = player.get_root(Document()).select({"type": CustomJSTickFormatter})
+    assert any("(tick + 0.5)" in formatter.code for formatter in formatters)
+
+
+def test_memory_mapped_callable_over_curve(waloviz: Any, tmp_path: Any) -> None:
+    """A callable over curve of a memory-mapped file should be called with the whole converted audio."""
+    import numpy as np
+    from scipy.io import wavfile
+
+    path = str(tmp_path / "audio.wav")
+    samples = np.random.randint(-(2**15), 2**15, size=(16000, 2), dtype=np.int16)
+    wavfile.write(path, 16000, samples)
+    calls = []
+
+    def over_curve(wav: torch.Tensor, sr: int) -> torch.Tensor:
+        calls.append((wav, sr))
+        return wav.abs().mean(dim=0)
+
+    waloviz.extension()
+    waloviz.Audio(path, mmap=True, over_curve=over_curve, download_button=False)
+
+    ((wav, sr),) = calls
+    assert sr == 16000
+    assert wav.dtype == torch.float32
+    assert not isinstance(wav.numpy().base, np.memmap)
+    assert torch.equal(wav, torch.from_numpy(samples.T.astype(np.float32) / 2**15))
@@ -0,0 +1,272 @@
+"""Tests for the panel utilities."""
+
+from typing import Any, Dict, List
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "data, mime_type",
+    [
+        (b"RIFF\x00\x00\x00\x00WAVEfmt ", "audio/wav"),
+        (b"ID3\x04\x00", "audio/mpeg"),
+        (b"OggS\x00\x02", "audio/ogg"),
+        (b"fLaC\x00\x00", "audio/flac"),
+        (b"not audio", None),
+    ],
+)
+def test_audio_data_uri(waloviz: Any, data: bytes, mime_type: Any) -> None:
+    """Encoded audio should be embedded with the MIME type of its format."""
+    data_uri = waloviz._panel_manipulation.create_audio_data_uri(data)
+    if mime_type is None:
+        assert data_uri is None
+    else:
+        assert data_uri.startswith(f"data:{mime_type};base64,")
+
+
+@pytest.mark.parametrize("with_widget", [False, True])
+def test_streamed_html_matches_panel_save(waloviz: Any, with_widget: bool) -> None:
+    """The streamed html should be the same page as the ``panel`` save method, up to the generated ids, also when widget states are embedded."""
+    import re
+    from io import BytesIO, StringIO
+
+    import panel as pn
+    import torch
+    from bokeh.resources import INLINE
+
+    waloviz.extension()
+    wav = torch.randn(2, 8000)
+
+    def create_player() -> Any:
+        player = waloviz.Audio((wav, 8000), download_button=False)
+        if with_widget:
+            return pn.Column(player, pn.widgets.Checkbox(name="c"))
+        return player
+
+    expected = StringIO()
+    pn.panel(create_player()).save(expected, resources=INLINE, embed=True, title="t")
+    streamed = BytesIO()
+    waloviz._panel_manipulation.write_player_html(create_player(), streamed, "t")
+
+    def normalize_ids(html: str) -> str:
+        # Model ids, document ids, Panel names and the Python ids in link tags
+        # differ between two renders, they are numbered by their first appearance
+        ids: Dict[str, str] = {}
+        pattern = (
+            r"\bp\d+\b|(?<=\"name\":\")[A-Za-z]+\d{5}(?=\")|(?<=\[\[)\d{9,}(?=,)"
+            r"|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+        )
+        return re.sub(
+            pattern, lambda match: ids.setdefault(match[0], f"id{len(ids)}"), html
+        )
+
+    assert normalize_ids(expected.getvalue()) == normalize_ids(
+        streamed.getvalue().decode("utf-8")
+    )
+
+
+def test_external_data_files(waloviz: Any, tmp_path: Any) -> None:
+    """The external data mode should write the data files next to the html, and reference them by URL."""
+    import torch
+
+    waloviz.extension()
+    out_file = tmp_path / "player.html"
+    waloviz.save((torch.randn(2, 8000), 8000), out_file, data="external")
+
+    html = out_file.read_text(encoding="utf-8")
+    data_files = sorted(path.name for path in (tmp_path / "player_files").iterdir())
+    assert any(name.endswith(".wav") for name in data_files)
+    assert any(name.endswith(".bin") for name in data_files)
+    for name in data_files:
+        assert f"player_files/{name}" in html
+    assert "data:audio/" not in html
+    assert waloviz._panel_manipulation.LOAD_DATA_CALL in html
+
+    with pytest.raises(ValueError):
+        waloviz.save((torch.randn(1, 8000), 8000), out_file, data="sidecar")
+
+
+def test_stored_data_requires_embed_items_call(
+    waloviz: Any, tmp_path: Any, monkeypatch: Any
+) -> None:
+    """Saving stored data should fail when the rendered page does not contain the call which is replaced to load it."""
+    import torch
+
+    waloviz.extension()
+    monkeypatch.setattr(
+        waloviz._panel_manipulation, "EMBED_ITEMS_CALL", "embed_items(missing);"
+    )
+    with pytest.raises(ValueError):
+        waloviz.save(
+            (torch.randn(1, 8000), 8000), tmp_path / "player.html", data="external"
+        )
+    with pytest.raises(ValueError):
+        waloviz.save(
+            (torch.randn(1, 8000), 8000), tmp_path / "player.html", compress=True
+        )
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_loaded_docs_are_unescaped(waloviz: Any, tmp_path: Any, compress: bool) -> None:
+    """The page should parse the HTML escaped document JSON into the original code of the callbacks."""
+    import json
+    import re
+    import shutil
+    import subprocess
+    import zlib
+    from base64 import b64decode
+
+    import torch
+
+    node = shutil.which("node")
+    if node is None:
+        pytest.skip("node is not installed")
+
+    waloviz.extension()
+    out_file = tmp_path / "player.html"
+    waloviz.save(
+        (torch.randn(2, 8000), 8000), out_file, data="external", compress=compress
+    )
+    html = out_file.read_text(encoding="utf-8")
+    match = re.search(
+        r'<script type="[^"]*"(?: data-type="application/json")? id="[^"]*">(.*?)</script>',
+        html,
+        re.S,
+    )
+    assert match is not None
+    docs_json = match.group(1).strip()
+    if compress:
+        docs_json = zlib.decompress(b64decode(docs_json)).decode("utf-8")
+    assert "&lt;" in docs_json
+
+    # The external data is not fetched, only the parsed documents are checked
+    script = f"""
+const docs_json = {json.dumps(docs_json)};
+const render_items = [];
+const fetch = async () => new Response(new ArrayBuffer(0));
+const root = {{Bokeh: {{embed: {{embed_items: (docs) => console.log(JSON.stringify(docs))}}}}}};
+{waloviz._panel_manipulation.LOAD_DATA_CALL}
+"""
+    result = subprocess.run(
+        [node, "-"], input=script, capture_output=True, text=True, check=True
+    )
+
+    def find_codes(obj: Any) -> List[str]:
+        if isinstance(obj, list):
+            return [code for item in obj for code in find_codes(item)]
+        if not isinstance(obj, dict):
+            return []
+        codes = [code for value in obj.values() for code in find_codes(value)]
+        if obj.get("name") == "CustomJS":
+            codes.append(obj["attributes"]["code"])
+        return codes
+
+    codes = find_codes(json.loads(result.stdout))
+    assert len(codes) > 0
+    for code in codes:
+        assert ("&lt;" not in code) and ("&amp;" not in code)
+
+
+def test_compressed_html(waloviz: Any) -> None:
+    """The compressed html should contain the deflated scripts and document JSON, and a script which decompresses them."""
+    import json
+    import re
+    import shutil
+    import subprocess
+    import zlib
+    from base64 import b64decode
+    from io import BytesIO
+
+    import torch
+
+    waloviz.extension()
+    out_file = BytesIO()
+    waloviz.save((torch.randn(2, 8000), 8000), out_file, compress=True)
+
+    html = out_file.getvalue().decode("utf-8")
+    compressed = re.findall(
+        r'<script type="application/x-waloviz-deflate" data-type="([^"]*)"[^>]*>(.*?)</script>',
+        html,
+        re.S,
+    )
+    scripts = [
+        (data_type, zlib.decompress(b64decode(content)).decode("utf-8"))
+        for data_type, content in compressed
+    ]
+    assert {data_type for data_type, _ in scripts} == {
+        "text/javascript",
+        "application/json",
+    }
+    node = shutil.which("node")
+    for data_type, script in scripts:
+        if data_type == "application/json":
+            assert json.loads(script)
+        elif node is not None:
+            subprocess.run([node, "--check", "-"], input=script, text=True, check=True)
+    assert any("embed_items" in script for _, script in scripts)
+    assert any(
+        waloviz._panel_manipulation.LOAD_DATA_CALL in script for _, script in scripts
+    )
+    assert html.count('<script type="text/javascript">') == 1
+    assert "DecompressionStream" in html
+
+
+def test_shared_resources_dir(waloviz: Any, tmp_path: Any) -> None:
+    """Pages saved with the same ``resources_dir`` should share the resource files, and refer to them by relative paths."""
+    import torch
+
+    waloviz.extension()
+    resources_dir = tmp_path / "resources"
+    (tmp_path / "nested").mkdir()
+    pages = [tmp_path / "first.html", tmp_path / "nested" / "second.html"]
+    for page in pages:
+        waloviz.save((torch.randn(1, 8000), 8000), page, resources_dir=resources_dir)
+
+    scripts = sorted(path.name for path in resources_dir.iterdir())
+    assert len(scripts) > 0
+    assert all(name.endswith(".js") for name in scripts)
+    for page, prefix in zip(pages, ["resources", "../resources"]):
+        html = page.read_text(encoding="utf-8")
+        for name in scripts:
+            assert f'src="{prefix}/{name}"' in html
+
+
+def test_concurrent_saves_share_resources_dir(waloviz: Any, tmp_path: Any) -> None:
+    """Pages saved concurrently into the same ``resources_dir`` should each contain the document of their own player."""
+    import json
+    import re
+    from concurrent.futures import ThreadPoolExecutor
+    from html import unescape
+
+    import torch
+
+    waloviz.extension()
+    resources_dir = tmp_path / "resources"
+    durations = list(range(1, 9))
+
+    def save_page(seconds: int) -> str:
+        page = tmp_path / f"page_{seconds}.html"
+        waloviz.save(
+            (torch.randn(1, 8000 * seconds), 8000), page, resources_dir=resources_dir
+        )
+        return page.read_text(encoding="utf-8")
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        pages = list(executor.map(save_page, durations))
+
+    scripts = sorted(path.name for path in resources_dir.iterdir())
+    assert all(name.endswith(".js") for name in scripts)
+    for seconds, html in zip(durations, pages):
+        docs_jsons = re.findall(
+            r'<script type="application/json" id="[^"]*">(.*?)</script>', html, re.S
+        )
+        assert len(docs_jsons) == 1
+        docs_json = json.dumps(json.loads(unescape(docs_jsons[0].strip())))
+        assert f"tick > {float(seconds)}" in docs_json
+        assert all(
+            f"tick > {float(other)}" not in docs_json
+            for other in durations
+            if other != seconds
+        )
+        for name in scripts:
+            assert f'src="resources/{name}"' in html
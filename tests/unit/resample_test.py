@@ -0,0 +1,33 @@
+"""Tests for the resampling utilities."""
+
+from typing import Any
+
+import pytest
+import torch
+import torchaudio.transforms as T
+
+
+@pytest.mark.parametrize(
+    "source_sr, target_sr", [(44100, 16000), (48000, 16000), (16000, 44100)]
+)
+@pytest.mark.parametrize("chunk_size", [1, 1000, 10**6])
+def test_chunked_resample_matches_torchaudio(
+    waloviz: Any, source_sr: int, target_sr: int, chunk_size: int
+) -> None:
+    """Resampling in chunks should match resampling the whole signal at once."""
+    wav = torch.randn(2, 123457)
+    expected = T.Resample(source_sr, target_sr)(wav)
+    resampled = waloviz._resample_utils.resample(wav, source_sr, target_sr, chunk_size)
+    assert expected.shape == resampled.shape
+    assert torch.allclose(expected, resampled, atol=1e-4)
+
+
+def test_resampler_is_cached(waloviz: Any) -> None:
+    """The kernel should be computed once per pair of sample rates and dtype."""
+    create_resampler = waloviz._resample_utils.create_resampler
+    assert create_resampler(44100, 16000, torch.float32) is create_resampler(
+        44100, 16000, torch.float32
+    )
+    assert create_resampler(44100, 16000, torch.float32) is not create_resampler(
+        44100, 16000, torch.float64
+    )
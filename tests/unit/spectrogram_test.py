@@ -0,0 +1,211 @@
+"""Tests for the spectrogram computation strategies."""
+
+import math
+from typing import Any, Optional
+
+import pytest
+import torch
+
+
+@pytest.mark.parametrize("stft_mode", ["budget", "streaming"])
+@pytest.mark.parametrize("samples", [8000, 8001, 123457])
+@pytest.mark.parametrize("hop_length", [100, 600])
+def test_stft_mode_matches_full_stft(
+    waloviz: Any, stft_mode: str, samples: int, hop_length: int
+) -> None:
+    """Every ``stft_mode`` should compute exactly the frames that "full" mode keeps."""
+    compute_spectrogram = waloviz._spectrogram_utils.compute_spectrogram
+    wav = torch.randn(2, samples)
+    full = compute_spectrogram(wav, 800, hop_length, 50, "full")
+    spec = compute_spectrogram(wav, 800, hop_length, 50, stft_mode, chunk_frames=7)
+    assert full.shape == spec.shape
+    assert torch.allclose(full, spec)
+
+
+@pytest.mark.parametrize("chunk_frames", [1, 8])
+def test_single_frame_edge_chunks_match_full_stft(
+    waloviz: Any, chunk_frames: int
+) -> None:
+    """A chunk of a single frame at either edge should be padded from the whole audio."""
+    compute_spectrogram = waloviz._spectrogram_utils.compute_spectrogram
+    wav = torch.randn(1, 8000)
+    full = compute_spectrogram(wav, 800, 1000, 10000, "full")
+    spec = compute_spectrogram(
+        wav, 800, 1000, 10000, "streaming", chunk_frames=chunk_frames
+    )
+    assert full.shape == spec.shape
+    assert torch.allclose(full, spec)
+
+
+@pytest.mark.parametrize("stft_mode", ["budget", "full", "streaming"])
+def test_parallel_stft_matches_full_stft(waloviz: Any, stft_mode: str) -> None:
+    """Splitting the spectrogram between workers should not change it."""
+    compute_spectrogram = waloviz._spectrogram_utils.compute_spectrogram
+    wav = torch.randn(2, 123457)
+    full = compute_spectrogram(wav, 800, 100, 500, "full")
+    spec = compute_spectrogram(wav, 800, 100, 500, stft_mode, stft_workers=3)
+    assert full.shape == spec.shape
+    assert torch.allclose(full, spec)
+
+
+def test_parallel_stft_with_single_frame_edge_chunk(waloviz: Any) -> None:
+    """An even split which leaves a single frame to the last worker should not change the spectrogram."""
+    compute_spectrogram = waloviz._spectrogram_utils.compute_spectrogram
+    wav = torch.randn(1, 8000)
+    full = compute_spectrogram(wav, 800, 100, 10000, "full")
+    spec = compute_spectrogram(wav, 800, 100, 10000, "budget", stft_workers=17)
+    assert full.shape == spec.shape
+    assert torch.allclose(full, spec)
+
+
+@pytest.mark.parametrize("stft_mode", ["budget", "streaming"])
+@pytest.mark.parametrize("decimation", ["max", "mean"])
+@pytest.mark.parametrize("stft_workers", [None, 3])
+def test_pooled_stft_matches_full_stft(
+    waloviz: Any, stft_mode: str, decimation: str, stft_workers: Optional[int]
+) -> None:
+    """Pooling chunk by chunk should match pooling the full spectrogram."""
+    compute_spectrogram = waloviz._spectrogram_utils.compute_spectrogram
+    wav = torch.randn(2, 123457)
+    kwargs = dict(decimation=decimation, chunk_frames=50, stft_workers=stft_workers)
+    full = compute_spectrogram(wav, 800, 100, 70, "full", decimation=decimation)
+    spec = compute_spectrogram(wav, 800, 100, 70, stft_mode, **kwargs)
+    assert full.shape == spec.shape
+    assert torch.allclose(full, spec)
+
+
+def test_max_decimation_keeps_transients(waloviz: Any) -> None:
+    """A single click should survive "max" decimation but not "skip" decimation."""
+    skip_to_size = waloviz._tensor_utils.skip_to_size
+    curve = torch.zeros(2, 10001)
+    curve[:, 4321] = 1.0
+    assert skip_to_size(curve, 100, "skip").max() == 0.0
+    assert skip_to_size(curve, 100, "max").max() == 1.0
+    assert skip_to_size(curve, 100, "max").shape == skip_to_size(curve, 100).shape
+
+
+def test_power_to_db_clips_in_place(waloviz: Any) -> None:
+    """Decibels should be clipped to ``db_range`` below the maximum, in place, with the bounds returned."""
+    power_to_db = waloviz._spectrogram_utils.power_to_db
+    power = torch.tensor([[1e-12, 1e-6, 1e-2, 10.0]])
+    spec, db_min, db_max = power_to_db(power, 60.0)
+    assert spec.data_ptr() == power.data_ptr()
+    assert (db_min, db_max) == (-50.0, 10.0)
+    assert torch.allclose(spec, torch.tensor([[-50.0, -50.0, -20.0, 10.0]]))
+
+    spec, db_min, db_max = power_to_db(torch.tensor([[1e-6, 1.0]]), 30.0, db_max=5.0)
+    assert (db_min, db_max) == (-25.0, 5.0)
+    assert torch.allclose(spec, torch.tensor([[-25.0, 0.0]]))
+
+    with pytest.raises(ValueError):
+        power_to_db(torch.ones(1, 1), 0.0)
+
+
+@pytest.mark.parametrize("stft_mode", ["budget", "streaming"])
+@pytest.mark.parametrize("decimation", ["skip", "max"])
+def test_frequency_bins_match_full_stft(
+    waloviz: Any, stft_mode: str, decimation: str
+) -> None:
+    """Cropping and pooling the frequency bins per chunk should match the full spectrogram."""
+    spectrogram_utils = waloviz._spectrogram_utils
+    freq_bins = spectrogram_utils.calculate_frequency_bins(8000, 800, 300, 3000, 64)
+    start_bin, end_bin, freq_step = freq_bins
+    assert (start_bin, end_bin, freq_step) == (30, 301, 5)
+
+    wav = torch.randn(2, 123457)
+    kwargs = dict(decimation=decimation, freq_bins=freq_bins, chunk_frames=50)
+    full = spectrogram_utils.compute_spectrogram(wav, 800, 100, 70, "full", **kwargs)
+    spec = spectrogram_utils.compute_spectrogram(wav, 800, 100, 70, stft_mode, **kwargs)
+    assert full.shape[:-1] == (2, 55)
+    assert full.shape == spec.shape
+    assert torch.allclose(full, spec)
+
+
+@pytest.mark.parametrize("n_fft", [800, 801])
+def test_uncropped_frequency_range_is_unchanged(waloviz: Any, n_fft: int) -> None:
+    """Without cropping or pooling, the frequency bounds should not depend on ``freq_bins`` ."""
+    calculate_range = waloviz._holoviews_manipulations.calculate_frequency_range_of_torchaudio_spectrogram
+    freq_bins = waloviz._spectrogram_utils.calculate_frequency_bins(16000, n_fft)
+    assert calculate_range(16000, n_fft, freq_bins) == calculate_range(16000, n_fft)
+    assert calculate_range(16000, n_fft)[1] == (1 + 1 / n_fft) * 16000 / 2
+
+
+@pytest.mark.parametrize("freq_scale", ["log", "mel"])
+def test_frequency_warp_is_cached_and_normalized(waloviz: Any, freq_scale: str) -> None:
+    """Every warped bin should average some linear bins, and the matrix should be reused."""
+    create_frequency_warp = waloviz._spectrogram_utils.create_frequency_warp
+    freq_warp = create_frequency_warp(freq_scale, 16000, 1600, 128, 10.0, 8000.0)
+    assert freq_warp.shape == (128, 801)
+    assert torch.allclose(freq_warp.sum(dim=-1), torch.ones(128, dtype=freq_warp.dtype))
+    assert (
+        create_frequency_warp(freq_scale, 16000, 1600, 128, 10.0, 8000.0) is freq_warp
+    )
+
+
+def test_zero_hz_on_log_frequency_scale(waloviz: Any) -> None:
+    """0 Hz curve values should break the line, and a 0 Hz limit should be the bottom of the axis."""
+    f0 = torch.tensor([0.0, 100.0, 0.0, 200.0])
+    over_curve, axes_limits = waloviz._holoviews_manipulations.scale_frequency_axis(
+        [f0], ["Hz"], {"Hz": (0, 8000)}, "log", 3.5
+    )
+    assert torch.isnan(over_curve[0][[0, 2]]).all()
+    assert torch.allclose(over_curve[0][[1, 3]], torch.log2(f0[[1, 3]]))
+    assert axes_limits["Hz"] == (3.5, pytest.approx(math.log2(8000)))
+
+    waloviz.extension()
+    waloviz.Audio(
+        (torch.randn(1, 16000), 16000),
+        over_curve={"f0": f0},
+        over_curve_axes="Hz",
+        axes_limits={"Hz": (0, 8000)},
+        freq_scale="log",
+        download_button=False,
+    )
+
+
+def test_integer_pcm_is_converted_in_chunks(waloviz: Any) -> None:
+    """Integer PCM, e.g. from a memory-mapped WAV, should give the spectrogram of the converted audio."""
+    compute_spectrogram = waloviz._spectrogram_utils.compute_spectrogram
+    wav = (torch.randn(2, 123457) * 3000).to(torch.int16)
+    converted = waloviz._tensor_utils.convert_audio_dtype(wav, torch.float32)
+    full = compute_spectrogram(converted, 800, 100, 500, "full")
+    spec = compute_spectrogram(wav, 800, 100, 500, "full", dtype=torch.float32)
+    assert spec.dtype == torch.float32
+    assert torch.allclose(full, spec)
+
+
+def test_integer_pcm_with_single_frame_last_chunk(waloviz: Any) -> None:
+    """Integer PCM always goes through the chunks, including when its last chunk holds a single frame."""
+    spectrogram_utils = waloviz._spectrogram_utils
+    chunk_frames = spectrogram_utils.STREAMING_CHUNK_FRAMES
+    wav = (torch.randn(1, chunk_frames * 100) * 3000).to(torch.int16)
+    assert (
+        spectrogram_utils.calculate_frame_count(wav.shape[-1], 100) % chunk_frames == 1
+    )
+    converted = waloviz._tensor_utils.convert_audio_dtype(wav, torch.float32)
+    full = spectrogram_utils.compute_spectrogram(converted, 800, 100, 10**6, "full")
+    spec = spectrogram_utils.compute_spectrogram(
+        wav, 800, 100, 10**6, "full", dtype=torch.float32
+    )
+    assert torch.allclose(full, spec)
+
+
+def test_spectrogram_tiles_split_until_full_resolution(waloviz: Any) -> None:
+    """Each level should halve the tiles of the one above it, and stop once a tile is no longer decimated."""
+    compute_spectrogram = waloviz._spectrogram_utils.compute_spectrogram
+    wav = torch.randn(2, 80001)
+    levels = waloviz._spectrogram_utils.compute_spectrogram_tiles(
+        wav, 800, 100, 250, 10
+    )
+    assert [len(level) for level in levels] == [2, 4]
+    full = compute_spectrogram(wav, 800, 100, 10**6, "full")
+    for level in levels:
+        assert level[0][0] == 0
+        assert level[-1][1] == full.shape[-1]
+        assert all(prev[1] == tile[0] for prev, tile in zip(level, level[1:]))
+        assert all(spec.shape[-1] <= 250 for _, _, spec in level)
+    for start_frame, end_frame, spec in levels[-1]:
+        assert torch.allclose(spec, full[..., start_frame:end_frame], atol=1e-4)
+    start_frame, end_frame, spec = levels[0][1]
+    step = waloviz._tensor_utils.calculate_skip_step(end_frame - start_frame, 250)
+    assert torch.allclose(spec, full[..., start_frame:end_frame:step], atol=1e-4)
@@ -0,0 +1,85 @@
+"""Tests for the tensor utilities."""
+
+from typing import Any
+
+import numpy as np
+import pytest
+import torch
+
+
+@pytest.mark.parametrize("source_dtype", [torch.uint8, torch.int16, torch.int32])
+@pytest.mark.parametrize("dtype", [torch.float32, torch.float64, None])
+def test_integer_audio_is_normalized(
+    waloviz: Any, source_dtype: torch.dtype, dtype: Any
+) -> None:
+    """Integer PCM audio should be scaled into ``[-1, 1)`` with the requested dtype."""
+    convert_audio_dtype = waloviz._tensor_utils.convert_audio_dtype
+    info = torch.iinfo(source_dtype)
+    wav = torch.tensor([info.min, info.max], dtype=source_dtype)
+    converted = convert_audio_dtype(wav, dtype)
+    assert converted.dtype == (torch.get_default_dtype() if dtype is None else dtype)
+    assert converted[0] == -1.0
+    assert 0.99 < converted[1] <= 1.0
+
+
+def test_float_audio_dtype(waloviz: Any) -> None:
+    """Floating point audio should be cast to the dtype, or kept as is for None."""
+    convert_audio_dtype = waloviz._tensor_utils.convert_audio_dtype
+    wav = torch.randn(2, 100, dtype=torch.float64)
+    assert convert_audio_dtype(wav, torch.float32).dtype == torch.float32
+    assert convert_audio_dtype(wav, None) is wav
+    with pytest.raises(ValueError):
+        convert_audio_dtype(wav, torch.int16)
+
+
+def test_numpy_source_is_not_copied(waloviz: Any) -> None:
+    """Loading float32 NumPy audio and single channel curves should not allocate their size again."""
+    from torch.profiler import ProfilerActivity, profile
+
+    wav = np.random.randn(2, 1_000_000).astype(np.float32)
+    curve = np.random.randn(1_000_000).astype(np.float32)
+    with profile(activities=[ProfilerActivity.CPU], profile_memory=True) as prof:
+        loaded, sr = waloviz._user_functions._load_audio((wav, 16000), None)
+        over_curve, *_ = waloviz._tensor_utils.preprocess_over_curve(
+            loaded, sr, len(loaded), curve
+        )
+    allocated = sum(
+        max(event.self_cpu_memory_usage, 0) for event in prof.key_averages()
+    )
+    assert allocated < 0.01 * wav.nbytes
+    assert np.shares_memory(loaded.numpy(), wav)
+    assert over_curve[0].shape == (2, 1_000_000)
+    assert np.shares_memory(over_curve[0].numpy(), curve)
+
+
+@pytest.mark.parametrize("dtype", [torch.int16, torch.uint8])
+def test_quantize_audio_round_trip(waloviz: Any, dtype: torch.dtype) -> None:
+    """Quantized audio should clip to the PCM range and convert back within one step."""
+    wav = torch.tensor([-2.0, -1.0, -0.25, 0.0, 0.5, 1.0, 2.0])
+    quantized = waloviz._tensor_utils.quantize_audio(wav, dtype)
+    assert quantized.dtype == dtype
+    restored = waloviz._tensor_utils.convert_audio_dtype(quantized, torch.float32)
+    step = 1 / 128 if dtype == torch.uint8 else 1 / 32768
+    assert torch.allclose(restored, wav.clamp(-1, 1 - step), atol=step)
+
+
+def test_time_values_are_float64(waloviz: Any) -> None:
+    """The time values of curves should stay distinct for hours long audio, while the curve values are float32."""
+    total_seconds = 6 * 60 * 60.0
+    size = 200_000
+    sub_x, sub_y = waloviz._holoviews_manipulations.attach_time_axis(
+        torch.zeros(1, size, dtype=torch.float32), total_seconds
+    )
+    assert sub_x.dtype == torch.float64
+    assert sub_y.dtype == torch.float32
+    # In float32 the last step would be off by about 2%
+    last_step = (sub_x[0, -1] - sub_x[0, -2]).item()
+    assert last_step == pytest.approx(total_seconds / (size - 1), rel=1e-6)
+
+    times = torch.linspace(0, total_seconds, 100, dtype=torch.float64)
+    over_curve, *_ = waloviz._tensor_utils.preprocess_over_curve(
+        torch.zeros(1, 16000), 16000, 1, (times, torch.zeros(100, dtype=torch.float64))
+    )
+    (curve_x, curve_y), *_ = over_curve
+    assert curve_x.dtype == torch.float64
+    assert curve_y.dtype == torch.float32